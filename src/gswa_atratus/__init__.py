@@ -16,9 +16,17 @@ from gswa_atratus.database import (
     connect,
     create_from_dataframe,
     insert,
+    profile_select,
     select,
+    select_iter,
+    select_many,
+    select_partitioned,
+    select_partitioned_iter,
+    select_shared,
+    sqlite_bulk_load,
     write_db_metadata_table,
 )
+from gswa_atratus.utils.cache import QueryCache
 from gswa_atratus.utils.exceptions import (
     CodeError,
     KnownException,
@@ -31,10 +39,18 @@ __all__ = [
     "connect",
     "create_from_dataframe",
     "insert",
+    "profile_select",
     "select",
+    "select_iter",
+    "select_many",
+    "select_partitioned",
+    "select_partitioned_iter",
+    "select_shared",
+    "sqlite_bulk_load",
     "write_db_metadata_table",
     "CodeError",
     "KnownException",
+    "QueryCache",
     "use_gdt_logging",
     "load_statement",
 ]
@@ -0,0 +1,159 @@
+"""Asyncio flavour of the gswa-atratus database API.
+
+Description:
+    Mirrors :func:`gswa_atratus.connect`, :func:`gswa_atratus.select`,
+    :func:`gswa_atratus.insert` and :func:`gswa_atratus.load_statement` on top of
+    SQLAlchemy's ``AsyncEngine``, so that queries against several databases can overlap
+    within one event loop.
+
+    The config file format is unchanged, but ``sqlalchemy.url`` must name an async driver,
+    e.g. ``sqlite+aiosqlite:///local.db`` or ``mssql+aioodbc://...``.
+
+    This module is not imported by ``import gswa_atratus``, as it needs the ``aio`` extra
+    (``pip install gswa_atratus[aio]``). Import it with ``import gswa_atratus.aio``.
+
+Example:
+    async def pull(cfg_a, cfg_b):
+        (engine_a, meta_a), (engine_b, meta_b) = await asyncio.gather(
+            gdt.aio.connect_async(cfg_a), gdt.aio.connect_async(cfg_b)
+        )
+        stmt_a = await gdt.aio.load_statement_async(cfg_a, engine_a, meta_a)
+        stmt_b = await gdt.aio.load_statement_async(cfg_b, engine_b, meta_b)
+        return await asyncio.gather(
+            gdt.aio.select_async(engine_a, stmt_a), gdt.aio.select_async(engine_b, stmt_b)
+        )
+"""
+
+from pathlib import Path
+from typing import Literal
+
+import pandas as pd
+import sqlalchemy as sqla
+from sqlalchemy.ext.asyncio import AsyncEngine, async_engine_from_config
+from sqlalchemy.sql.expression import Selectable
+
+import gswa_atratus as gdt
+from gswa_atratus.database import _apply_mnemonics, fetch_frame, read_sqla_config
+from gswa_atratus.utils.bulk import InsertStats, Strategy, write_frame
+from gswa_atratus.utils.reflection import ReflectionCache, ReflectionMode
+from gswa_atratus.utils.statements import build_statement, read_statement_config
+
+
+async def connect_async(
+    cfg_path: str | Path, local_db_path: str | Path | None = None
+) -> tuple[AsyncEngine, sqla.MetaData]:
+    """Connect to an async engine from a config file.
+
+    Args:
+        cfg_path (str | Path): Path to the JSON config file.
+        local_db_path (str | Path | None, optional): Overwrite the `sqlalchemy.url` in config
+            with the provided local file path, opened with aiosqlite. Defaults to None.
+
+    Returns:
+        tuple[AsyncEngine, sqla.MetaData]: SQLAlchemy AsyncEngine and MetaData objects.
+
+    Raises:
+        FileNotFoundError: If the config file does not exist.
+        gdt.KnownException: If the config file is malformed.
+    """
+    sqla_cfg = read_sqla_config(cfg_path, local_db_path, driver="sqlite+aiosqlite")
+    try:
+        engine = async_engine_from_config(configuration=sqla_cfg)
+    except (sqla.exc.ArgumentError, sqla.exc.InvalidRequestError) as exc:
+        raise gdt.KnownException(
+            f"Malformed config file: While parsing {sqla_cfg}."
+            " The sqlalchemy.url must use an async driver.",
+        ) from exc
+    return (engine, sqla.MetaData())
+
+
+async def select_async(
+    engine: AsyncEngine,
+    statement: Selectable | str,
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+    params: dict | None = None,
+) -> pd.DataFrame:
+    """Execute a SELECT statement against an async engine, returning a DataFrame.
+
+    Args:
+        engine (AsyncEngine): Async database connection engine.
+        statement (Selectable | str): A SQLAlchemy statement or raw SQL text to execute.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers.
+            Defaults to None.
+        columnar (bool, optional): Use the columnar fetch path of :func:`gswa_atratus.select`.
+            Defaults to False.
+        params (dict | None, optional): Values for the statement's bind parameters.
+            Defaults to None.
+
+    Returns:
+        pd.DataFrame: Results of the SELECT query with optionally renamed columns.
+    """
+    async with engine.begin() as conn:
+        df = await conn.run_sync(fetch_frame, statement, columnar, params)
+    _apply_mnemonics(df, mnemonics)
+    return df
+
+
+async def insert_async(
+    engine: AsyncEngine,
+    table_name: str,
+    dataframe: pd.DataFrame,
+    if_exists: Literal["replace", "fail", "append"] = "replace",
+    strategy: Strategy = "auto",
+    chunksize: int | None = None,
+) -> InsertStats:
+    """Execute an INSERT statement against an async engine.
+
+    Args:
+        engine (AsyncEngine): Async database connection engine.
+        table_name (str): Name of the target table for insertion.
+        dataframe (pd.DataFrame): DataFrame to insert into the table.
+        if_exists (Literal["replace", "fail", "append"], optional): Behavior if table
+            already exists. Defaults to "replace".
+        strategy (Strategy, optional): Bulk-load strategy, see :func:`gswa_atratus.insert`.
+            Defaults to "auto".
+        chunksize (int | None, optional): Rows per batch. Defaults to a size tuned for
+            the strategy.
+
+    Returns:
+        InsertStats: Rows written, elapsed time, rows/sec and the strategy used.
+    """
+    async with engine.begin() as conn:
+        return await conn.run_sync(
+            write_frame, table_name, dataframe, if_exists, strategy, chunksize
+        )
+
+
+async def load_statement_async(
+    cfg_path: Path | str,
+    engine: AsyncEngine,
+    metadata: sqla.MetaData,
+    reflection_cache: ReflectionCache | None = None,
+    reflection: ReflectionMode = "serial",
+) -> sqla.Select:
+    """Load and build a SQLAlchemy Select statement, reflecting tables asynchronously.
+
+    Args:
+        cfg_path (Path | str): Path to the JSON config file, which must include
+            "statement_configs", "selection", and "joins" sections.
+        engine (AsyncEngine): A configured async SQLAlchemy Engine.
+        metadata (sqlalchemy.MetaData): A configured SQLAlchemy MetaData instance.
+        reflection_cache (ReflectionCache | None, optional): On-disk cache of reflected
+            tables. Defaults to None.
+        reflection (ReflectionMode, optional): "serial" or "batch" reflection of the
+            configured tables. "concurrent" runs as "batch" on the single async
+            connection. Defaults to "serial".
+
+    Returns:
+        sqlalchemy.Select: The constructed SQLAlchemy select statement.
+
+    Raises:
+        gdt.KnownException: If the config file is malformed, or tables and columns are
+            missing from the database.
+    """
+    stmt_cfg = read_statement_config(cfg_path)
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            build_statement, metadata, stmt_cfg, reflection_cache, reflection
+        )
@@ -1,10 +1,87 @@
 """Cygnet processing module (Chain of Responsibility pattern implementation)."""
 
+import itertools
+import json
 import logging
-from collections import OrderedDict
-from typing import Any, Optional
+import multiprocessing
+import os
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Literal, Optional
+
+import pandas as pd
+import sqlalchemy as sqla
 
 import gswa_atratus as gdt
+from gswa_atratus.utils.cache import MISSING, StepCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StepMetrics:
+    """Timings and sizes of one Step handling one input.
+
+    Times are in seconds. ``cpu_seconds`` is CPU time of the thread running the Step.
+    ``peak_memory_bytes`` is the peak of memory traced while the Step ran, above the
+    memory traced when it started, and is only measured with
+    ``Process(..., trace_memory=True)``; it also counts memory allocated by branches
+    running at the same time. Rows and bytes are None where the input or output has no
+    cheap measure, bytes being the shallow size of arrays and DataFrames, or the size of
+    a file path. A StreamStep's chunks are produced lazily, so the time to transform them
+    is counted by the Step consuming the stream.
+    """
+
+    step: str
+    cached: bool = False
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    canhandle_seconds: float = 0.0
+    run_seconds: float = 0.0
+    save_seconds: float = 0.0
+    peak_memory_bytes: int | None = None
+    input_rows: int | None = None
+    input_bytes: int | None = None
+    output_rows: int | None = None
+    output_bytes: int | None = None
+
+
+def _measure(value: Any) -> tuple[int | None, int | None]:
+    """Rows and bytes of a Step input or output, where cheap to measure."""
+    if isinstance(value, pd.DataFrame):
+        return len(value), int(value.memory_usage(index=True).sum())
+    if isinstance(value, Path):
+        try:
+            return None, value.stat().st_size
+        except OSError:
+            return None, None
+    if isinstance(value, (bytes, bytearray, str)):
+        return None, len(value)
+    if hasattr(value, "nbytes") and hasattr(value, "shape"):  # numpy arrays and Series
+        return (value.shape[0] if value.shape else None), int(value.nbytes)
+    if isinstance(value, (list, tuple, dict, set)):
+        return len(value), None
+    return None, None
+
+
+# Step attributes set by the framework or while running, left out of cache_params.
+_STEP_STATE_ATTRS = frozenset(
+    {"save", "cacheable", "depends_on", "input_", "output", "logger", "metrics", "chunk"}
+)
 
 
 class Step:
@@ -28,16 +105,44 @@ class Step:
       We may want to perform actions at each step (catalogue errors, save outputs, etc.).
       This feature is still under development.
 
+    - **Caching outputs (optional).**
+      When the Process has a ``step_cache``, outputs are stored on disk and reused while
+      the Step's identity is unchanged: its class, ``version``, ``cache_params()`` (by
+      default the Step's constructor parameters, i.e. its public attributes) and the
+      ``global_cfg`` values named in ``cache_cfg_keys``. Bump ``version`` when ``run()``
+      changes. Set ``cacheable = False`` for Steps whose output should never be reused.
+      Steps created with ``save=True`` are not cacheable, and a Process never skips them
+      by resuming from a cached Step after them, so their side effects always run.
+
+    - **Metrics.**
+      Each call to ``handle()`` records a :class:`StepMetrics` in ``self.metrics``, which
+      the Process collects in ``Process.step_metrics``.
+
+    - **Depending on several Steps (optional).**
+      By default a Step takes the output of the Step added before it. Name other Steps in
+      ``depends_on`` to run as a branch of a DAG instead, see ``Process.start()``.
+
     .. note::
        This module modifies the Chain of Responsibility behavioural pattern.
     """
 
-    def __init__(self, name: str, save: bool = False):
+    version: str = "1"
+    cacheable: bool = True
+    cache_cfg_keys: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        name: str,
+        save: bool = False,
+        depends_on: str | Iterable[str] | None = None,
+    ):
         """Initialise the stage with a name, and configure saving.
 
         Args:
             name : An identifier for the step.
             save : Whether or not to execute the steps save behaviour if implemented.
+            depends_on : Names of the Steps whose outputs this Step takes as input. An
+                empty list takes the Process input. Defaults to the Step added before it.
 
         Attributes:
             step_success: Defaults to False, overwritten by run method.
@@ -46,13 +151,19 @@ class Step:
         """
         self.name = name
         self.save = save
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        self.depends_on = None if depends_on is None else list(depends_on)
+        if save:
+            # Saving is a side effect, which a cached output would skip.
+            self.cacheable = False
         self.input_ = None
         self.output = None
 
     def addLogger(self, logger: logging.Logger = None):
         self.logger = logger.getChild(self.__class__.__name__)
 
-    def handle(self, input_, global_cfg):
+    def handle(self, input_, global_cfg, cache: StepCache | None = None, cache_key=None):
         """Handle the input, with validation and error checking.
 
         This function performs 3 tasks.
@@ -63,16 +174,91 @@ class Step:
         Args:
             input_ : Any valid input to the Steps processing code.
             global_cfg : dictionary provided by parent process.
+            cache : Optional StepCache. A cached output under ``cache_key`` is returned
+                without running the Step, and a new output is stored under it.
+            cache_key : Key of this Step's output for this input, see
+                ``Process.cache_keys()``.
         """
-        if self.canhandle(input_, global_cfg):
+        self.metrics = metrics = StepMetrics(self.name)
+        metrics.input_rows, metrics.input_bytes = _measure(input_)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            traced_at_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            output = self._handle(input_, global_cfg, cache, cache_key)
+        finally:
+            metrics.wall_seconds = time.perf_counter() - wall
+            metrics.cpu_seconds = time.thread_time() - cpu
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                metrics.peak_memory_bytes = max(0, peak - traced_at_start)
+        metrics.output_rows, metrics.output_bytes = _measure(output)
+        return output
+
+    def _timed(self, phase: str, func: Callable, *args) -> Any:
+        """Call func, adding its duration to ``self.metrics.<phase>_seconds``."""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            attr = f"{phase}_seconds"
+            elapsed = time.perf_counter() - start
+            setattr(self.metrics, attr, getattr(self.metrics, attr) + elapsed)
+
+    def _handle(self, input_, global_cfg, cache, cache_key):
+        use_cache = cache is not None and cache_key is not None and self.cacheable
+        if use_cache:
+            cached = cache.get(cache_key)
+            if cached is not MISSING:
+                self.input_ = input_
+                self.output = cached
+                self.metrics.cached = True
+                return self.output
+
+        if self._timed("canhandle", self.canhandle, input_, global_cfg):
             self.input_ = input_
-            self.output = self.run()
+            self.output = self._timed("run", self.run)
             if self.save and self.output is not None:
-                self.save_method()
+                self._timed("save", self.save_method)
+            if use_cache and self.output is not None:
+                cache.put(cache_key, self.output)
             return self.output
         else:
             return None  # File failed checks and cannot be processed
 
+    def cache_params(self) -> dict[str, Any]:
+        """Parameters that change this Step's output.
+
+        Defaults to the Step's public attributes, such as those set from constructor
+        arguments, leaving out the input, output and other state set while running.
+        Values are hashed as JSON, or as ``str()`` when not serialisable. Overwrite to
+        choose the parameters yourself.
+
+        Returns:
+            A dictionary, hashed into the Step's cache key.
+        """
+        return {
+            k: v
+            for k, v in vars(self).items()
+            if not k.startswith("_") and k not in _STEP_STATE_ATTRS
+        }
+
+    def cache_identity(self, global_cfg) -> str:
+        """Hash everything about this Step that decides its output for a given input."""
+        cls = self.__class__
+        return StepCache.hash_key(
+            f"{cls.__module__}.{cls.__qualname__}",
+            self.version,
+            json.dumps(self.cache_params(), sort_keys=True, default=str),
+            json.dumps(
+                {k: global_cfg.get(k) for k in self.cache_cfg_keys},
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
     def canhandle(self, input_, global_cfg) -> bool:
         """Confirms if the input is valid for this step.
 
@@ -107,6 +293,57 @@ class Step:
         raise NotImplementedError("Should be overwritten")
 
 
+class StreamStep(Step):
+    """A Step that transforms a stream of chunks, one chunk at a time.
+
+    ``run()`` is a generator: it iterates ``self.input_`` (the stream from the Step before,
+    or any input it can read in chunks, such as a path) and yields output chunks, e.g.
+    DataFrame chunks or records. Consecutive StreamSteps are wired into a lazy pipeline,
+    so only the chunks in flight are held in memory. Yielding None drops a chunk.
+
+    A regular Step after a StreamStep receives the stream as its input and may consume
+    it. A stream left at the end of a Process is drained by ``Process.start()``.
+
+    Example:
+        class Clean(StreamStep):
+            def canhandle(self, input_, global_cfg) -> bool:
+                return True
+
+            def run(self):
+                for chunk in self.input_:
+                    yield chunk.dropna(subset=["sample_id"])
+
+    StreamStep outputs are never cached.
+    """
+
+    cacheable = False
+
+    def _handle(self, input_, global_cfg, cache, cache_key):
+        """Check the input with canhandle, and return the lazy stream of output chunks.
+
+        Streams are not cached, so ``cache`` and ``cache_key`` are ignored.
+        """
+        if self._timed("canhandle", self.canhandle, input_, global_cfg):
+            self.input_ = input_
+            self.output = self._stream()
+            return self.output
+        else:
+            return None
+
+    def _stream(self) -> Iterator[Any]:
+        for chunk in self.run():
+            if chunk is None:
+                continue
+            if self.save:
+                self.chunk = chunk
+                self._timed("save", self.save_method)
+            yield chunk
+
+    def save_method(self):
+        """Defines save behaviour for each output chunk, available as ``self.chunk``."""
+        raise NotImplementedError("Should be overwritten")
+
+
 class Process:
     """A container for processing Steps within a cygnet.
 
@@ -125,23 +362,38 @@ class Process:
         It's also useful to be able to view the outputs of each step of a process to aid in debugging.
     """
 
-    def __init__(self, name, logger: logging.Logger = None, **kwargs):
+    def __init__(
+        self,
+        name,
+        logger: logging.Logger = None,
+        step_cache: StepCache | None = None,
+        trace_memory: bool = False,
+        **kwargs,
+    ):
         """Initialise the process with a name and any keyword args used by your process.
 
         Args:
             name : An name for the process useful in logging.
+            step_cache : Optional StepCache. Steps with a cached output for this input are
+                skipped, and the Process resumes from the last cached Step.
+            trace_memory : Record the peak memory of each Step with tracemalloc, which
+                slows Python allocations while the Process runs.
             **kwargs : all kwargs are unpacked in the process.global_cfg and passed to all steps.
 
         Attributes:
             step_dict : An orderered Dictionary of Steps that we iterate over.
             step_out : An optional location to add the outputs of each step.
             step_logs : Unused but we could add logs to the class.
+            step_metrics : A StepMetrics for each Step that ran.
         """
         self.name = name
         self.global_cfg = {**kwargs}
         self.step_dict: OrderedDict[str, Step] = OrderedDict()
         self.step_out: OrderedDict[str, Step] = OrderedDict()
         self.step_history = {}
+        self.step_cache = step_cache
+        self.trace_memory = trace_memory
+        self.step_metrics: dict[str, StepMetrics] = {}
         # TODO review if inlcuding the input Path name is sanitary here.
         self.logger = logger.getChild(
             f'"{kwargs["input_"].stem}".' f"{self.__class__.__name__}"
@@ -166,21 +418,492 @@ class Process:
         """Removes a step from the process."""
         self.step_dict.pop([step.name], None)
 
-    def start(self):
-        """Executes the process."""
+    def upstreams(self) -> dict[str, list[str]]:
+        """Names of the Steps each Step takes its input from, in a runnable order.
+
+        Raises:
+            gdt.KnownException: If a Step depends on an unknown Step, or on itself
+                through a cycle.
+        """
+        graph = {}
+        previous = None
+        for step_name, step in self.step_dict.items():
+            if step is None:
+                continue
+            if step.depends_on is None:
+                graph[step_name] = [] if previous is None else [previous]
+            else:
+                unknown = [d for d in step.depends_on if self.step_dict.get(d) is None]
+                if unknown:
+                    raise gdt.KnownException(
+                        f"Step [{step_name}] depends on {unknown}, which are not Steps of"
+                        f" the {self.name} process."
+                    )
+                graph[step_name] = list(step.depends_on)
+            previous = step_name
+
+        ordered = {}
+        while len(ordered) < len(graph):
+            ready = [
+                n
+                for n, ups in graph.items()
+                if n not in ordered and set(ups) <= set(ordered)
+            ]
+            if not ready:
+                raise gdt.KnownException(
+                    f"Steps {[n for n in graph if n not in ordered]} of the {self.name}"
+                    " process depend on each other in a cycle."
+                )
+            for n in ready:
+                ordered[n] = graph[n]
+        return ordered
+
+    def _saves_upstream(self, graph: dict[str, list[str]]) -> dict[str, bool]:
+        """Whether any Step upstream of each Step saves, which resuming would skip."""
+        saves = {}
+        for step_name, ups in graph.items():
+            saves[step_name] = any(self.step_dict[u].save or saves[u] for u in ups)
+        return saves
+
+    def cache_keys(self) -> dict[str, str]:
+        """Cache key of each Step's output, chained from a fingerprint of the input."""
+        fingerprint = StepCache.fingerprint(self.global_cfg["input_"])
+        keys = {}
+        for step_name, ups in self.upstreams().items():
+            step = self.step_dict[step_name]
+            parents = [keys[u] for u in ups] or [fingerprint]
+            keys[step_name] = StepCache.hash_key(
+                *parents, step.cache_identity(self.global_cfg)
+            )
+        return keys
+
+    def start(self, max_workers: int | None = None):
+        """Executes the process.
+
+        With a ``step_cache``, Steps before the last Step with a cached output are skipped,
+        and the Process resumes from that Step.
+
+        When any Step names its ``depends_on``, the Steps run as a DAG: each Step starts on
+        a thread pool once its upstream Steps have finished, so independent branches run
+        concurrently. A Step with several upstream Steps receives a dict of their outputs
+        by name. A Step returning None stops only the Steps downstream of it.
+
+        Args:
+            max_workers : Threads running the branches of a DAG. Defaults to the
+                ThreadPoolExecutor default.
+
+        Returns:
+            The output of the last Step, or None if a Step stopped the chain. When the
+            last Step is a StreamStep, its stream is drained and the number of chunks that
+            reached the end is returned. A DAG with several final Steps returns a dict
+            of their outputs by name.
+        """
         # Append a finalising "end" step to the process.
         self.step_dict["end"] = None
-
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            if any(
+                s is not None and s.depends_on is not None
+                for s in self.step_dict.values()
+            ):
+                return self._start_dag(max_workers)
+            return self._start_chain()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    def _start_chain(self):
+        """Run the Steps as a linear chain, see ``start()``."""
+        keys = self.cache_keys() if self.step_cache is not None else {}
+        resume = None
         output = self.global_cfg["input_"]
+        saves_upstream = self._saves_upstream(self.upstreams()) if keys else {}
+        # Resume after the last Step whose cached output can be read, falling back to
+        # earlier Steps when an entry has expired or is unreadable.
+        for step_name, key in reversed(keys.items()):
+            if saves_upstream[step_name]:
+                break
+            step = self.step_dict[step_name]
+            if step.cacheable:
+                cached = self.step_cache.get(key)
+                if cached is not MISSING:
+                    resume = step_name
+                    step.output = output = cached
+                    self.step_metrics[step_name] = StepMetrics(step_name, cached=True)
+                    break
+        if resume is not None:
+            self.logger.info(f"Resuming from cached output of step [{resume}].")
+
+        streaming = False
         # run each step and pass the inputs
         for step_name, step in self.step_dict.items():
+            if resume is not None:
+                if step_name == resume:
+                    resume = None
+                continue
             if step_name == "end":
+                if streaming:
+                    # Pull the chunks through the trailing StreamSteps.
+                    output = sum(1 for _ in output)
                 self.step_history["end"] = True
             else:
-                output = step.handle(output, self.global_cfg)
+                output = step.handle(
+                    output, self.global_cfg, self.step_cache, keys.get(step_name)
+                )
+                self.step_metrics[step_name] = step.metrics
+                streaming = isinstance(step, StreamStep)
 
             if output is None:  # Step failed
                 self.step_history[step.name] = False
                 break
 
         return output
+
+    def _start_dag(self, max_workers: int | None):
+        """Run the Steps as a DAG, see ``start()``."""
+        graph = self.upstreams()
+        downstream = {n: [m for m, ups in graph.items() if n in ups] for n in graph}
+        shared = [
+            n
+            for n in graph
+            if isinstance(self.step_dict[n], StreamStep) and len(downstream[n]) > 1
+        ]
+        if shared:
+            raise gdt.KnownException(
+                f"StreamSteps {shared} feed several Steps, but a stream can only be"
+                " consumed once."
+            )
+        sinks = [n for n in graph if not downstream[n]]
+        keys = self.cache_keys() if self.step_cache is not None else {}
+
+        # Only Steps upstream of an uncached output, or that save, need to run.
+        saves_upstream = self._saves_upstream(graph)
+        outputs = {}
+        needed = set()
+        visit = list(sinks)
+        while visit:
+            step_name = visit.pop()
+            if step_name in needed:
+                continue
+            needed.add(step_name)
+            step = self.step_dict[step_name]
+            if step_name in keys and step.cacheable and not saves_upstream[step_name]:
+                cached = self.step_cache.get(keys[step_name])
+                if cached is not MISSING:
+                    step.output = outputs[step_name] = cached
+                    self.step_metrics[step_name] = StepMetrics(step_name, cached=True)
+                    continue
+            visit.extend(graph[step_name])
+
+        pending = [n for n in graph if n in needed and n not in outputs]
+        stopped = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running: dict[Future, str] = {}
+            while pending or running:
+                for step_name in list(pending):
+                    ups = graph[step_name]
+                    if any(u in stopped for u in ups):
+                        stopped.add(step_name)
+                    elif all(u in outputs for u in ups):
+                        if not ups:
+                            input_ = self.global_cfg["input_"]
+                        elif len(ups) == 1:
+                            input_ = outputs[ups[0]]
+                        else:
+                            input_ = {u: outputs[u] for u in ups}
+                        step = self.step_dict[step_name]
+                        future = pool.submit(
+                            step.handle,
+                            input_,
+                            self.global_cfg,
+                            self.step_cache,
+                            keys.get(step_name),
+                        )
+                        running[future] = step_name
+                    else:
+                        continue
+                    pending.remove(step_name)
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_name = running.pop(future)
+                    output = future.result()
+                    self.step_metrics[step_name] = self.step_dict[step_name].metrics
+                    if output is None:  # Step failed
+                        self.step_history[step_name] = False
+                        stopped.add(step_name)
+                    else:
+                        outputs[step_name] = output
+
+        if stopped:
+            return None
+        for step_name in sinks:
+            if isinstance(self.step_dict[step_name], StreamStep):
+                # Pull the chunks through the trailing StreamSteps.
+                outputs[step_name] = sum(1 for _ in outputs[step_name])
+        self.step_history["end"] = True
+        if len(sinks) == 1:
+            return outputs[sinks[0]]
+        return {n: outputs[n] for n in sinks}
+
+
+@dataclass
+class ProcessResult:
+    """The outcome of one Process run by :func:`run_many`.
+
+    Attributes:
+        input_ : The input the Process was built for.
+        output : What ``Process.start()`` returned, None if a Step stopped the chain.
+        step_history : The Process's ``step_history`` after it ran.
+        step_metrics : The Process's ``step_metrics`` after it ran.
+        error : The exception raised while building or running the Process, if any.
+    """
+
+    input_: Any
+    output: Any = None
+    step_history: dict = field(default_factory=dict)
+    step_metrics: dict[str, StepMetrics] = field(default_factory=dict)
+    error: BaseException | None = None
+
+
+# Engines already reset in this worker process, by pid, see _release_inherited_engines.
+_WORKER_ENGINES: tuple[int, set[int]] = (os.getpid(), set())
+
+
+def _release_inherited_engines(global_cfg: dict) -> None:
+    """Drop pooled connections a forked worker inherited with the engines in global_cfg.
+
+    A forked worker shares its parent's open sockets, which must not be used by both
+    processes. Each engine is disposed without closing those connections, once per
+    worker, so it opens fresh connections of its own.
+    """
+    global _WORKER_ENGINES
+    pid, seen = _WORKER_ENGINES
+    if pid != os.getpid():
+        _WORKER_ENGINES = pid, seen = os.getpid(), set()
+    for value in global_cfg.values():
+        if isinstance(value, sqla.Engine) and id(value) not in seen:
+            value.dispose(close=False)
+            seen.add(id(value))
+
+
+def _run_process(
+    process_factory: Callable[[Any], "Process"], input_: Any, forked: bool = False
+) -> ProcessResult:
+    """Build and start the Process for one input, capturing any exception.
+
+    In a forked worker, engines inherited from the parent are released first.
+    """
+    result = ProcessResult(input_)
+    try:
+        process = process_factory(input_)
+        if forked:
+            _release_inherited_engines(process.global_cfg)
+        try:
+            result.output = process.start()
+        finally:
+            result.step_history = dict(process.step_history)
+            result.step_metrics = dict(process.step_metrics)
+    except Exception as exc:
+        logger.exception(f"Process for input [{input_}] failed.")
+        result.error = exc
+    return result
+
+
+# The process factory of a worker process, and whether the worker was forked, installed
+# by _init_worker.
+_WORKER_FACTORY: Callable[[Any], "Process"] | None = None
+_WORKER_FORKED = False
+
+
+def _init_worker(process_factory: Callable[[Any], "Process"], forked: bool) -> None:
+    global _WORKER_FACTORY, _WORKER_FORKED
+    _WORKER_FACTORY = process_factory
+    _WORKER_FORKED = forked
+
+
+def _run_process_in_worker(input_: Any) -> ProcessResult:
+    return _run_process(_WORKER_FACTORY, input_, forked=_WORKER_FORKED)
+
+
+def run_many(
+    process_factory: Callable[[Any], "Process"],
+    inputs: Iterable[Any],
+    max_workers: int | None = None,
+    executor: Literal["thread", "process"] = "thread",
+    ordered: bool = True,
+    max_in_flight: int | None = None,
+    start_method: Literal["spawn", "forkserver", "fork"] = "spawn",
+) -> Iterator[ProcessResult]:
+    """Run a Process for each input on a pool of workers.
+
+    ``process_factory`` builds a ready-to-start Process (with its Steps added) for one
+    input, and is called inside the worker. Inputs are consumed lazily, and at most
+    ``max_in_flight`` Processes are queued or running at once, so very long input lists
+    (or generators) do not build up results in memory.
+
+    Threads suit Steps that wait on I/O or databases, and share engines created before
+    the run. Processes suit CPU-bound Steps. Worker processes are spawned by default, so
+    ``process_factory`` must be picklable (e.g. a module-level function, or a
+    ``functools.partial`` of one) and should create or ``gdt.connect`` its engines inside
+    the worker, as engines cannot be pickled. ``start_method="fork"`` lets workers
+    inherit the factory and its engines instead, and engines found in a worker's
+    ``global_cfg`` are then reset once per worker so connections inherited from the
+    parent are never shared. Forking a parent that runs threads can deadlock, and is
+    unsafe on macOS, so only opt in when the parent is single-threaded. Results are
+    always pickled back to the parent.
+
+    Exceptions raised by a Process are logged and returned in ``ProcessResult.error``
+    rather than stopping the batch.
+
+    Example:
+        def build(input_):
+            process = Process("survey", logger, input_=input_, engine=engine)
+            process.addstep(Load("load"))
+            process.addstep(Clean("clean"))
+            return process
+
+        for result in run_many(build, Path("surveys").glob("*.csv"), max_workers=8):
+            if result.output is None:
+                ...
+
+    Args:
+        process_factory (Callable[[Any], Process]): Builds the Process for an input.
+        inputs (Iterable[Any]): The inputs to process.
+        max_workers (int | None, optional): Size of the pool. Defaults to the number of
+            CPUs.
+        executor (Literal["thread", "process"], optional): Run Processes on threads or
+            in worker processes. Defaults to "thread".
+        ordered (bool, optional): Yield results in input order. Otherwise results are
+            yielded as they complete. Defaults to True.
+        max_in_flight (int | None, optional): Most Processes submitted and not yet
+            yielded at once. Defaults to twice ``max_workers``.
+        start_method (Literal["spawn", "forkserver", "fork"], optional): How worker
+            processes are started, see :mod:`multiprocessing`. Defaults to "spawn".
+
+    Yields:
+        ProcessResult: The output and step history of each input.
+
+    Raises:
+        ValueError: If ``executor`` is not "thread" or "process".
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max(1, max_in_flight or 2 * max_workers)
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        task = partial(_run_process, process_factory)
+    elif executor == "process":
+        # The factory is sent once per worker, rather than with every input.
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(process_factory, start_method == "fork"),
+        )
+        task = _run_process_in_worker
+    else:
+        raise ValueError(f'executor must be "thread" or "process", got {executor}.')
+    inputs = iter(inputs)
+
+    def submit(n: int) -> list[Future]:
+        return [pool.submit(task, input_) for input_ in itertools.islice(inputs, n)]
+
+    with pool:
+        if ordered:
+            in_flight = deque(submit(max_in_flight))
+            while in_flight:
+                result = in_flight.popleft().result()
+                in_flight.extend(submit(1))
+                yield result
+        else:
+            not_done = set(submit(max_in_flight))
+            while not_done:
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                not_done |= set(submit(len(done)))
+                for future in done:
+                    yield future.result()
+
+
+def summarize_step_metrics(
+    runs: Iterable["Process | ProcessResult | dict[str, StepMetrics]"],
+) -> pd.DataFrame:
+    """Aggregate the StepMetrics of many Process runs, one row per Step.
+
+    Example:
+        results = list(run_many(build, inputs))
+        summary = summarize_step_metrics(results)
+        print(summary[["runs", "wall_seconds_total", "wall_share"]])
+
+    Args:
+        runs (Iterable[Process | ProcessResult | dict[str, StepMetrics]]): Finished
+            Processes, results of :func:`run_many`, or their ``step_metrics``.
+
+    Returns:
+        pd.DataFrame: Indexed by Step name and sorted by total wall time, with the number
+        of runs and cache hits, total, mean and max wall time, totals of the CPU,
+        canhandle, run and save times, the Step's share of the total wall time, max peak
+        memory and total rows and bytes in and out.
+    """
+    records = []
+    for run in runs:
+        metrics = run if isinstance(run, dict) else run.step_metrics
+        records.extend(asdict(m) for m in metrics.values())
+    columns = [f.name for f in fields(StepMetrics)]
+    frame = pd.DataFrame.from_records(records, columns=columns)
+
+    summary = frame.groupby("step", sort=False).agg(
+        runs=("step", "size"),
+        cached=("cached", "sum"),
+        wall_seconds_total=("wall_seconds", "sum"),
+        wall_seconds_mean=("wall_seconds", "mean"),
+        wall_seconds_max=("wall_seconds", "max"),
+        cpu_seconds_total=("cpu_seconds", "sum"),
+        canhandle_seconds_total=("canhandle_seconds", "sum"),
+        run_seconds_total=("run_seconds", "sum"),
+        save_seconds_total=("save_seconds", "sum"),
+        peak_memory_bytes_max=("peak_memory_bytes", "max"),
+        input_rows_total=("input_rows", "sum"),
+        input_bytes_total=("input_bytes", "sum"),
+        output_rows_total=("output_rows", "sum"),
+        output_bytes_total=("output_bytes", "sum"),
+    )
+    total = summary["wall_seconds_total"].sum()
+    summary["wall_share"] = summary["wall_seconds_total"] / total if total else 0.0
+    return summary.sort_values("wall_seconds_total", ascending=False)
+
+
+def write_step_metrics(
+    engine: sqla.Engine,
+    cygnet: ModuleType,
+    run_datetime: str | datetime,
+    summary: pd.DataFrame,
+    table_name: str = "step_metrics",
+    **metadata: Any,
+) -> None:
+    """Record a summary from :func:`summarize_step_metrics` in its own metadata table.
+
+    Each value is written through :func:`gswa_atratus.write_db_metadata_table` as a
+    ``<step>.<column>`` field, e.g. ``clean.wall_seconds_total``, in ``table_name``, so
+    the ``runtime_metadata`` table written by the cygnet is left in place.
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine of the generated database.
+        cygnet (types.ModuleType): The running cygnet, with ``__name__`` and
+            ``__version__`` attributes.
+        run_datetime (str | datetime): Timestamp of the start of script execution.
+        summary (pd.DataFrame): Summary of the step metrics.
+        table_name (str, optional): Table to write, replacing any earlier summary.
+            Defaults to "step_metrics".
+        **metadata (Any): Additional metadata to record alongside the metrics.
+    """
+    metrics = {
+        f"{step}.{column}": (None if pd.isna(value) else value)
+        for step, row in summary.iterrows()
+        for column, value in row.items()
+    }
+    gdt.write_db_metadata_table(
+        engine, cygnet, run_datetime, table_name=table_name, **metrics, **metadata
+    )
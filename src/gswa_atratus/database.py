@@ -12,37 +12,70 @@ Key Features:
     - Runtime metadata tracking
 """
 
+import atexit
+import contextlib
 import json
+import logging
+import os
+import queue
+import threading
+import time
 import types
-from datetime import datetime
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sqla
 from sqlalchemy.sql.expression import Selectable
 
 import gswa_atratus as gdt
+from gswa_atratus.utils.bulk import InsertStats, Strategy, upsert_frame, write_frame
+from gswa_atratus.utils.cache import QueryCache
+from gswa_atratus.utils.dtypes import DtypePolicy, apply_dtype_policy, frame_from_result
+from gswa_atratus.utils.pools import pool_workers
+from gswa_atratus.utils.profiling import QueryProfile, compile_sql
+from gswa_atratus.utils.profiling import explain as explain_plan
+from gswa_atratus.utils.reflection import ReflectionMode
+from gswa_atratus.utils.statements import (
+    DROP,
+    build_statement,
+    plan_shared_scans,
+    read_statement_config,
+)
 
+logger = logging.getLogger(__name__)
 
-def connect(
-    cfg_path: str | Path, local_db_path: str | Path | None = None
-) -> tuple[sqla.Engine, sqla.MetaData]:
-    """Connect to an engine from a config file.
+# Per-connection settings trading durability for load speed while bulk loading SQLite.
+_SQLITE_BULK_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-262144",  # 256 MiB
+    "PRAGMA temp_store=MEMORY",
+)
 
-    For example, configs/config.json might contain:
-    {"sqlalchemy": {"sqlalchemy.url": "sqlite+pysqlite:///:memory:"}}
+
+def read_sqla_config(
+    cfg_path: str | Path, local_db_path: str | Path | None = None, driver: str = "sqlite"
+) -> dict[str, Any]:
+    """Read the ``sqlalchemy`` section of a gswa-atratus config file.
 
     Args:
         cfg_path (str | Path): Path to the JSON config file.
-        local_db_path (str | Path | None, optional):  Overwrite the `sqlalchemy.url` in config with the provided local file path. Defaults to None.
+        local_db_path (str | Path | None, optional): Overwrite the `sqlalchemy.url` in config
+            with the provided local file path. Defaults to None.
+        driver (str, optional): SQLAlchemy dialect+driver used for ``local_db_path``.
+            Defaults to "sqlite".
 
     Returns:
-        tuple[sqla.Engine, sqla.MetaData]: SQLAlchemy Engine and MetaData objects.
+        dict[str, Any]: Configuration accepted by ``sqlalchemy.engine_from_config``.
 
     Raises:
         FileNotFoundError: If the config file does not exist.
-        gdt.KnownException: If the config file is malformed.
     """
     cfg_path = Path(cfg_path)
     if not cfg_path.exists():
@@ -53,15 +86,98 @@ def connect(
     sqla_cfg = db_config.pop("sqlalchemy")
 
     if local_db_path:
-        sqla_cfg["sqlalchemy.url"] = f"sqlite:///{local_db_path}"  # for windows
+        sqla_cfg["sqlalchemy.url"] = f"{driver}:///{local_db_path}"  # for windows
         # sqla_url = f"sqlite:///{local_db_path}" # for linux/macOS
-    try:
-        engine = sqla.engine_from_config(configuration=sqla_cfg)
-    except sqla.exc.ArgumentError as exc:
-        raise gdt.KnownException(
-            f"Malformed config file: While parsing {sqla_cfg}.",
-        ) from exc
-    meta_data = sqla.MetaData()
+    return sqla_cfg
+
+
+# Engines shared by every connect() call in this process, keyed on the resolved config.
+_ENGINE_REGISTRY: dict[str, tuple[sqla.Engine, sqla.MetaData]] = {}
+_ENGINE_REGISTRY_LOCK = threading.Lock()
+
+# Pool options that engine_from_config passes through without converting from strings.
+_BOOL_POOL_OPTIONS = ("sqlalchemy.pool_pre_ping", "sqlalchemy.pool_use_lifo")
+
+
+def dispose_engines(close: bool = True) -> None:
+    """Dispose every engine created by :func:`connect` and empty the registry.
+
+    Called automatically at interpreter exit. In a forked child process the registry is
+    emptied with ``close=False``, so connections inherited from the parent are dropped
+    without closing them from under the parent.
+
+    Args:
+        close (bool, optional): Close checked-in pooled connections. Defaults to True.
+    """
+    with _ENGINE_REGISTRY_LOCK:
+        engines = list(_ENGINE_REGISTRY.values())
+        _ENGINE_REGISTRY.clear()
+    for engine, _ in engines:
+        engine.dispose(close=close)
+
+
+def _reset_after_fork() -> None:
+    """Drop engines inherited by a forked child, which must not share the parent's sockets."""
+    global _ENGINE_REGISTRY_LOCK
+    # The lock may have been held by another thread of the parent at fork time.
+    _ENGINE_REGISTRY_LOCK = threading.Lock()
+    dispose_engines(close=False)
+
+
+atexit.register(dispose_engines)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def connect(
+    cfg_path: str | Path, local_db_path: str | Path | None = None, reuse: bool = True
+) -> tuple[sqla.Engine, sqla.MetaData]:
+    """Connect to an engine from a config file.
+
+    For example, configs/config.json might contain:
+    {"sqlalchemy": {"sqlalchemy.url": "sqlite+pysqlite:///:memory:"}}
+
+    Connection pooling can be tuned in the same section with ``sqlalchemy.pool_size``,
+    ``sqlalchemy.max_overflow``, ``sqlalchemy.pool_recycle``, ``sqlalchemy.pool_timeout``
+    and ``sqlalchemy.pool_pre_ping``.
+
+    Engines are kept in a process-wide registry keyed on the resolved ``sqlalchemy``
+    config, so repeated calls with the same config return the same Engine (and its
+    connection pool) and the same MetaData, and tables already reflected are not
+    reflected again. See :func:`dispose_engines`.
+
+    Args:
+        cfg_path (str | Path): Path to the JSON config file.
+        local_db_path (str | Path | None, optional):  Overwrite the `sqlalchemy.url` in config with the provided local file path. Defaults to None.
+        reuse (bool, optional): Return the registered engine for this config if there is
+            one. False always builds a new, unregistered engine. Defaults to True.
+
+    Returns:
+        tuple[sqla.Engine, sqla.MetaData]: SQLAlchemy Engine and MetaData objects.
+
+    Raises:
+        FileNotFoundError: If the config file does not exist.
+        gdt.KnownException: If the config file is malformed.
+    """
+    sqla_cfg = read_sqla_config(cfg_path, local_db_path)
+    for option in _BOOL_POOL_OPTIONS:
+        if option in sqla_cfg:
+            sqla_cfg[option] = sqla.util.asbool(sqla_cfg[option])
+    key = json.dumps(sqla_cfg, sort_keys=True, default=str)
+
+    with _ENGINE_REGISTRY_LOCK:
+        if reuse and key in _ENGINE_REGISTRY:
+            return _ENGINE_REGISTRY[key]
+
+        try:
+            engine = sqla.engine_from_config(configuration=sqla_cfg)
+        except sqla.exc.ArgumentError as exc:
+            raise gdt.KnownException(
+                f"Malformed config file: While parsing {sqla_cfg}.",
+            ) from exc
+        meta_data = sqla.MetaData()
+        if reuse:
+            _ENGINE_REGISTRY[key] = (engine, meta_data)
     return (engine, meta_data)
 
 
@@ -130,10 +246,49 @@ def create_from_dataframe(
     metadata.create_all(bind=engine)
 
 
+def _apply_mnemonics(df: pd.DataFrame, mnemonics: dict | None) -> None:
+    """Rename columns to their mnemonics in place, dropping those mapped to "drop"."""
+    if not mnemonics:
+        return
+    dropped = [c for c, m in mnemonics.items() if m == DROP and c in df.columns]
+    if dropped:
+        df.drop(columns=dropped, inplace=True)
+    df.rename(columns=mnemonics, inplace=True)
+
+
+def fetch_frame(
+    conn: sqla.Connection,
+    statement: Selectable | str,
+    columnar: bool = False,
+    params: dict | None = None,
+) -> pd.DataFrame:
+    """Execute a SELECT statement on an open connection and build a DataFrame.
+
+    Args:
+        conn (sqlalchemy.Connection): An open connection.
+        statement (Selectable | str): A SQLAlchemy statement or raw SQL text to execute.
+        columnar (bool, optional): Use the columnar fetch path. See :func:`select`.
+            Defaults to False.
+        params (dict | None, optional): Values for the statement's bind parameters.
+            Defaults to None.
+
+    Returns:
+        pd.DataFrame: Results of the SELECT query.
+    """
+    result = conn.execute(statement, params)
+    if columnar:
+        return frame_from_result(result, statement, conn.dialect)
+    return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+
 def select(
     engine: sqla.Engine,
     statement: Selectable | str,
     mnemonics: dict | None = None,
+    columnar: bool = False,
+    cache: QueryCache | None = None,
+    params: dict | None = None,
+    dtypes: DtypePolicy | dict | None = None,
 ) -> pd.DataFrame:
     """Execute a SELECT statement against a specific engine, returning a DataFrame.
 
@@ -141,6 +296,23 @@ def select(
         engine (sqlalchemy.Engine): Database connection engine.
         statement (Selectable | str): A SQLAlchemy statement or raw SQL text to execute.
         mnemonics: dictionary from config, containing mnemonic mappings for database headers.
+            Columns mapped to "drop" are removed. Prefer passing mnemonics to
+            :func:`gswa_atratus.load_statement`, which labels and prunes the columns in SQL.
+        columnar (bool, optional): Build the DataFrame column by column from the DBAPI cursor,
+            using the reflected SQL column types to choose dtypes up front. Avoids creating a
+            ``Row`` object per row on large selects. Integer and boolean columns containing
+            NULL become nullable ``Int64``/``boolean`` rather than float/object. Defaults to False.
+        cache (QueryCache | None, optional): An on-disk result cache. Results of a statement
+            already cached for this engine are read from disk instead of the database.
+            Defaults to None.
+        params (dict | None, optional): Values for bind parameters declared in the
+            statement config, see :func:`gswa_atratus.utils.statement_builder`. The same
+            statement executed with different params is compiled only once.
+            Defaults to None.
+        dtypes (DtypePolicy | dict | None, optional): "compact" to downcast columns to
+            the smallest dtypes their reflected SQL types allow, "infer" to keep pandas'
+            inferred dtypes, or ``{"policy": ..., "columns": {name: dtype}}`` to also
+            override columns. Defaults to the ``dtypes`` of the statement config, if any.
 
     Specifying Mnemonics will rename columns from the database header to the mnemonic used
     by skippy. This is required for automatically pulling data from your database.
@@ -151,65 +323,836 @@ def select(
     Raises:
         Exception: If execution or data retrieval fails.
     """
-    try:
-        with engine.begin() as conn:
-            result = conn.execute(statement).all()
-        df = pd.DataFrame(result)
-        if mnemonics:
-            df.rename(columns=mnemonics, inplace=True)
-    except Exception as exc:
-        raise exc
+    key = cache.key(engine, statement, columnar, params) if cache is not None else None
+    df = cache.get(key) if cache is not None else None
+    if df is None:
+        try:
+            with engine.begin() as conn:
+                df = fetch_frame(conn, statement, columnar, params)
+            if cache is not None:
+                cache.put(key, df)
+        except Exception as exc:
+            raise exc
 
+    df = _apply_dtypes(df, statement, dtypes)
+    _apply_mnemonics(df, mnemonics)
     return df
 
 
+def _apply_dtypes(
+    df: pd.DataFrame, statement: Any, dtypes: DtypePolicy | dict | None = None
+) -> pd.DataFrame:
+    """Apply a dtype policy, defaulting to the ``dtypes`` of the statement config."""
+    if dtypes is None and hasattr(statement, "get_execution_options"):
+        dtypes = statement.get_execution_options().get("dtypes")
+    if dtypes is None:
+        return df
+    if isinstance(dtypes, str):
+        dtypes = {"policy": dtypes}
+    return apply_dtype_policy(
+        df, statement, dtypes.get("policy", "compact"), dtypes.get("columns")
+    )
+
+
+def select_iter(
+    engine: sqla.Engine,
+    statement: Selectable | str,
+    mnemonics: dict | None = None,
+    chunksize: int = 50_000,
+    params: dict | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Execute a SELECT statement, yielding the results as DataFrame chunks.
+
+    The statement is executed with a server-side cursor (``stream_results``) where the
+    driver supports one, and rows are fetched ``chunksize`` at a time. Only one chunk is
+    held in memory at once, so peak memory is bounded by ``chunksize`` rather than the
+    size of the result.
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine.
+        statement (Selectable | str): A SQLAlchemy statement or raw SQL text to execute.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers,
+            applied to each chunk as in :func:`select`. Defaults to None.
+        chunksize (int, optional): Number of rows per yielded DataFrame. Defaults to 50_000.
+        params (dict | None, optional): Values for the statement's bind parameters.
+            Defaults to None.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the result with optionally renamed columns.
+
+    Raises:
+        ValueError: If chunksize is not a positive integer.
+        Exception: If execution or data retrieval fails.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=chunksize
+        ).execute(statement, params)
+        columns = list(result.keys())
+        for partition in result.partitions():
+            df = pd.DataFrame(partition, columns=columns)
+            _apply_mnemonics(df, mnemonics)
+            yield df
+
+
+def select_many(
+    engine: sqla.Engine,
+    statement: Selectable,
+    param_sets: Iterable[dict],
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Execute one parameterised SELECT for each set of parameter values.
+
+    All executions share a single connection. The statement is compiled on the first
+    execution and taken from the engine's compiled cache afterwards, and drivers that
+    prepare statements let the server reuse its plan, since only the bound values change.
+
+    Example:
+        statement = gdt.load_statement(cfg_path, engine, metadata)  # declares "project"
+        for df in gdt.select_many(engine, statement, [{"project": p} for p in projects]):
+            ...
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine.
+        statement (Selectable): A statement with bind parameters.
+        param_sets (Iterable[dict]): Bind parameter values, one dict per execution.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers.
+            Defaults to None.
+        columnar (bool, optional): Use the columnar fetch path. See :func:`select`.
+            Defaults to False.
+
+    Yields:
+        pd.DataFrame: The result for each parameter set, in order.
+    """
+    with engine.connect() as conn:
+        for params in param_sets:
+            df = fetch_frame(conn, statement, columnar, params)
+            _apply_mnemonics(df, mnemonics)
+            yield df
+
+
+def select_shared(
+    engine: sqla.Engine,
+    metadata: sqla.MetaData,
+    cfgs: Sequence[str | Path | dict],
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+    params: dict | None = None,
+    reflection: ReflectionMode = "serial",
+) -> list[pd.DataFrame]:
+    """Run several statement configs with one query per group of compatible configs.
+
+    Configs that differ only in their selected columns (same joins, aliases, filters,
+    parameters, ordering and limit) are merged into one statement selecting the union of
+    their columns. Each merged statement is executed once and its result split back into
+    one DataFrame per config, so overlapping extracts make one pass over the tables
+    instead of one each. Identical configs are executed once.
+
+    Example:
+        holes, assays = gdt.select_shared(engine, metadata, ["holes.json", "assays.json"])
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine.
+        metadata (sqlalchemy.MetaData): A configured SQLAlchemy MetaData instance.
+        cfgs (Sequence[str | Path | dict]): Paths of config files, as given to
+            :func:`gswa_atratus.load_statement`, or parsed ``statement_configs`` sections.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers,
+            applied to every result. Defaults to None.
+        columnar (bool, optional): Use the columnar fetch path. See :func:`select`.
+            Defaults to False.
+        params (dict | None, optional): Values for bind parameters declared in the
+            configs. Defaults to None.
+        reflection (ReflectionMode, optional): How to reflect the configured tables, see
+            :func:`gswa_atratus.utils.statement_builder`. Defaults to "serial".
+
+    Returns:
+        list[pd.DataFrame]: One DataFrame per config, in the order given.
+
+    Raises:
+        gdt.KnownException: If a config file is malformed, or tables and columns are
+            missing from the database.
+    """
+    stmt_cfgs = [
+        cfg if isinstance(cfg, dict) else read_statement_config(cfg) for cfg in cfgs
+    ]
+    results: list[pd.DataFrame | None] = [None] * len(stmt_cfgs)
+    for scan in plan_shared_scans(stmt_cfgs):
+        statement = build_statement(engine, metadata, scan.stmt_cfg, reflection=reflection)
+        # Label every merged column uniquely, so same-named columns of different tables
+        # are not renamed depending on which other configs were merged in.
+        columns = list(statement.selected_columns)
+        merged = statement.with_only_columns(
+            *(c.label(f"shared_{n}") for n, c in enumerate(columns))
+        ).execution_options(dtypes=None)
+        df = select(engine, merged, columnar=columnar, params=params)
+        logger.info(
+            f"Shared scan of {len(df)} rows served {len(scan.members)} statement configs."
+        )
+        for i, positions in scan.members.items():
+            # The names and dtypes each config gets when selected on its own.
+            standalone = sqla.select(*(columns[p] for p in positions)).execution_options(
+                **statement.get_execution_options()
+            )
+            part = df.iloc[:, positions].copy()
+            part.columns = list(standalone.selected_columns.keys())
+            part = _apply_dtypes(part, standalone)
+            _apply_mnemonics(part, mnemonics)
+            results[i] = part
+    return results
+
+
+def profile_select(
+    engine: sqla.Engine,
+    statement: Selectable | str,
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+    params: dict | None = None,
+    explain: bool = True,
+    analyze: bool = False,
+) -> tuple[pd.DataFrame, QueryProfile]:
+    """Execute a SELECT like :func:`select`, also returning its SQL, plan and timings.
+
+    Example:
+        statement = gdt.load_statement(cfg_path, engine, metadata)
+        df, profile = gdt.profile_select(engine, statement)
+        profile.to_json("query_profile.json")
+        gdt.write_db_metadata_table(out_engine, cygnet, start, **profile.to_dict())
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine.
+        statement (Selectable | str): A SQLAlchemy statement or raw SQL text to execute.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers.
+            Defaults to None.
+        columnar (bool, optional): Use the columnar fetch path. See :func:`select`.
+            Defaults to False.
+        params (dict | None, optional): Values for the statement's bind parameters.
+            Defaults to None.
+        explain (bool, optional): Capture the database's query plan, after the timed
+            execution. Defaults to True.
+        analyze (bool, optional): On PostgreSQL, capture the plan with EXPLAIN ANALYZE,
+            which runs the statement a second time. Defaults to False.
+
+    Returns:
+        tuple[pd.DataFrame, QueryProfile]: The results, and the profile of the query.
+    """
+    if isinstance(statement, str):
+        statement = sqla.text(statement)
+    compiled = compile_sql(statement, engine.dialect, params)
+    profile = QueryProfile(
+        sql=str(compiled),
+        dialect=f"{engine.dialect.name}+{engine.dialect.driver}",
+        params=compiled.params,
+    )
+
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        connected = time.perf_counter()
+        result = conn.execute(statement, params)
+        executed = time.perf_counter()
+        if columnar:
+            df = frame_from_result(result, statement, conn.dialect)
+            fetched = built = time.perf_counter()
+        else:
+            rows = result.all()
+            fetched = time.perf_counter()
+            df = pd.DataFrame(rows, columns=list(result.keys()))
+            built = time.perf_counter()
+
+        if explain:
+            try:
+                profile.plan = explain_plan(conn, statement, params, analyze)
+            except sqla.exc.DBAPIError:
+                logger.warning("Could not capture the query plan.", exc_info=True)
+        conn.rollback()
+
+    profile.connect_seconds = connected - start
+    profile.execute_seconds = executed - connected
+    profile.fetch_seconds = fetched - executed
+    profile.build_seconds = built - fetched
+    profile.rows = len(df)
+    profile.bytes = int(df.memory_usage(deep=True).sum())
+    logger.info(
+        f"Profiled query: {profile.rows} rows in {profile.total_seconds:.3f}s"
+        f" (connect {profile.connect_seconds:.3f}s, execute {profile.execute_seconds:.3f}s,"
+        f" fetch {profile.fetch_seconds:.3f}s, build {profile.build_seconds:.3f}s)."
+    )
+
+    _apply_mnemonics(df, mnemonics)
+    return df, profile
+
+
+def _partition_statements(
+    engine: sqla.Engine,
+    statement: sqla.Select,
+    key: str | sqla.ColumnElement,
+    partitions: int,
+    bounds: Sequence | None,
+    strategy: Literal["range", "modulo"],
+) -> list[sqla.Select]:
+    """Split a Select into statements covering disjoint ranges of a key column.
+
+    Range partitions are open-ended at both ends, so every non-NULL key falls in exactly
+    one partition even when the split points do not span the data. Rows with a NULL key
+    are returned by a final partition of their own.
+    """
+    column = statement.selected_columns[key] if isinstance(key, str) else key
+
+    if strategy == "modulo":
+        # % keeps the sign of the key, so shift negative remainders into [0, partitions).
+        remainder = (column % partitions + partitions) % partitions
+        conditions = [remainder == i for i in range(partitions)]
+    elif strategy == "range":
+        if bounds is None:
+            bounds_stmt = statement.with_only_columns(
+                sqla.func.min(column), sqla.func.max(column), maintain_column_froms=True
+            ).order_by(None)
+            with engine.connect() as conn:
+                low, high = conn.execute(bounds_stmt).one()
+            if low is None:
+                return [statement]
+            if isinstance(low, (datetime, date)):
+                edges = pd.date_range(low, high, periods=partitions + 1)[1:-1]
+                bounds = [
+                    edge.to_pydatetime() if isinstance(low, datetime) else edge.date()
+                    for edge in edges
+                ]
+            else:
+                edges = np.linspace(float(low), float(high), partitions + 1)[1:-1]
+                if isinstance(low, int):
+                    edges = np.unique(np.ceil(edges).astype(int))
+                bounds = edges.tolist()
+        bounds = sorted(bounds)
+        if not bounds:
+            conditions = [column.is_not(None)]
+        else:
+            conditions = [column < bounds[0]]
+            conditions += [
+                sqla.and_(column >= lower, column < upper)
+                for lower, upper in zip(bounds[:-1], bounds[1:])
+            ]
+            conditions.append(column >= bounds[-1])
+    else:
+        raise ValueError(f"Unknown partition strategy {strategy!r}.")
+
+    conditions.append(column.is_(None))
+    return [statement.where(condition) for condition in conditions]
+
+
+def select_partitioned_iter(
+    engine: sqla.Engine,
+    statement: sqla.Select,
+    key: str | sqla.ColumnElement,
+    partitions: int = 4,
+    bounds: Sequence | None = None,
+    strategy: Literal["range", "modulo"] = "range",
+    max_workers: int | None = None,
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Execute a SELECT as concurrent partitions, yielding each as it finishes.
+
+    The statement is split on a key column and each partition runs as its own query on a
+    bounded thread pool, using connections from the engine's pool. See
+    :func:`select_partitioned` for the arguments.
+
+    Yields:
+        pd.DataFrame: The result of each partition, in order of completion.
+    """
+    statements = _partition_statements(
+        engine, statement, key, partitions, bounds, strategy
+    )
+    with ThreadPoolExecutor(
+        max_workers=max_workers or pool_workers(engine, len(statements))
+    ) as executor:
+        futures = [
+            executor.submit(select, engine, part, mnemonics, columnar)
+            for part in statements
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def select_partitioned(
+    engine: sqla.Engine,
+    statement: sqla.Select,
+    key: str | sqla.ColumnElement,
+    partitions: int = 4,
+    bounds: Sequence | None = None,
+    strategy: Literal["range", "modulo"] = "range",
+    max_workers: int | None = None,
+    mnemonics: dict | None = None,
+    columnar: bool = False,
+) -> pd.DataFrame:
+    """Execute a SELECT as concurrent partitions of a key column, returning a DataFrame.
+
+    Large selects are bound by the latency of a single connection. Splitting the statement
+    into disjoint ranges of a numeric or date key lets the partitions run concurrently on
+    separate pooled connections. Results are concatenated in partition order.
+
+    Note:
+        Each worker thread checks out its own connection, so the engine must point at a
+        database shared between connections (not ``sqlite:///:memory:``). Partitioning a
+        statement with a LIMIT applies the limit to each partition.
+
+    Args:
+        engine (sqlalchemy.Engine): Database connection engine.
+        statement (sqlalchemy.Select): The SELECT statement to partition.
+        key (str | sqlalchemy.ColumnElement): Name of a selected column, or a column
+            expression, to partition on.
+        partitions (int, optional): Number of partitions to split the key into.
+            Defaults to 4.
+        bounds (Sequence | None, optional): Split points for ``"range"`` partitioning.
+            When None, ``partitions`` equal ranges between the key's MIN and MAX are used.
+            Defaults to None.
+        strategy (Literal["range", "modulo"], optional): Partition by ranges of the key,
+            or by the key modulo ``partitions`` (integer keys). Defaults to "range".
+        max_workers (int | None, optional): Maximum concurrent queries. Defaults to the
+            smaller of the partition count and the engine's pool size.
+        mnemonics (dict | None, optional): Mnemonic mappings for database headers.
+            Defaults to None.
+        columnar (bool, optional): Use the columnar fetch path of :func:`select`.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame: Results of the SELECT query with optionally renamed columns.
+
+    Raises:
+        ValueError: If the partition strategy is unknown.
+    """
+    # Partitions are fetched without the dtype policy, which is applied once to the
+    # combined result so every partition ends up with the same dtypes.
+    untyped = statement.execution_options(dtypes=None)
+    statements = _partition_statements(engine, untyped, key, partitions, bounds, strategy)
+    with ThreadPoolExecutor(
+        max_workers=max_workers or pool_workers(engine, len(statements))
+    ) as executor:
+        frames = list(
+            executor.map(lambda part: select(engine, part, columnar=columnar), statements)
+        )
+
+    df = _concat_partitions(frames)
+    df = _apply_dtypes(df, statement)
+    _apply_mnemonics(df, mnemonics)
+    return df
+
+
+def _concat_partitions(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the non-empty partitions, casting all-NULL columns to a common dtype.
+
+    A column that is entirely NULL in one partition, such as the key in the NULL-key
+    partition, takes the dtype of the other partitions (widened to hold missing values)
+    instead of turning the combined column into object.
+    """
+    non_empty = [df for df in frames if not df.empty]
+    if not non_empty:
+        return frames[0]
+    if len(non_empty) == 1:
+        return non_empty[0].reset_index(drop=True)
+
+    for i in range(non_empty[0].shape[1]):
+        columns = [df.iloc[:, i] for df in non_empty]
+        all_na = [col.dtype == object and col.isna().all() for col in columns]
+        known = [col for col, na in zip(columns, all_na) if not na]
+        if not known or not any(all_na):
+            continue
+        dtypes = {col.dtype for col in known}
+        if len(dtypes) == 1:
+            dtype = dtypes.pop()
+        elif all(isinstance(d, np.dtype) and d.kind in "iuf" for d in dtypes):
+            dtype = np.result_type(*dtypes)
+        else:
+            dtype = np.dtype(object)
+        if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+            # NumPy integers and booleans cannot hold NULL, like a plain select.
+            dtype = np.dtype("float64" if dtype.kind != "b" else object)
+        for df, col, na in zip(non_empty, columns, all_na):
+            if na:
+                df.isetitem(i, col.astype(dtype))
+    return pd.concat(non_empty, ignore_index=True)
+
+
 def insert(
     engine: sqla.Engine,
     table_name: str,
     dataframe: pd.DataFrame,
-    if_exists: Literal["replace", "fail", "append"] = "replace",
-) -> None:
+    if_exists: Literal["replace", "fail", "append", "upsert"] = "replace",
+    strategy: Strategy = "auto",
+    chunksize: int | None = None,
+    keys: Sequence[str] | None = None,
+) -> InsertStats:
     """Execute an INSERT statement against a specific engine.
 
+    Rows are loaded with the fastest strategy the engine's dialect supports (see
+    :mod:`gswa_atratus.utils.bulk`), in batches of ``chunksize`` rows, within one
+    transaction. The load throughput is logged at INFO level and returned.
+
     Args:
         engine (sqlalchemy.Engine): Database connection engine.
         table_name (str): Name of the target table for insertion.
         dataframe (pd.DataFrame): DataFrame to insert into the table.
-        if_exists (Literal["replace", "fail", "append"], optional): Behavior if table
-            already exists. Defaults to "replace".
+        if_exists (Literal["replace", "fail", "append", "upsert"], optional): Behavior if
+            table already exists. "upsert" updates rows whose ``keys`` already exist and
+            inserts the rest, with one set-based MERGE / ON CONFLICT statement (see
+            :func:`gswa_atratus.utils.bulk.upsert_frame`). Defaults to "replace".
+        strategy (Strategy, optional): One of "auto", "driver", "fast_executemany", "copy",
+            "multi" or "executemany". Defaults to "auto".
+        chunksize (int | None, optional): Rows per batch. Defaults to a size tuned for
+            the strategy.
+        keys (Sequence[str] | None, optional): Columns identifying a row, required when
+            ``if_exists="upsert"``. Defaults to None.
 
     Returns:
-        None
+        InsertStats: Rows written, elapsed time, rows/sec and the strategy used.
 
     Raises:
         Exception: If insertion fails.
     """
     try:
         with engine.begin() as connection:
-            dataframe.to_sql(
-                name=table_name,
-                con=connection,
-                if_exists=if_exists,
-                method=None,
-                index=False,
-            )
+            if if_exists == "upsert":
+                stats = upsert_frame(
+                    connection, table_name, dataframe, keys, strategy, chunksize
+                )
+            else:
+                stats = write_frame(
+                    connection, table_name, dataframe, if_exists, strategy, chunksize
+                )
     except Exception as exc:
         raise exc
 
+    logger.info(
+        f"Inserted {stats.rows} rows into [{table_name}] in {stats.seconds:.2f}s"
+        f" ({stats.rows_per_second:,.0f} rows/s, strategy={stats.strategy})."
+    )
+    return stats
+
+
+@dataclass
+class _DeferredIndex:
+    """A non-unique index dropped by :func:`sqlite_bulk_load`, recreated on exit."""
+
+    name: str
+    table: str
+    columns: list[str]
+    sql: str
+
+
+@contextlib.contextmanager
+def sqlite_bulk_load(
+    engine: sqla.Engine, defer_indexes: bool = True
+) -> Iterator[sqla.Engine]:
+    """Apply a bulk-load profile to a local SQLite database for the duration of a block.
+
+    While the block runs, every new connection uses WAL journaling, ``synchronous=OFF``,
+    a 256 MiB page cache and in-memory temp storage, and non-unique indexes are dropped so
+    they are not maintained row by row. On exit (including on error) the indexes are
+    recreated in one pass, pooled connections are closed so later connections return to
+    SQLite's default (safe) settings, and the journal mode is set back to DELETE so the
+    deliverable is a single self-contained file.
+
+    In-memory databases are left unchanged, since closing their connections would discard
+    the data.
+
+    Example:
+        engine, metadata = gdt.connect(cfg_path, local_db_path="outputs/survey.db")
+        with gdt.sqlite_bulk_load(engine):
+            gdt.create_from_dataframe(engine, metadata, first_chunk, "survey")
+            gdt.insert(engine, "survey", remaining, if_exists="append")
+
+    Args:
+        engine (sqlalchemy.Engine): A SQLite engine, e.g. from ``connect(..., local_db_path=...)``.
+        defer_indexes (bool, optional): Drop non-unique indexes during the load and
+            recreate them afterwards. Defaults to True.
+
+    Yields:
+        sqlalchemy.Engine: The engine, with the bulk-load profile applied.
+
+    Raises:
+        ValueError: If the engine is not a SQLite engine.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError(f"sqlite_bulk_load needs a SQLite engine, got {engine.url}.")
+    if engine.url.database in (None, "", ":memory:"):
+        yield engine
+        return
+
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_BULK_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    # Close pooled connections so every connection used in the block gets the profile.
+    engine.dispose()
+    sqla.event.listen(engine, "connect", _apply_pragmas)
+    deferred: list[_DeferredIndex] = []
+    failed = False
+    try:
+        if defer_indexes:
+            with engine.begin() as conn:
+                indexes = conn.exec_driver_sql(
+                    "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index'"
+                    " AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'"
+                ).all()
+                quote = engine.dialect.identifier_preparer.quote
+                for name, table, sql in indexes:
+                    info = conn.exec_driver_sql(f"PRAGMA index_info({quote(name)})")
+                    # Expression columns have no name, and are not checked on exit.
+                    columns = [col for _, _, col in info if col is not None]
+                    deferred.append(_DeferredIndex(name, table, columns, sql))
+                    conn.exec_driver_sql(f"DROP INDEX {quote(name)}")
+        yield engine
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        try:
+            _end_sqlite_bulk_load(engine, _apply_pragmas, deferred)
+        except Exception:
+            # Never hide the error raised by the block behind a cleanup error.
+            if not failed:
+                raise
+            logger.exception("Could not restore the database after a failed bulk load.")
+
+
+def _end_sqlite_bulk_load(
+    engine: sqla.Engine, listener: Callable, deferred: list[_DeferredIndex]
+) -> None:
+    """Recreate deferred indexes and restore SQLite's default connection settings.
+
+    An index whose table or columns no longer exist, e.g. because the table was replaced
+    during the load, is skipped with a warning.
+    """
+    try:
+        if deferred:
+            with engine.begin() as conn:
+                quote = engine.dialect.identifier_preparer.quote
+                for index in deferred:
+                    table_info = conn.exec_driver_sql(
+                        f"PRAGMA table_info({quote(index.table)})"
+                    ).all()
+                    missing = set(index.columns) - {row[1] for row in table_info}
+                    if not table_info or missing:
+                        logger.warning(
+                            f"Index [{index.name}] was not recreated, because table"
+                            f" [{index.table}] or its columns {sorted(missing)} no longer"
+                            " exist."
+                        )
+                        continue
+                    conn.exec_driver_sql(index.sql)
+    finally:
+        sqla.event.remove(engine, "connect", listener)
+        engine.dispose()
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+        engine.dispose()
+
+
+class BulkWriter:
+    """Write a stream of DataFrame chunks to a table from a background thread.
+
+    Chunks passed to :meth:`write` go through a bounded queue to a writer thread, which
+    inserts them in batched transactions while the caller produces the next chunk. When
+    the queue is full :meth:`write` blocks, so memory stays bounded if the database is
+    slower than the producer.
+
+    An error in the writer thread is raised again in the caller by the next call to
+    :meth:`write`, :meth:`flush` or :meth:`close`. Chunks queued after the error are
+    discarded.
+
+    Example:
+        with gdt.database.BulkWriter(engine, "assays") as writer:
+            for chunk in gdt.select_iter(source_engine, statement):
+                writer.write(harmonise(chunk))
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        engine: sqla.Engine,
+        table_name: str,
+        if_exists: Literal["replace", "fail", "append", "upsert"] = "replace",
+        keys: Sequence[str] | None = None,
+        strategy: Strategy = "auto",
+        chunksize: int | None = None,
+        max_queue: int = 4,
+        batch_size: int = 4,
+    ):
+        """Start the writer thread.
+
+        Args:
+            engine (sqlalchemy.Engine): Database connection engine.
+            table_name (str): Name of the target table.
+            if_exists (Literal["replace", "fail", "append", "upsert"], optional): Behavior
+                if the table already exists, applied to the first chunk. Later chunks are
+                appended (or upserted). Defaults to "replace".
+            keys (Sequence[str] | None, optional): Key columns for ``"upsert"``.
+                Defaults to None.
+            strategy (Strategy, optional): Bulk-load strategy, see :func:`insert`.
+                Defaults to "auto".
+            chunksize (int | None, optional): Rows per batch within each write.
+                Defaults to a size tuned for the strategy.
+            max_queue (int, optional): Chunks that may wait in the queue. Defaults to 4.
+            batch_size (int, optional): Most chunks written per transaction. Defaults to 4.
+        """
+        self.engine = engine
+        self.table_name = table_name
+        self.if_exists = if_exists
+        self.keys = keys
+        self.strategy = strategy
+        self.chunksize = chunksize
+        self.batch_size = batch_size
+        self.stats: list[InsertStats] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"BulkWriter[{table_name}]", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def rows(self) -> int:
+        """Rows written so far."""
+        return sum(stats.rows for stats in self.stats)
+
+    def write(self, dataframe: pd.DataFrame) -> None:
+        """Queue a chunk for writing, blocking while the queue is full.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+            Exception: Any error raised by the writer thread.
+        """
+        self._raise_error()
+        if self._closed:
+            raise RuntimeError(f"BulkWriter for [{self.table_name}] is closed.")
+        self._queue.put(dataframe)
+
+    def flush(self) -> None:
+        """Block until every queued chunk has been written.
+
+        Raises:
+            Exception: Any error raised by the writer thread.
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write the remaining chunks and stop the writer thread.
+
+        Raises:
+            Exception: Any error raised by the writer thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> "BulkWriter":
+        """Return the writer, whose thread is already running."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the writer, flushing queued chunks unless the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            # Stop the thread, but let the caller's exception take precedence.
+            try:
+                self.close()
+            except Exception:
+                logger.exception(f"BulkWriter for [{self.table_name}] also failed.")
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _next_batch(self) -> tuple[list[pd.DataFrame], bool]:
+        """Take up to ``batch_size`` queued chunks, and whether the stop marker was seen."""
+        batch = []
+        item = self._queue.get()
+        while True:
+            if item is self._STOP:
+                return batch, True
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+
+    def _write_batch(self, batch: list[pd.DataFrame]) -> None:
+        batch_stats = []
+        with self.engine.begin() as conn:
+            for dataframe in batch:
+                if self.if_exists == "upsert":
+                    stats = upsert_frame(
+                        conn,
+                        self.table_name,
+                        dataframe,
+                        self.keys,
+                        self.strategy,
+                        self.chunksize,
+                    )
+                else:
+                    first = not self.stats and not batch_stats
+                    stats = write_frame(
+                        conn,
+                        self.table_name,
+                        dataframe,
+                        self.if_exists if first else "append",
+                        self.strategy,
+                        self.chunksize,
+                    )
+                batch_stats.append(stats)
+        self.stats.extend(batch_stats)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            try:
+                if batch and self._error is None:
+                    self._write_batch(batch)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                # One task_done per item taken, including the stop marker.
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+        if self._error is None:
+            logger.info(
+                f"BulkWriter wrote {self.rows} rows into [{self.table_name}]"
+                f" in {len(self.stats)} chunks."
+            )
+
 
 def write_db_metadata_table(
     engine: sqla.Engine,
     cygnet: types.ModuleType,
     run_datetime: str | datetime,
+    *,
+    table_name: str = "runtime_metadata",
     **metadata: dict[str, Any],
 ) -> None:
     """Record runtime metadata to generated database.
 
+    The table is replaced on each call, so pass all metadata for a table in one call.
+
     Args:
         engine (sqlalchemy.Engine): Database connection engine,SQLAlchemy Engine.
         cygnet (types.ModuleType): A module containing the codebase of the running code,
             expected to have `__name__` and `__version__` attributes.
         run_datetime (str | datetime): Timestamp to record the start of script execution (preferably an ISO UTC string).
+        table_name (str, optional): Table to write. Defaults to "runtime_metadata".
         **metadata (dict[str, Any]): Additional metadata to record, using the keyword argument as the metadata field name.
 
     Hint:
@@ -230,4 +1173,4 @@ def write_db_metadata_table(
     )
 
     meta_df = pd.DataFrame(meta, index=["Value at runtime:"])
-    gdt.insert(engine=engine, table_name="runtime_metadata", dataframe=meta_df)
+    gdt.insert(engine=engine, table_name=table_name, dataframe=meta_df)
@@ -1,7 +1,15 @@
 """Utility functions for gswa-atratus."""
 
-from gswa_atratus.utils.statements import statement_builder
+from gswa_atratus.utils.reflection import ReflectionCache
+from gswa_atratus.utils.statements import (
+    StatementCache,
+    clear_statement_cache,
+    statement_builder,
+)
 
 __all__ = [
+    "ReflectionCache",
+    "StatementCache",
+    "clear_statement_cache",
     "statement_builder",
 ]
@@ -0,0 +1,365 @@
+"""Dialect-aware bulk loading of DataFrames.
+
+``DataFrame.to_sql`` defaults to one SQLAlchemy ``executemany`` over dictionaries of
+parameters. This module picks a faster loading strategy for each dialect and the chunk
+size to batch rows in:
+
+- ``driver``: the DBAPI cursor's own ``executemany`` over plain tuples (SQLite).
+- ``fast_executemany``: as ``driver``, with pyodbc's array binding enabled (SQL Server).
+- ``copy``: ``COPY ... FROM STDIN`` through psycopg (PostgreSQL).
+- ``multi``: multi-row ``INSERT ... VALUES`` statements.
+- ``executemany``: the pandas/SQLAlchemy default.
+"""
+
+import csv
+import io
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import pandas as pd
+import sqlalchemy as sqla
+from sqlalchemy.dialects import postgresql, sqlite
+
+Strategy = Literal["auto", "driver", "fast_executemany", "copy", "multi", "executemany"]
+
+# Bound parameters allowed in one statement, used to size multi-row VALUES chunks.
+_MAX_PARAMS = {
+    "sqlite": 32766 if sqlite3.sqlite_version_info >= (3, 32) else 999,
+    "mssql": 2099,
+    "postgresql": 65535,
+}
+
+_DEFAULT_CHUNKSIZE = {
+    "driver": 50_000,
+    "fast_executemany": 10_000,
+    "copy": 100_000,
+    "executemany": 10_000,
+}
+
+
+@dataclass
+class InsertStats:
+    """Summary of one bulk load, returned by :func:`gswa_atratus.insert`."""
+
+    table_name: str
+    rows: int
+    seconds: float
+    strategy: str
+    chunksize: int | None
+
+    @property
+    def rows_per_second(self) -> float:
+        """Load throughput in rows per second."""
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def choose_strategy(dialect: sqla.Dialect) -> str:
+    """Pick the fastest supported loading strategy for a dialect."""
+    if dialect.name == "mssql" and dialect.driver == "pyodbc":
+        return "fast_executemany"
+    if dialect.name == "postgresql" and dialect.driver in ("psycopg2", "psycopg"):
+        return "copy"
+    if dialect.paramstyle in ("qmark", "format", "numeric"):
+        return "driver"
+    return "executemany"
+
+
+def choose_chunksize(dialect: sqla.Dialect, strategy: str, n_columns: int) -> int:
+    """Pick a chunk size for a strategy, keeping multi-row VALUES under parameter limits."""
+    if strategy == "multi":
+        rows = _MAX_PARAMS.get(dialect.name, 1000) // max(n_columns, 1)
+        if dialect.name == "mssql":
+            # SQL Server also caps a VALUES list at 1000 rows.
+            rows = min(rows, 1000)
+        return max(rows, 1)
+    return _DEFAULT_CHUNKSIZE[strategy]
+
+
+def _driver_executemany(fast: bool) -> Callable:
+    """Build a ``to_sql`` method that calls the DBAPI cursor's executemany directly.
+
+    SQLAlchemy's bind processors are applied per column, so values reach the driver in
+    the same form as through the default path.
+    """
+
+    def method(pd_table: Any, conn: sqla.Connection, keys: list[str], data_iter: Iterable):
+        table = pd_table.table
+        dialect = conn.dialect
+        compiled = table.insert().compile(dialect=dialect, column_keys=list(keys))
+        order = [keys.index(name) for name in compiled.positiontup]
+        processors = [
+            table.c[keys[i]].type.dialect_impl(dialect).bind_processor(dialect)
+            for i in order
+        ]
+
+        if order == list(range(len(keys))) and not any(processors):
+            rows = list(data_iter)
+        else:
+            rows = [
+                tuple(
+                    value if proc is None else proc(value)
+                    for value, proc in zip((row[i] for i in order), processors)
+                )
+                for row in data_iter
+            ]
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            if fast:
+                cursor.fast_executemany = True
+            cursor.executemany(str(compiled), rows)
+        finally:
+            cursor.close()
+        return len(rows)
+
+    return method
+
+
+def _postgres_copy(
+    pd_table: Any, conn: sqla.Connection, keys: list[str], data_iter: Iterable
+) -> int:
+    """``to_sql`` method loading rows with ``COPY ... FROM STDIN`` (psycopg2 or psycopg 3).
+
+    Strings are always quoted and NULL is written as an unquoted empty field, which COPY
+    reads as NULL in CSV format, so empty strings and NULL stay distinct.
+    """
+    buffer = io.StringIO()
+    rows = csv.writer(buffer, quoting=csv.QUOTE_STRINGS)
+    n_rows = 0
+    for row in data_iter:
+        rows.writerow(row)
+        n_rows += 1
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    sql = f"COPY {preparer.format_table(pd_table.table)} ({columns}) FROM STDIN WITH CSV"
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(sql, buffer)
+        else:
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+    return n_rows
+
+
+_METHODS: dict[str, Callable | str | None] = {
+    "driver": _driver_executemany(fast=False),
+    "fast_executemany": _driver_executemany(fast=True),
+    "copy": _postgres_copy,
+    "multi": "multi",
+    "executemany": None,
+}
+
+
+def write_frame(
+    conn: sqla.Connection,
+    table_name: str,
+    dataframe: pd.DataFrame,
+    if_exists: Literal["replace", "fail", "append"] = "replace",
+    strategy: Strategy = "auto",
+    chunksize: int | None = None,
+) -> InsertStats:
+    """Write a DataFrame to a table on an open connection with a bulk-load strategy.
+
+    Args:
+        conn (sqlalchemy.Connection): An open connection, usually inside a transaction.
+        table_name (str): Name of the target table for insertion.
+        dataframe (pd.DataFrame): DataFrame to insert into the table.
+        if_exists (Literal["replace", "fail", "append"], optional): Behavior if table
+            already exists. Defaults to "replace".
+        strategy (Strategy, optional): Loading strategy, or "auto" to choose one for the
+            connection's dialect. Defaults to "auto".
+        chunksize (int | None, optional): Rows per batch. Defaults to a size tuned for
+            the strategy.
+
+    Returns:
+        InsertStats: Rows written, elapsed time and the strategy used.
+
+    Raises:
+        ValueError: If the strategy is unknown.
+    """
+    if strategy == "auto":
+        strategy = choose_strategy(conn.dialect)
+    if strategy not in _METHODS:
+        raise ValueError(f"Unknown insert strategy {strategy!r}.")
+    if chunksize is None:
+        chunksize = choose_chunksize(conn.dialect, strategy, len(dataframe.columns))
+
+    start = time.perf_counter()
+    dataframe.to_sql(
+        name=table_name,
+        con=conn,
+        if_exists=if_exists,
+        method=_METHODS[strategy],
+        chunksize=chunksize,
+        index=False,
+    )
+    return InsertStats(
+        table_name=table_name,
+        rows=len(dataframe),
+        seconds=time.perf_counter() - start,
+        strategy=strategy,
+        chunksize=chunksize,
+    )
+
+
+def _has_unique_key(conn: sqla.Connection, table_name: str, keys: Sequence[str]) -> bool:
+    """Whether a primary key, unique constraint or unique index covers exactly ``keys``."""
+    inspector = sqla.inspect(conn)
+    key_set = set(keys)
+    candidates = [inspector.get_pk_constraint(table_name)["constrained_columns"]]
+    candidates += [u["column_names"] for u in inspector.get_unique_constraints(table_name)]
+    candidates += [
+        i["column_names"] for i in inspector.get_indexes(table_name) if i["unique"]
+    ]
+    return any(set(columns) == key_set for columns in candidates)
+
+
+def _merge_sql(
+    conn: sqla.Connection,
+    target: sqla.Table,
+    staging: sqla.Table,
+    columns: list[str],
+    keys: Sequence[str],
+) -> str:
+    """Render a SQL Server MERGE of the staging table into the target table."""
+    preparer = conn.dialect.identifier_preparer
+    q = preparer.quote
+    on = " AND ".join(f"target.{q(k)} = source.{q(k)}" for k in keys)
+    updates = ", ".join(f"target.{q(c)} = source.{q(c)}" for c in columns if c not in keys)
+    names = ", ".join(q(c) for c in columns)
+    values = ", ".join(f"source.{q(c)}" for c in columns)
+
+    sql = (
+        f"MERGE INTO {preparer.format_table(target)} WITH (HOLDLOCK) AS target"
+        f" USING {preparer.format_table(staging)} AS source ON ({on})"
+    )
+    if updates:
+        sql += f" WHEN MATCHED THEN UPDATE SET {updates}"
+    return sql + f" WHEN NOT MATCHED THEN INSERT ({names}) VALUES ({values});"
+
+
+def upsert_frame(
+    conn: sqla.Connection,
+    table_name: str,
+    dataframe: pd.DataFrame,
+    keys: Sequence[str],
+    strategy: Strategy = "auto",
+    chunksize: int | None = None,
+) -> InsertStats:
+    """Insert new rows and update existing rows of a table, matched on key columns.
+
+    The DataFrame is bulk loaded into a staging table, then applied to the target
+    with one set-based statement per dialect:
+
+    - SQL Server: ``MERGE``.
+    - SQLite/PostgreSQL, where a primary key or unique index covers ``keys``:
+      ``INSERT ... ON CONFLICT DO UPDATE``.
+    - Otherwise: a correlated ``UPDATE`` of matched rows followed by an
+      ``INSERT ... SELECT`` of unmatched rows.
+
+    The cost is proportional to the number of rows in the DataFrame, not the table. When
+    the target table does not exist yet it is created from the DataFrame.
+
+    Args:
+        conn (sqlalchemy.Connection): An open connection, usually inside a transaction.
+        table_name (str): Name of the target table.
+        dataframe (pd.DataFrame): Rows to insert or update. Rows with duplicate keys keep
+            the last occurrence.
+        keys (Sequence[str]): Columns identifying a row.
+        strategy (Strategy, optional): Strategy used to load the staging table.
+            Defaults to "auto".
+        chunksize (int | None, optional): Rows per batch when loading the staging table.
+            Defaults to a size tuned for the strategy.
+
+    Returns:
+        InsertStats: Rows applied, elapsed time and the statement type used.
+
+    Raises:
+        ValueError: If no keys are given, or a key is not a column of the DataFrame.
+    """
+    keys = list(keys or [])
+    columns = [str(c) for c in dataframe.columns]
+    missing = [k for k in keys if k not in columns]
+    if not keys or missing:
+        raise ValueError(
+            f"Upsert needs key columns present in the DataFrame. Missing: {missing or keys}."
+        )
+
+    start = time.perf_counter()
+    if not sqla.inspect(conn).has_table(table_name):
+        stats = write_frame(conn, table_name, dataframe, "fail", strategy, chunksize)
+        stats.strategy = "upsert:create"
+        return stats
+
+    dataframe = dataframe.drop_duplicates(subset=keys, keep="last")
+    staging_name = f"_{table_name}_staging_{uuid.uuid4().hex[:8]}"
+    write_frame(conn, staging_name, dataframe, "fail", strategy, chunksize)
+    metadata = sqla.MetaData()
+    target = sqla.Table(table_name, metadata, autoload_with=conn)
+    staging = sqla.Table(staging_name, metadata, autoload_with=conn)
+    updates = [c for c in columns if c not in keys]
+    dialect = conn.dialect.name
+
+    if dialect == "mssql":
+        conn.exec_driver_sql(_merge_sql(conn, target, staging, columns, keys))
+        applied = "merge"
+    elif dialect in ("sqlite", "postgresql") and _has_unique_key(
+        conn, table_name, keys
+    ):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        # WHERE true keeps SQLite from parsing ON CONFLICT as part of the SELECT.
+        stmt = dialect_insert(target).from_select(
+            columns,
+            sqla.select(*(staging.c[c] for c in columns)).where(sqla.true()),
+        )
+        if updates:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=keys, set_={c: stmt.excluded[c] for c in updates}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+        conn.execute(stmt)
+        applied = "on_conflict"
+    else:
+        match = sqla.and_(*(target.c[k] == staging.c[k] for k in keys))
+        if updates:
+            conn.execute(
+                sqla.update(target)
+                .where(sqla.exists().where(match))
+                .values(
+                    {
+                        c: sqla.select(staging.c[c]).where(match).scalar_subquery()
+                        for c in updates
+                    }
+                )
+            )
+        conn.execute(
+            sqla.insert(target).from_select(
+                columns,
+                sqla.select(*(staging.c[c] for c in columns)).where(
+                    ~sqla.exists().where(match)
+                ),
+            )
+        )
+        applied = "update_insert"
+
+    # On failure the enclosing transaction rolls the staging table back with everything else.
+    conn.execute(sqla.schema.DropTable(staging))
+
+    return InsertStats(
+        table_name=table_name,
+        rows=len(dataframe),
+        seconds=time.perf_counter() - start,
+        strategy=f"upsert:{applied}",
+        chunksize=chunksize,
+    )
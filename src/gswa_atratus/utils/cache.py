@@ -0,0 +1,289 @@
+"""On-disk caches with expiry and size-bounded eviction.
+
+``DiskCache`` stores one file per key in a cache directory. Entries older than the
+configured time-to-live are ignored, and when the directory grows beyond its size budget
+the least recently used entries are removed first. Last use is tracked through the file
+access time, which is updated explicitly on every read so it does not depend on how the
+filesystem is mounted.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import sqlalchemy as sqla
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """A directory of cache files, keyed by a hex digest."""
+
+    suffix = ".bin"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """Initialise the cache directory and its eviction settings.
+
+        Args:
+            cache_dir (str | Path): Directory to store cache files in. Created if missing.
+            ttl (float | None, optional): Seconds an entry stays valid after it is written.
+                None keeps entries until they are evicted or invalidated. Defaults to None.
+            max_bytes (int | None, optional): Size budget for the directory. The least
+                recently used entries are removed once it is exceeded. Defaults to None.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def hash_key(*parts: Any) -> str:
+        """Hash the string form of each part into a cache key."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Path of the cache file for a key."""
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def lookup(self, key: str) -> Path | None:
+        """Return the path of a valid entry, marking it as recently used.
+
+        Expired entries are removed and reported as missing.
+        """
+        path = self.path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        if self.ttl is not None and time.time() - stat.st_mtime > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Record the read as the last use, leaving the write time (used for TTL) intact.
+        os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+        return path
+
+    def store(self, key: str, write: Callable[[Path], Any]) -> Path:
+        """Write an entry atomically, then evict entries over the size budget.
+
+        Args:
+            key (str): Cache key.
+            write (Callable[[Path], None]): Function writing the entry to the given path.
+
+        Returns:
+            Path: Path of the stored entry.
+        """
+        path = self.path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            write(Path(tmp))
+            os.replace(tmp, path)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+        self.evict()
+        return path
+
+    def entries(self) -> list[Path]:
+        """List the cache files currently in the directory."""
+        return list(self.cache_dir.glob(f"*{self.suffix}"))
+
+    def evict(self) -> None:
+        """Remove expired entries, then least recently used entries over the size budget."""
+        now = time.time()
+        live = []
+        for path in self.entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+            else:
+                live.append((stat.st_atime, stat.st_size, path))
+
+        if self.max_bytes is None:
+            return
+        total = sum(size for _, size, _ in live)
+        for _, size, path in sorted(live):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove one entry, or every entry when no key is given."""
+        paths = self.entries() if key is None else [self.path(key)]
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a valid entry exists for a key."""
+        return self.lookup(key) is not None
+
+
+class QueryCache(DiskCache):
+    """A DiskCache of SELECT results, keyed on the compiled SQL, parameters and engine URL.
+
+    Results are stored as Parquet when ``pyarrow`` is installed, otherwise as pandas
+    pickles. Pass an instance to :func:`gswa_atratus.select` to read repeated queries from
+    local disk instead of the database.
+
+    Example:
+        cache = gdt.QueryCache("cache/queries", ttl=24 * 3600, max_bytes=2 * 1024**3)
+        df = gdt.select(engine, statement, cache=cache)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """Initialise the query cache. See :class:`DiskCache` for the arguments."""
+        super().__init__(cache_dir, ttl, max_bytes)
+        self.use_parquet = importlib.util.find_spec("pyarrow") is not None
+        self.suffix = ".parquet" if self.use_parquet else ".pkl"
+
+    def key(
+        self,
+        engine: sqla.Engine,
+        statement: Any,
+        columnar: bool = False,
+        params: dict | None = None,
+    ) -> str:
+        """Build the cache key of a statement executed against an engine.
+
+        This is the key :func:`gswa_atratus.select` stores results under, so an entry can
+        be removed with ``cache.invalidate(cache.key(engine, statement, ...))`` using the
+        same ``columnar`` and ``params`` as the ``select`` call.
+
+        Args:
+            engine (sqlalchemy.Engine): The engine the statement runs against.
+            statement (Any): A SQLAlchemy statement or raw SQL text.
+            columnar (bool, optional): Whether the columnar fetch path is used.
+                Defaults to False.
+            params (dict | None, optional): Values for the statement's bind parameters,
+                as passed to ``select(..., params=...)``. Defaults to None.
+
+        Returns:
+            str: The cache key.
+        """
+        if isinstance(statement, str):
+            sql, bound = statement, {}
+        else:
+            compiled = statement.compile(dialect=engine.dialect)
+            sql, bound = str(compiled), compiled.params
+        return self.hash_key(
+            engine.url.render_as_string(hide_password=True),
+            sql,
+            sorted(bound.items()),
+            columnar,
+            None if params is None else sorted(params.items()),
+        )
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Read a cached result, or None if it is missing or expired."""
+        path = self.lookup(key)
+        if path is None:
+            return None
+        if self.use_parquet:
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+
+    def put(self, key: str, dataframe: pd.DataFrame) -> None:
+        """Store a result under a key.
+
+        Caching is best effort: if the result cannot be written, e.g. a column mixing
+        types that Parquet cannot store or a full disk, a warning is logged and the result
+        is not cached.
+        """
+        try:
+            if self.use_parquet:
+                self.store(key, lambda path: dataframe.to_parquet(path, index=False))
+            else:
+                self.store(key, dataframe.to_pickle)
+        except (
+            OSError,
+            ValueError,
+            TypeError,
+            NotImplementedError,
+            pickle.PicklingError,
+        ) as exc:
+            logger.warning(f"Result was not cached, as it could not be written: {exc!r}")
+
+
+# Returned by StepCache.get for a missing entry, as any picklable output may be cached.
+MISSING = object()
+
+
+class StepCache(DiskCache):
+    """A DiskCache of cygnet Step outputs, stored as pickles.
+
+    Keys are chained: the key of a Step's output hashes the key of its input with the
+    Step's identity (see :meth:`gswa_atratus.cygnet.Step.cache_identity`), starting from a
+    fingerprint of the Process input. Pass an instance to
+    :class:`gswa_atratus.cygnet.Process` to skip Steps whose output is already cached.
+
+    Example:
+        cache = StepCache("cache/steps", max_bytes=50 * 1024**3)
+        process = Process("survey", logger, step_cache=cache, input_=path)
+    """
+
+    suffix = ".step.pkl"
+
+    @classmethod
+    def fingerprint(cls, value: Any) -> str:
+        """Hash a Process input.
+
+        Files are identified by path, size and modification time, DataFrames by their
+        contents, and other values by their pickled bytes (or ``repr`` if unpicklable).
+        """
+        if isinstance(value, Path):
+            try:
+                stat = value.stat()
+            except OSError:
+                return cls.hash_key("path", value.resolve())
+            return cls.hash_key("file", value.resolve(), stat.st_size, stat.st_mtime_ns)
+        try:
+            if isinstance(value, pd.DataFrame):
+                rows = pd.util.hash_pandas_object(value, index=True).to_numpy()
+                digest = hashlib.sha256(rows.tobytes()).hexdigest()
+                return cls.hash_key("frame", list(value.columns), digest)
+            return hashlib.sha256(pickle.dumps(value)).hexdigest()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return cls.hash_key("repr", repr(value))
+
+    def get(self, key: str) -> Any:
+        """Read a cached output, or ``MISSING`` if it is missing, expired or unreadable."""
+        path = self.lookup(key)
+        if path is None:
+            return MISSING
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return MISSING
+
+    def put(self, key: str, output: Any) -> None:
+        """Store a Step output under a key."""
+        self.store(key, lambda path: path.write_bytes(pickle.dumps(output)))
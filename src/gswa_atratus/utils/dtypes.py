@@ -0,0 +1,313 @@
+"""Build DataFrames from query results using the reflected SQL column types.
+
+``pd.DataFrame(rows)`` infers every column from Python objects, one value at a time.
+When the statement was built from reflected tables (see :func:`gswa_atratus.load_statement`)
+the SQL type of every column is already known, so the dtype of each column can be chosen
+up front and filled directly from the DBAPI cursor, column by column.
+"""
+
+import datetime
+import importlib.util
+from collections.abc import Callable, Sequence
+from typing import Any, Literal, get_args
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sqla
+
+# Python types reported by SQLAlchemy, mapped to the NumPy dtype used to hold them.
+_NUMPY_DTYPES: dict[type, np.dtype] = {
+    int: np.dtype("int64"),
+    float: np.dtype("float64"),
+    bool: np.dtype("bool"),
+    datetime.datetime: np.dtype("datetime64[ns]"),
+}
+
+# Datetimes outside this range cannot be held as datetime64[ns].
+_NS_MIN = np.datetime64(pd.Timestamp.min.ceil("us").to_pydatetime(), "us")
+_NS_MAX = np.datetime64(pd.Timestamp.max.floor("us").to_pydatetime(), "us")
+
+
+def column_python_types(statement: Any) -> list[type | None]:
+    """List the Python type of each column selected by a statement.
+
+    Args:
+        statement (Any): A SQLAlchemy statement. Statements without typed columns (such as
+            raw SQL text) return an empty list.
+
+    Returns:
+        list[type | None]: Python type per selected column, None where unknown.
+    """
+    columns = getattr(statement, "selected_columns", None)
+    if columns is None:
+        return []
+
+    python_types: list[type | None] = []
+    for column in columns:
+        try:
+            python_types.append(column.type.python_type)
+        except NotImplementedError:
+            python_types.append(None)
+    return python_types
+
+
+def _result_processors(
+    statement: Any, dialect: sqla.Dialect, description: Sequence
+) -> list[Callable | None]:
+    """Collect the dialect result processors SQLAlchemy would apply to each column."""
+    columns = getattr(statement, "selected_columns", None)
+    if columns is None:
+        return [None] * len(description)
+    return [
+        column.type.dialect_impl(dialect).result_processor(dialect, desc[1])
+        for column, desc in zip(columns, description)
+    ]
+
+
+def _object_array(values: Sequence) -> np.ndarray:
+    """Copy values into a 1D object array without NumPy unpacking nested sequences."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _typed_array(
+    values: Sequence, python_type: type | None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Convert one column of values to a typed array, with a NULL mask where needed.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray | None]: The values and, for integer and boolean
+            columns containing NULL, a boolean mask of the NULL positions.
+    """
+    dtype = _NUMPY_DTYPES.get(python_type)
+    if dtype is None:
+        return _object_array(values), None
+
+    if dtype.kind == "M":
+        # Convert at microsecond resolution, which holds any Python datetime, as NumPy
+        # silently overflows datetime64[ns] for dates such as 9999-12-31.
+        try:
+            array = np.array(values, dtype="datetime64[us]")
+        except (TypeError, ValueError):
+            return _object_array(values), None
+        valid = array[~np.isnat(array)]
+        if valid.size and (valid.min() < _NS_MIN or valid.max() > _NS_MAX):
+            return _object_array(values), None
+        return array.astype(dtype), None
+
+    if dtype.kind == "f":
+        # NumPy converts None to NaN when filling float arrays.
+        try:
+            return np.array(values, dtype=dtype), None
+        except (TypeError, ValueError):
+            return _object_array(values), None
+
+    # Let NumPy infer first so that values not matching the declared type (e.g. floats
+    # in an integer column under SQLite's dynamic typing) are never silently truncated.
+    array = np.array(values)
+    if array.dtype.kind == dtype.kind:
+        return array.astype(dtype, copy=False), None
+    if array.dtype != object:
+        return _object_array(values), None
+
+    # NULLs in an integer/boolean column: fill with zero (or False) and keep a mask.
+    mask = np.equal(array, None)
+    array[mask] = False if dtype.kind == "b" else 0
+    filled = np.array(array.tolist())
+    if filled.dtype.kind != dtype.kind:
+        return _object_array(values), None
+    return filled.astype(dtype, copy=False), mask
+
+
+def _finalise_column(
+    arrays: list[np.ndarray], masks: list[np.ndarray | None], python_type: type | None
+) -> Any:
+    """Join the per-batch arrays of a column into a single array for the DataFrame."""
+    if not arrays:
+        dtype = _NUMPY_DTYPES.get(python_type, np.dtype(object))
+        return np.empty(0, dtype=dtype)
+
+    # Batches may have fallen back to object dtype independently.
+    if len({a.dtype for a in arrays}) > 1:
+        arrays = [pd.Series(a, copy=False).astype(object).to_numpy() for a in arrays]
+        for array, mask in zip(arrays, masks):
+            if mask is not None:
+                array[mask] = None
+        masks = [None] * len(arrays)
+
+    values = np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+    if values.dtype == object:
+        return pd.Series(values, copy=False).infer_objects().array
+
+    if any(mask is not None for mask in masks):
+        mask = np.concatenate(
+            [
+                np.zeros(len(a), dtype=bool) if m is None else m
+                for a, m in zip(arrays, masks)
+            ]
+        )
+        if values.dtype.kind == "b":
+            return pd.arrays.BooleanArray(values, mask)
+        return pd.arrays.IntegerArray(values, mask)
+    return values
+
+
+def frame_from_result(
+    result: sqla.CursorResult,
+    statement: Any,
+    dialect: sqla.Dialect,
+    batch_size: int = 100_000,
+) -> pd.DataFrame:
+    """Build a DataFrame column by column from the DBAPI cursor behind a result.
+
+    Rows are fetched from the cursor as plain tuples, ``batch_size`` at a time, and each
+    batch is transposed into one typed NumPy array per column. The dtype of a column is
+    chosen from the SQL type of the selected column, so no SQLAlchemy ``Row`` objects are
+    created and pandas does not need to infer dtypes from Python objects.
+
+    Integer and boolean columns containing NULL use the pandas nullable ``Int64`` and
+    ``boolean`` dtypes. Columns without a known type fall back to pandas inference.
+
+    Args:
+        result (sqlalchemy.CursorResult): An executed, un-consumed SELECT result.
+        statement (Any): The statement that produced ``result``.
+        dialect (sqlalchemy.Dialect): Dialect of the engine the statement ran on.
+        batch_size (int, optional): Rows fetched from the cursor per batch. Defaults to 100_000.
+
+    Returns:
+        pd.DataFrame: The query results.
+    """
+    keys = list(result.keys())
+    cursor = result.cursor
+    python_types = column_python_types(statement) or [None] * len(keys)
+    processors = _result_processors(statement, dialect, cursor.description)
+
+    arrays: list[list[np.ndarray]] = [[] for _ in keys]
+    masks: list[list[np.ndarray | None]] = [[] for _ in keys]
+    try:
+        while rows := cursor.fetchmany(batch_size):
+            for i, values in enumerate(zip(*rows)):
+                if processors[i] is not None:
+                    values = [processors[i](v) for v in values]
+                array, mask = _typed_array(values, python_types[i])
+                arrays[i].append(array)
+                masks[i].append(mask)
+    finally:
+        result.close()
+
+    data = {
+        i: _finalise_column(arrays[i], masks[i], python_types[i])
+        for i in range(len(keys))
+    }
+    df = pd.DataFrame(data, copy=False)
+    df.columns = keys
+    return df
+
+
+DtypePolicy = Literal["infer", "compact"]
+
+_NULLABLE_INTS = ("Int8", "Int16", "Int32", "Int64")
+
+
+def _smallest_int(series: pd.Series, nullable: bool) -> str:
+    """Name of the smallest integer dtype holding every value of an integer series."""
+    low, high = series.min(), series.max()
+    for name in _NULLABLE_INTS:
+        info = np.iinfo(name.lower())
+        if pd.isna(low) or (info.min <= low and high <= info.max):
+            return name if nullable else name.lower()
+    return "Int64" if nullable else "int64"
+
+
+def _compact_column(
+    series: pd.Series, python_type: type | None, category_ratio: float
+) -> pd.Series:
+    """Convert one column to the most compact dtype that loses no information."""
+    kind = series.dtype.kind
+    value_types = set(series.dropna().map(type)) if kind == "O" else set()
+    if python_type is None and value_types in ({int}, {bool}):
+        python_type = value_types.pop()
+
+    if python_type is int or pd.api.types.is_integer_dtype(series.dtype):
+        if kind in "Of":
+            # NULLs (or SQLite dynamic typing) left the column as object/float.
+            values = pd.to_numeric(series, errors="coerce")
+            whole = values.dropna()
+            if len(whole) != series.notna().sum() or not (whole % 1 == 0).all():
+                return series
+            series = values.astype("Int64")
+        nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+        return series.astype(_smallest_int(series, nullable))
+
+    if python_type is float or kind == "f":
+        if kind != "f":
+            return series
+        narrow = series.astype("float32")
+        lossless = (narrow.astype("float64") == series) | series.isna()
+        return narrow if lossless.all() else series
+
+    if python_type is bool:
+        return series.astype("boolean") if kind == "O" else series
+
+    if kind == "O" and value_types == {str}:
+        non_null = series.dropna()
+        if non_null.nunique() <= category_ratio * len(non_null):
+            return series.astype("category")
+        if importlib.util.find_spec("pyarrow") is not None:
+            return series.astype("string[pyarrow]")
+    return series
+
+
+def apply_dtype_policy(
+    df: pd.DataFrame,
+    statement: Any = None,
+    policy: DtypePolicy = "compact",
+    overrides: dict[str, str] | None = None,
+    category_ratio: float = 0.5,
+) -> pd.DataFrame:
+    """Convert the columns of a query result to compact dtypes.
+
+    With the ``"compact"`` policy, using the reflected SQL type of each column where the
+    statement provides it:
+
+    - Integers are downcast to the smallest of int8/16/32/64, or the nullable
+      ``Int8``..``Int64`` when they contain NULL.
+    - Floats become float32 when every value survives the round trip unchanged.
+    - Booleans containing NULL become the nullable ``boolean`` dtype.
+    - Strings become ``category`` when there are at most ``category_ratio`` distinct
+      values per row, and pyarrow-backed strings otherwise (when pyarrow is installed).
+
+    ``"infer"`` leaves the dtypes pandas inferred. Overrides are applied last, and take
+    any dtype accepted by ``Series.astype``.
+
+    Args:
+        df (pd.DataFrame): Result of a SELECT, with the database column names.
+        statement (Any, optional): The statement that produced ``df``. Defaults to None.
+        policy (DtypePolicy, optional): "compact" or "infer". Defaults to "compact".
+        overrides (dict[str, str] | None, optional): Dtype per column name.
+            Defaults to None.
+        category_ratio (float, optional): Maximum ratio of distinct values to rows for
+            a string column to become categorical. Defaults to 0.5.
+
+    Returns:
+        pd.DataFrame: The converted DataFrame.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy not in get_args(DtypePolicy):
+        raise ValueError(
+            f"Unknown dtype policy [{policy}], expected one of {get_args(DtypePolicy)}."
+        )
+    python_types = column_python_types(statement) or [None] * df.shape[1]
+    if len(python_types) != df.shape[1]:
+        python_types = [None] * df.shape[1]
+
+    if policy == "compact":
+        for i, python_type in enumerate(python_types):
+            df.isetitem(i, _compact_column(df.iloc[:, i], python_type, category_ratio))
+    for column, dtype in (overrides or {}).items():
+        if column in df.columns:
+            df[column] = df[column].astype(dtype)
+    return df
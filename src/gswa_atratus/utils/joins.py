@@ -0,0 +1,171 @@
+"""Validation and ordering of the joins in a statement config.
+
+Joins are written in config as ``{"table_2": [["table_2", "col"], ["table_1", "col"]]}``,
+optionally with ``"type": "inner"`` (the default is ``"outer"``). Before a statement is
+built, duplicate joins are dropped, repeated joins of one table are merged, joins that
+cannot be reached from the first selected table are rejected, and the remaining joins are
+ordered so that every join follows the tables it depends on, with inner joins (which can
+only remove rows) as early as their dependencies allow.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Literal, get_args
+
+import sqlalchemy as sqla
+
+import gswa_atratus as gdt
+
+logger = logging.getLogger(__name__)
+
+JoinType = Literal["inner", "outer"]
+ColumnRef = tuple[str, str]
+
+
+@dataclass
+class Join:
+    """A join of ``table`` onto the statement, on one or more column equalities."""
+
+    table: str
+    on: list[tuple[ColumnRef, ColumnRef]] = field(default_factory=list)
+    how: JoinType = "outer"
+
+    @property
+    def depends_on(self) -> set[str]:
+        """Tables that must already be in the statement before this join."""
+        return {ref[0] for pair in self.on for ref in pair} - {self.table}
+
+    def joined_columns(self) -> set[str]:
+        """Columns of ``table`` used in the join condition."""
+        return {ref[1] for pair in self.on for ref in pair if ref[0] == self.table}
+
+
+def parse_joins(joins: list[dict]) -> list[Join]:
+    """Parse the ``joins`` section of a statement config, merging repeated joins.
+
+    A join repeated with the same condition is dropped. A table joined more than once
+    with different conditions is joined once, on all of the conditions.
+
+    Args:
+        joins (list[dict]): Configured gswa-atratus list of joins.
+
+    Returns:
+        list[Join]: One join per joined table, in config order.
+
+    Raises:
+        gdt.KnownException: If a join is malformed, its condition does not use the joined
+            table, or a table is joined both as inner and outer.
+    """
+    parsed: dict[str, Join] = {}
+    for j in joins:
+        tables = [k for k in j if k != "type"]
+        how = j.get("type", "outer")
+        if len(tables) != 1 or how not in get_args(JoinType):
+            raise gdt.KnownException(
+                f"Join {j} should name one table, and an optional"
+                f" \"type\" of {list(get_args(JoinType))}."
+            )
+        table = tables[0]
+        try:
+            (left_t, left_c), (right_t, right_c) = j[table]
+        except (TypeError, ValueError) as exc:
+            raise gdt.KnownException(
+                f"Join {j} should map [[table, column], [table, column]]."
+            ) from exc
+        pair = ((left_t, left_c), (right_t, right_c))
+        if (left_t == table) == (right_t == table):
+            raise gdt.KnownException(
+                f"Join {j} is not connected: its condition should compare a column of"
+                f" [{table}] with a column of another table."
+            )
+
+        if table not in parsed:
+            parsed[table] = Join(table, [pair], how)
+            continue
+        existing = parsed[table]
+        if existing.how != how:
+            raise gdt.KnownException(
+                f"Table [{table}] is joined as both inner and outer in the config."
+            )
+        if any(set(pair) == set(other) for other in existing.on):
+            logger.warning(f"Duplicate join of [{table}] in config was ignored.")
+        else:
+            logger.warning(
+                f"Table [{table}] is joined more than once; its join conditions were"
+                " combined into one join."
+            )
+            existing.on.append(pair)
+    return list(parsed.values())
+
+
+def _is_unique(table: sqla.Table, columns: set[str]) -> bool:
+    """Whether ``columns`` include the primary key or a unique key of ``table``."""
+    keys = [{c.name for c in table.primary_key.columns}]
+    keys += [{c.name for c in i.columns} for i in table.indexes if i.unique]
+    keys += [
+        {c.name for c in uc.columns}
+        for uc in table.constraints
+        if isinstance(uc, sqla.UniqueConstraint)
+    ]
+    return any(key and key <= columns for key in keys)
+
+
+def plan_joins(
+    joins: list[Join], base: str, tables: dict[str, sqla.Table], selected: list[str]
+) -> list[Join]:
+    """Order joins so each follows its dependencies, with inner joins first.
+
+    Logs a warning for joins that are likely to fan out, i.e. whose condition does not
+    cover a primary or unique key of the joined table, and for selected tables that are
+    not joined at all (which produces a cartesian product).
+
+    Args:
+        joins (list[Join]): Joins from :func:`parse_joins`.
+        base (str): The first selected table, which all joins must connect back to.
+        tables (dict[str, sqlalchemy.Table]): Reflected tables by name.
+        selected (list[str]): Tables in the selection.
+
+    Returns:
+        list[Join]: The joins in the order to apply them.
+
+    Raises:
+        gdt.KnownException: If a join joins the base table, or some joins cannot be
+            connected to the base table.
+    """
+    pending = list(joins)
+    if any(j.table == base for j in pending):
+        raise gdt.KnownException(
+            f"Table [{base}] is the first table in the selection, and cannot also be joined."
+        )
+
+    joined = {base}
+    planned: list[Join] = []
+    while pending:
+        ready = [j for j in pending if j.depends_on <= joined]
+        if not ready:
+            raise gdt.KnownException(
+                f"Joins of tables {[j.table for j in pending]} are not connected to"
+                f" [{base}]: each join should compare with a table that is selected first"
+                " or joined earlier."
+            )
+        chosen = next((j for j in ready if j.how == "inner"), ready[0])
+        pending.remove(chosen)
+        planned.append(chosen)
+        joined.add(chosen.table)
+
+        columns = chosen.joined_columns()
+        table = tables.get(chosen.table)
+        if table is not None and not _is_unique(table, columns):
+            logger.warning(
+                f"Join of [{chosen.table}] on {sorted(columns)} is not on a primary or"
+                f" unique key, so each row of {sorted(chosen.depends_on)} may match many"
+                f" rows of [{chosen.table}] and multiply the result size."
+            )
+
+    unjoined = [t for t in selected if t not in joined]
+    if unjoined:
+        logger.warning(
+            f"Selected tables {unjoined} are not joined to [{base}], so every row of them"
+            " is combined with every row of the others (a cartesian product)."
+        )
+    return planned
@@ -0,0 +1,19 @@
+"""Sizing of thread pools that run work on an engine's pooled connections."""
+
+import sqlalchemy as sqla
+
+
+def pool_workers(engine: sqla.Engine, tasks: int) -> int:
+    """Number of worker threads that can each hold a pooled connection without waiting.
+
+    Args:
+        engine (sqlalchemy.Engine): The engine the workers connect through.
+        tasks (int): Number of tasks to run.
+
+    Returns:
+        int: At least one, and at most ``tasks`` or the size of a ``QueuePool``.
+    """
+    pool = engine.pool
+    if isinstance(pool, sqla.pool.QueuePool):
+        return max(1, min(tasks, pool.size()))
+    return max(1, tasks)
@@ -0,0 +1,142 @@
+"""Query plans and timings of SELECT statements.
+
+``explain`` asks the database how it will run a statement, using each dialect's own
+facility:
+
+- SQLite: ``EXPLAIN QUERY PLAN``.
+- PostgreSQL: ``EXPLAIN (FORMAT JSON)``, or ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``
+  which also runs the statement and reports actual row counts and times.
+- SQL Server: the estimated XML showplan (``SET SHOWPLAN_XML ON``).
+
+``QueryProfile`` holds a plan with the timings recorded by
+:func:`gswa_atratus.profile_select`.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy as sqla
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class _Explain(Executable, ClauseElement):
+    """An ``EXPLAIN <statement>`` that keeps the statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: sqla.Select, prefix: str):
+        self.statement = statement
+        self.prefix = prefix
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return f"{element.prefix} {compiler.process(element.statement, **kw)}"
+
+
+@dataclass
+class QueryProfile:
+    """Compiled SQL, query plan and timings of one SELECT.
+
+    Times are in seconds. ``connect`` is the time to check a connection out of the pool,
+    ``execute`` until the database returns a cursor, ``fetch`` to transfer the rows and
+    ``build`` to construct the DataFrame (zero on the columnar path, which builds while
+    fetching).
+    """
+
+    sql: str
+    dialect: str
+    params: dict[str, Any] = field(default_factory=dict)
+    plan: str | None = None
+    connect_seconds: float = 0.0
+    execute_seconds: float = 0.0
+    fetch_seconds: float = 0.0
+    build_seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time from connection checkout to finished DataFrame."""
+        return (
+            self.connect_seconds
+            + self.execute_seconds
+            + self.fetch_seconds
+            + self.build_seconds
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten to scalar fields, e.g. for ``gdt.write_db_metadata_table(**profile.to_dict())``."""
+        record = asdict(self)
+        record["params"] = json.dumps(self.params, sort_keys=True, default=str)
+        record["total_seconds"] = self.total_seconds
+        return record
+
+    def to_json(self, path: str | Path | None = None) -> str:
+        """Serialise to JSON, also writing it to ``path`` if given."""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            Path(path).write_text(text, encoding="utf-8")
+        return text
+
+
+def compile_sql(
+    statement: sqla.Select | sqla.TextClause,
+    dialect: sqla.Dialect,
+    params: dict | None = None,
+) -> sqla.sql.compiler.Compiled:
+    """Compile a statement for a dialect, expanding IN parameters as they are executed.
+
+    Values for required bind parameters, such as those declared in a statement config's
+    ``parameters``, must be given in ``params`` to expand them.
+    """
+    if params:
+        statement = statement.params(**params)
+    return statement.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+
+
+def explain(
+    conn: sqla.Connection,
+    statement: sqla.Select,
+    params: dict | None = None,
+    analyze: bool = False,
+) -> str | None:
+    """Return the database's plan for a statement as text.
+
+    Args:
+        conn (sqlalchemy.Connection): An open connection.
+        statement (sqlalchemy.Select): The statement to explain.
+        params (dict | None, optional): Values for the statement's bind parameters.
+            Defaults to None.
+        analyze (bool, optional): On PostgreSQL, run the statement to report actual row
+            counts and times. Ignored by other dialects. Defaults to False.
+
+    Returns:
+        str | None: The plan, or None if the dialect has no supported EXPLAIN.
+    """
+    name = conn.dialect.name
+    if name == "sqlite":
+        rows = conn.execute(_Explain(statement, "EXPLAIN QUERY PLAN"), params).all()
+        # (id, parent, notused, detail): indent each step under its parent.
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return "\n".join(lines)
+    if name == "postgresql":
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        plan = conn.execute(_Explain(statement, f"EXPLAIN ({options})"), params).scalar()
+        return plan if isinstance(plan, str) else json.dumps(plan, indent=2)
+    if name == "mssql":
+        # SHOWPLAN must be the only statement in its batch, and returns the plan instead
+        # of running the query.
+        conn.exec_driver_sql("SET SHOWPLAN_XML ON")
+        try:
+            return conn.execute(statement, params).scalar()
+        finally:
+            conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
+    return None
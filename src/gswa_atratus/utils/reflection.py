@@ -0,0 +1,282 @@
+"""Persistent cache of reflected table definitions.
+
+Reflecting wide tables from a remote server can take longer than the query that uses
+them. ``ReflectionCache`` pickles each reflected ``Table`` to disk, keyed by engine URL and
+table name, and rebuilds it into the caller's ``MetaData`` on later runs. Entries are
+checked against a cheap schema version token where the dialect offers one, and otherwise
+expire after the cache's time-to-live.
+"""
+
+import contextlib
+import pickle
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal, get_args
+
+import sqlalchemy as sqla
+
+from gswa_atratus.utils.cache import DiskCache
+from gswa_atratus.utils.pools import pool_workers
+
+ReflectionMode = Literal["serial", "batch", "concurrent"]
+
+# Cheap per-dialect queries returning a value that changes when a table's definition does.
+_SCHEMA_TOKEN_SQL = {
+    # Incremented on any schema change in the database file.
+    "sqlite": "PRAGMA schema_version",
+    "mssql": "SELECT CONVERT(varchar(33), modify_date, 126) FROM sys.objects"
+    " WHERE object_id = OBJECT_ID(:table_name)",
+    # The catalogue row is rewritten by ALTER TABLE, which changes its xmin.
+    "postgresql": "SELECT xmin::text FROM pg_class WHERE oid = to_regclass(:table_name)",
+}
+
+
+@contextlib.contextmanager
+def _connection(engine: sqla.Engine | sqla.Connection) -> Iterator[sqla.Connection]:
+    """Use an open Connection as-is, or open one from an Engine."""
+    if isinstance(engine, sqla.Connection):
+        yield engine
+    else:
+        with engine.connect() as conn:
+            yield conn
+
+
+def schema_token(engine: sqla.Engine | sqla.Connection, table_name: str) -> str | None:
+    """Return a value that changes whenever the table's definition changes.
+
+    Args:
+        engine (sqlalchemy.Engine | sqlalchemy.Connection): Engine or open Connection.
+        table_name (str): Name of the table.
+
+    Returns:
+        str | None: The token, or None if the dialect has no cheap check or it failed.
+    """
+    sql = _SCHEMA_TOKEN_SQL.get(engine.dialect.name)
+    if sql is None:
+        return None
+    try:
+        with _connection(engine) as conn:
+            token = conn.execute(sqla.text(sql), {"table_name": table_name}).scalar()
+    except sqla.exc.DBAPIError:
+        return None
+    return None if token is None else str(token)
+
+
+class ReflectionCache(DiskCache):
+    """A DiskCache of reflected tables, keyed on engine URL and table name.
+
+    Pass an instance to :func:`gswa_atratus.load_statement` or
+    :func:`gswa_atratus.utils.statement_builder` to skip reflection on warm starts.
+
+    Example:
+        cache = ReflectionCache("cache/reflection", ttl=7 * 24 * 3600)
+        statement = gdt.load_statement(cfg_path, engine, metadata, reflection_cache=cache)
+    """
+
+    suffix = ".reflection.pkl"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        validate: bool = True,
+    ):
+        """Initialise the reflection cache.
+
+        Args:
+            cache_dir (str | Path): Directory to store cache files in. Created if missing.
+            ttl (float | None, optional): Seconds a reflected table stays valid.
+                Defaults to None.
+            max_bytes (int | None, optional): Size budget for the directory.
+                Defaults to None.
+            validate (bool, optional): Compare the schema version token of each cached
+                table with the database before using it. Defaults to True.
+        """
+        super().__init__(cache_dir, ttl, max_bytes)
+        self.validate = validate
+
+    def key(self, engine: sqla.Engine | sqla.Connection, table_name: str) -> str:
+        """Build the cache key of a table in an engine's database."""
+        return self.hash_key(
+            engine.engine.url.render_as_string(hide_password=True), table_name
+        )
+
+    def table(
+        self,
+        engine: sqla.Engine | sqla.Connection,
+        metadata: sqla.MetaData,
+        table_name: str,
+    ) -> sqla.Table:
+        """Return a table in ``metadata``, from the cache if valid, otherwise reflected.
+
+        Args:
+            engine (sqlalchemy.Engine | sqlalchemy.Connection): Engine or open Connection.
+            metadata (sqlalchemy.MetaData): MetaData to add the table to.
+            table_name (str): Name of the table.
+
+        Returns:
+            sqlalchemy.Table: The table, attached to ``metadata``.
+
+        Raises:
+            sqlalchemy.exc.NoSuchTableError: If the table does not exist.
+        """
+        if table_name in metadata.tables:
+            return metadata.tables[table_name]
+
+        table = self.get(engine, metadata, table_name)
+        if table is None:
+            table = sqla.Table(table_name, sqla.MetaData(), autoload_with=engine)
+            self.put(engine, table)
+            table = table.to_metadata(metadata)
+        return table
+
+    def get(
+        self,
+        engine: sqla.Engine | sqla.Connection,
+        metadata: sqla.MetaData,
+        table_name: str,
+    ) -> sqla.Table | None:
+        """Return a cached table rebuilt into ``metadata``, or None if missing or stale.
+
+        Args:
+            engine (sqlalchemy.Engine | sqlalchemy.Connection): Engine or open Connection.
+            metadata (sqlalchemy.MetaData): MetaData to add the table to.
+            table_name (str): Name of the table.
+
+        Returns:
+            sqlalchemy.Table | None: The table, attached to ``metadata``.
+        """
+        path = self.lookup(self.key(engine, table_name))
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if self.validate and entry["token"] != schema_token(engine, table_name):
+            return None
+        return entry["metadata"].tables[table_name].to_metadata(metadata)
+
+    def put(self, engine: sqla.Engine | sqla.Connection, table: sqla.Table) -> None:
+        """Store a freshly reflected table, with the current schema token of its database.
+
+        Args:
+            engine (sqlalchemy.Engine | sqlalchemy.Connection): Engine or open Connection
+                the table was reflected from.
+            table (sqlalchemy.Table): The reflected table.
+        """
+        token = schema_token(engine, table.name) if self.validate else None
+        entry = {"token": token, "metadata": table.metadata}
+        self.store(
+            self.key(engine, table.name), lambda p: p.write_bytes(pickle.dumps(entry))
+        )
+
+
+def _reflect_one(
+    engine: sqla.Engine, table_name: str, reflection_cache: ReflectionCache | None
+) -> sqla.Table:
+    """Reflect a single table into its own MetaData, on a connection of its own."""
+    with engine.connect() as conn:
+        if reflection_cache is not None:
+            return reflection_cache.table(conn, sqla.MetaData(), table_name)
+        return sqla.Table(table_name, sqla.MetaData(), autoload_with=conn)
+
+
+def reflect_tables(
+    engine: sqla.Engine | sqla.Connection,
+    metadata: sqla.MetaData,
+    table_names: Iterable[str],
+    mode: ReflectionMode = "serial",
+    reflection_cache: ReflectionCache | None = None,
+    max_workers: int | None = None,
+) -> dict[str, sqla.Table]:
+    """Reflect several tables into ``metadata``.
+
+    ``"serial"`` reflects one table after another, as ``sqla.Table(..., autoload_with=...)``
+    does. ``"batch"`` reflects every table in one ``MetaData.reflect(only=...)`` call, which
+    lets the dialect fetch columns, keys and indexes for all tables together.
+    ``"concurrent"`` reflects each table on its own pooled connection from a thread pool,
+    and falls back to ``"batch"`` when the engine cannot hand out independent connections
+    (an open Connection, or a single-connection pool such as in-memory SQLite).
+
+    Args:
+        engine (sqlalchemy.Engine | sqlalchemy.Connection): Engine or open Connection.
+        metadata (sqlalchemy.MetaData): MetaData to add the tables to.
+        table_names (Iterable[str]): Names of the tables to reflect.
+        mode (ReflectionMode, optional): How to reflect. Defaults to "serial".
+        reflection_cache (ReflectionCache | None, optional): On-disk cache consulted before
+            reflecting a table. Defaults to None.
+        max_workers (int | None, optional): Threads for ``"concurrent"``. Defaults to the
+            size of the engine's connection pool.
+
+    Returns:
+        dict[str, sqlalchemy.Table]: The tables attached to ``metadata``, by name.
+
+    Raises:
+        sqlalchemy.exc.NoSuchTableError: Naming the first table that does not exist.
+        ValueError: If ``mode`` is unknown.
+    """
+    names = list(dict.fromkeys(table_names))
+    tables = {t: metadata.tables[t] for t in names if t in metadata.tables}
+    pending = [t for t in names if t not in tables]
+
+    if mode == "concurrent" and not _has_independent_connections(engine):
+        mode = "batch"
+
+    if mode == "serial":
+        for t in pending:
+            if reflection_cache is not None:
+                tables[t] = reflection_cache.table(engine, metadata, t)
+            else:
+                tables[t] = sqla.Table(t, metadata, autoload_with=engine)
+
+    elif mode == "batch":
+        if reflection_cache is not None:
+            for t in pending:
+                cached = reflection_cache.get(engine, metadata, t)
+                if cached is not None:
+                    tables[t] = cached
+            pending = [t for t in pending if t not in tables]
+        if pending:
+            reflected = sqla.MetaData()
+            try:
+                reflected.reflect(bind=engine, only=pending, views=True, resolve_fks=False)
+            except sqla.exc.InvalidRequestError as exc:
+                inspector = sqla.inspect(engine)
+                for t in pending:
+                    if not inspector.has_table(t):
+                        raise sqla.exc.NoSuchTableError(t) from exc
+                raise
+            for t in pending:
+                if reflection_cache is not None:
+                    reflection_cache.put(engine, reflected.tables[t])
+                tables[t] = reflected.tables[t].to_metadata(metadata)
+
+    elif mode == "concurrent":
+        with ThreadPoolExecutor(
+            max_workers=max_workers or pool_workers(engine, len(pending))
+        ) as executor:
+            futures = {
+                t: executor.submit(_reflect_one, engine, t, reflection_cache)
+                for t in pending
+            }
+            # Collected in config order, so the first missing table is reported.
+            for t, future in futures.items():
+                tables[t] = future.result().to_metadata(metadata)
+
+    else:
+        raise ValueError(
+            f"Unknown reflection mode [{mode}], expected one of {get_args(ReflectionMode)}."
+        )
+
+    return {t: tables[t] for t in names}
+
+
+def _has_independent_connections(engine: sqla.Engine | sqla.Connection) -> bool:
+    """Whether separate threads can check out separate connections to the same database."""
+    if isinstance(engine, sqla.Connection):
+        return False
+    return not isinstance(engine.pool, (sqla.pool.SingletonThreadPool, sqla.pool.StaticPool))
@@ -4,7 +4,13 @@ It uses gswa-atratus (gdt) for custom exception handling and leverages SQLAlchem
 metadata, and table objects to construct query statements dynamically based on the provided JSON.
 """
 
+import datetime
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -13,10 +19,121 @@ from sqlalchemy import exc as sqlae
 from sqlalchemy.orm import aliased
 
 import gswa_atratus as gdt
+from gswa_atratus.utils.joins import Join, parse_joins, plan_joins
+from gswa_atratus.utils.reflection import ReflectionCache, ReflectionMode, reflect_tables
+
+# Mnemonic that removes a column from the output.
+DROP = "drop"
+
+
+class StatementCache:
+    """In-process LRU cache of built Select statements.
+
+    Statements are keyed on a hash of the ``statement_configs`` content and the engine URL,
+    so editing the config produces a new key. Parsed config files are remembered by path,
+    modification time and size, so an unchanged file is not re-read.
+
+    The cached ``Select`` object is returned as-is. Executing the same object again also
+    hits SQLAlchemy's per-engine compiled cache, so the SQL is not recompiled either.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """Initialise an empty cache.
+
+        Args:
+            maxsize (int, optional): Number of statements (and of parsed config files)
+                kept before the least recently used is dropped. Defaults to 64.
+        """
+        self.maxsize = maxsize
+        self._statements: OrderedDict[str, sqla.Select] = OrderedDict()
+        self._configs: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(engine: sqla.Engine, stmt_cfg: dict[str, Any]) -> str:
+        """Hash the canonical JSON of a statement config together with the engine URL."""
+        digest = hashlib.sha256()
+        digest.update(engine.engine.url.render_as_string(hide_password=True).encode())
+        digest.update(b"\x00")
+        digest.update(json.dumps(stmt_cfg, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _remember(self, store: OrderedDict, key: Any, value: Any) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.maxsize:
+            store.popitem(last=False)
+
+    def _recall(self, store: OrderedDict, key: Any) -> Any:
+        value = store.get(key)
+        if value is not None:
+            store.move_to_end(key)
+        return value
+
+    def read_config(self, cfg_path: Path | str) -> dict[str, Any]:
+        """Parse the statement config of a file, reusing the last parse if it is unchanged.
+
+        Args:
+            cfg_path (Path | str): Path to the JSON config file.
+
+        Returns:
+            dict[str, Any]: The statement configuration.
+
+        Raises:
+            gdt.KnownException: If the config file is malformed or missing required sections.
+        """
+        try:
+            st = os.stat(cfg_path)
+        except OSError:
+            # Let read_statement_config report the missing file.
+            return read_statement_config(cfg_path)
+        file_key = (os.path.abspath(cfg_path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            stmt_cfg = self._recall(self._configs, file_key)
+        if stmt_cfg is None:
+            stmt_cfg = read_statement_config(cfg_path)
+            with self._lock:
+                self._remember(self._configs, file_key, stmt_cfg)
+        return stmt_cfg
+
+    def get(self, key: str) -> sqla.Select | None:
+        """Return the cached statement for a key, or None."""
+        with self._lock:
+            return self._recall(self._statements, key)
+
+    def put(self, key: str, statement: sqla.Select) -> None:
+        """Store a built statement, evicting the least recently used beyond ``maxsize``."""
+        with self._lock:
+            self._remember(self._statements, key, statement)
+
+    def clear(self) -> None:
+        """Remove every cached statement and parsed config."""
+        with self._lock:
+            self._statements.clear()
+            self._configs.clear()
+
+    def __len__(self) -> int:
+        """Number of cached statements."""
+        return len(self._statements)
+
+
+# Shared by every load_statement(..., use_cache=True) call in this process.
+_STATEMENT_CACHE = StatementCache()
+
+
+def clear_statement_cache() -> None:
+    """Empty the statement cache used by ``load_statement(..., use_cache=True)``."""
+    _STATEMENT_CACHE.clear()
 
 
 def load_statement(
-    cfg_path: Path | str, engine: sqla.Engine, metadata: sqla.MetaData
+    cfg_path: Path | str,
+    engine: sqla.Engine,
+    metadata: sqla.MetaData,
+    reflection_cache: ReflectionCache | None = None,
+    reflection: ReflectionMode = "serial",
+    use_cache: bool | StatementCache = False,
+    mnemonics: dict[str, str] | None = None,
 ) -> sqla.Select:
     """Load and build a SQLAlchemy Select statement from a gswa-atratus config file.
 
@@ -25,10 +142,59 @@ def load_statement(
             "statement_configs", "selection", and "joins" sections.
         engine (sqlalchemy.Engine): A configured SQLAlchemy Engine.
         metadata (sqlalchemy.MetaData): A configured SQLAlchemy MetaData instance.
+        reflection_cache (ReflectionCache | None, optional): On-disk cache of reflected
+            tables, used instead of reflecting every table on every run. Defaults to None.
+        reflection (ReflectionMode, optional): How to reflect the configured tables:
+            "serial", "batch" or "concurrent". Configs joining many tables start faster
+            with "batch" or "concurrent". Defaults to "serial".
+        use_cache (bool | StatementCache, optional): Return the statement already built
+            for the same config content and engine URL, e.g. when a batch job loads it once
+            per input file. True uses a process-wide cache, emptied by
+            :func:`clear_statement_cache`. Defaults to False.
+        mnemonics (dict[str, str] | None, optional): Output names of selected columns,
+            added to any ``mnemonics`` section of the config. Columns are renamed with SQL
+            labels, and columns mapped to "drop" are not fetched. Defaults to None.
 
     Returns:
         sqlalchemy.Select: The constructed SQLAlchemy select statement.
 
+    Raises:
+        gdt.KnownException: If the config file is malformed or missing required sections.
+    """
+    if use_cache is False:
+        cache = None
+    elif use_cache is True:
+        cache = _STATEMENT_CACHE
+    else:
+        cache = use_cache
+    if cache is None:
+        stmt_cfg = read_statement_config(cfg_path)
+    else:
+        stmt_cfg = cache.read_config(cfg_path)
+    if mnemonics:
+        stmt_cfg = {**stmt_cfg, "mnemonics": {**stmt_cfg.get("mnemonics", {}), **mnemonics}}
+    if cache is None:
+        return build_statement(engine, metadata, stmt_cfg, reflection_cache, reflection)
+
+    key = cache.key(engine, stmt_cfg)
+    statement = cache.get(key)
+    if statement is None:
+        statement = build_statement(
+            engine, metadata, stmt_cfg, reflection_cache, reflection
+        )
+        cache.put(key, statement)
+    return statement
+
+
+def read_statement_config(cfg_path: Path | str) -> dict[str, Any]:
+    """Read the ``statement_configs`` section of a gswa-atratus config file.
+
+    Args:
+        cfg_path (Path | str): Path to the JSON config file.
+
+    Returns:
+        dict[str, Any]: The statement configuration.
+
     Raises:
         gdt.KnownException: If the config file is malformed or missing required sections.
     """
@@ -36,17 +202,138 @@ def load_statement(
         with open(cfg_path, encoding="utf-8") as f:
             db_config = json.load(f)
         stmt_cfg = db_config.pop("statement_configs")
-        selection = stmt_cfg["selection"]
-        joins = stmt_cfg["joins"]
-        alias = stmt_cfg["aliases"]
+        missing = {"selection", "joins", "aliases"} - stmt_cfg.keys()
+        if missing:
+            raise KeyError(f"Missing sections {sorted(missing)}.")
 
     except Exception as exc:
         raise gdt.KnownException(
             f"Config file {cfg_path} is malformed or missing : Should contain statement_configs, selection, and joins.",
         ) from exc
 
-    statement = statement_builder(engine, metadata, selection, joins, alias)
-    return statement
+    return stmt_cfg
+
+
+def build_statement(
+    engine: sqla.Engine,
+    metadata: sqla.MetaData,
+    stmt_cfg: dict[str, Any],
+    reflection_cache: ReflectionCache | None = None,
+    reflection: ReflectionMode = "serial",
+) -> sqla.Select:
+    """Build a SQLAlchemy Select statement from a parsed ``statement_configs`` section.
+
+    Args:
+        engine (sqlalchemy.Engine): A configured SQLAlchemy Engine, or an open Connection.
+        metadata (sqlalchemy.MetaData): A configured SQLAlchemy MetaData instance.
+        stmt_cfg (dict[str, Any]): The statement configuration, as returned by
+            :func:`read_statement_config`.
+        reflection_cache (ReflectionCache | None, optional): On-disk cache of reflected
+            tables. Defaults to None.
+        reflection (ReflectionMode, optional): How to reflect the configured tables, see
+            :func:`gswa_atratus.utils.statement_builder`. Defaults to "serial".
+
+    Returns:
+        sqlalchemy.Select: The constructed SQLAlchemy select statement.
+    """
+    return statement_builder(
+        engine,
+        metadata,
+        stmt_cfg["selection"],
+        stmt_cfg["joins"],
+        stmt_cfg["aliases"],
+        reflection_cache=reflection_cache,
+        reflection=reflection,
+        filters=stmt_cfg.get("filters"),
+        order_by=stmt_cfg.get("order_by"),
+        limit=stmt_cfg.get("limit"),
+        distinct=stmt_cfg.get("distinct", False),
+        parameters=stmt_cfg.get("parameters"),
+        dtypes=stmt_cfg.get("dtypes"),
+        mnemonics=stmt_cfg.get("mnemonics"),
+    )
+
+
+@dataclass
+class SharedScan:
+    """One merged statement config, and where each original config's columns are in it.
+
+    ``members`` maps the index of each original config to the positions of its selected
+    columns in the merged selection, in the original order.
+    """
+
+    stmt_cfg: dict[str, Any]
+    members: dict[int, list[int]] = field(default_factory=dict)
+
+
+def _mnemonic(mnemonics: dict[str, str] | None, table: str, col: str) -> str | None:
+    """Mnemonic of a selected column, by ``"table.column"`` or by column name."""
+    mnemonics = mnemonics or {}
+    return mnemonics.get(f"{table}.{col}", mnemonics.get(col))
+
+
+def _scan_key(stmt_cfg: dict[str, Any]) -> str:
+    """Everything except the selected columns that decides which rows a config returns."""
+    joined = {j.table for j in parse_joins(stmt_cfg["joins"])}
+    base = next(iter(stmt_cfg["selection"]), None)
+    # Selected tables outside the joins are cross joined, which changes the rows.
+    unjoined = sorted(t for t in stmt_cfg["selection"] if t not in joined)
+    shape = {k: v for k, v in stmt_cfg.items() if k not in ("selection", "joins")}
+    if stmt_cfg.get("distinct"):
+        # Distinct rows depend on the columns selected, so only identical selections merge.
+        shape["distinct_selection"] = stmt_cfg["selection"]
+    return json.dumps(
+        [base, unjoined, stmt_cfg["joins"], shape], sort_keys=True, default=str
+    )
+
+
+def plan_shared_scans(stmt_cfgs: list[dict[str, Any]]) -> list[SharedScan]:
+    """Group statement configs that return the same rows into merged statements.
+
+    Configs with the same joins, aliases, filters, parameters, ordering and limit differ
+    only in the columns they select, so one statement selecting the union of their
+    columns serves them all. Identical configs share the same columns.
+
+    Args:
+        stmt_cfgs (list[dict[str, Any]]): Statement configurations, as returned by
+            :func:`read_statement_config`.
+
+    Returns:
+        list[SharedScan]: One merged config per group, in order of first appearance.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    refs: dict[str, dict[int, list[tuple[str, str]]]] = {}
+    for i, stmt_cfg in enumerate(stmt_cfgs):
+        key = _scan_key(stmt_cfg)
+        if key not in merged:
+            merged[key] = {**stmt_cfg, "selection": {}}
+            refs[key] = {}
+        selection = merged[key]["selection"]
+        refs[key][i] = []
+        for table, column_list in stmt_cfg["selection"].items():
+            merged_columns = selection.setdefault(table, [])
+            for col in column_list:
+                if col not in merged_columns:
+                    merged_columns.append(col)
+                refs[key][i].append((table, col))
+
+    scans = []
+    for key, stmt_cfg in merged.items():
+        # Mnemonics are part of the scan key, and columns mapped to "drop" are not selected.
+        mnemonics = stmt_cfg.get("mnemonics")
+        order = [
+            (table, col)
+            for table, column_list in stmt_cfg["selection"].items()
+            for col in column_list
+            if _mnemonic(mnemonics, table, col) != DROP
+        ]
+        position = {ref: n for n, ref in enumerate(order)}
+        members = {
+            i: [position[ref] for ref in r if ref in position]
+            for i, r in refs[key].items()
+        }
+        scans.append(SharedScan(stmt_cfg, members))
+    return scans
 
 
 def statement_builder(
@@ -55,15 +342,80 @@ def statement_builder(
     selection: dict,
     joins: list[dict],
     alias: dict,
+    reflection_cache: ReflectionCache | None = None,
+    reflection: ReflectionMode = "serial",
+    filters: dict | list | None = None,
+    order_by: list[list[str]] | None = None,
+    limit: int | None = None,
+    distinct: bool = False,
+    parameters: dict | list | None = None,
+    dtypes: str | dict | None = None,
+    mnemonics: dict[str, str] | None = None,
 ) -> sqla.Select:
     """Build an SQLAlchemy Select statement from a gswa-atratus config.
 
+    Filters, ordering, limit and distinct are applied on the server. Each filter
+    condition names a column as ``[table, column]`` like the joins do, and values are sent
+    as bound parameters::
+
+        "filters": {"and": [
+            {"column": ["table_1", "project"], "op": "==", "value": "P123"},
+            {"or": [
+                {"column": ["table_2", "depth"], "op": "between", "value": [0, 100]},
+                {"column": ["table_2", "depth"], "op": "is_null"}
+            ]}
+        ]},
+        "order_by": [["table_1", "hole_id"], ["table_2", "depth", "desc"]],
+        "limit": 1000,
+        "distinct": true
+
+    Supported operators are ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``,
+    ``not_in``, ``between``, ``like``, ``is_null`` and ``is_not_null``. A list of
+    conditions is combined with AND.
+
+    A filter value of ``{"param": "name"}`` refers to a parameter declared in
+    ``parameters``, and becomes a bind parameter whose value is given when the statement
+    is executed, e.g. ``gdt.select(engine, statement, params={"name": "P123"})``. The
+    statement is then compiled once and reused for every value::
+
+        "parameters": {"project": null, "max_depth": 500},
+        "filters": [
+            {"column": ["table_1", "project"], "op": "==", "value": {"param": "project"}},
+            {"column": ["table_2", "depth"], "op": "<", "value": {"param": "max_depth"}}
+        ]
+
     Args:
-        engine (sqlalchemy.Engine): A configured SQLAlchemy Engine.
+        engine (sqlalchemy.Engine): A configured SQLAlchemy Engine, or an open Connection
+            to reflect tables through.
         metadata (sqlalchemy.MetaData): A configured SQLAlchemy MetaData instance.
         selection (dict): Configured gswa-atratus dictionary specifying tables and columns.
-        joins (list[dict]): Configured gswa-atratus dictionary detailing table joins.
+        joins (list[dict]): Configured gswa-atratus dictionary detailing table joins. Each
+            join may set ``"type"`` to "inner" or "outer" (the default). Joins are
+            deduplicated and reordered, see :mod:`gswa_atratus.utils.joins`.
         alias (dict): Configured gswa-atratus dictionary for alias mapping of tables.
+        reflection_cache (ReflectionCache | None, optional): On-disk cache of reflected
+            tables. Cached definitions are validated and rebuilt into ``metadata`` instead
+            of reflecting each table from the database. Defaults to None.
+        reflection (ReflectionMode, optional): How to reflect the tables named in the
+            selection and joins: "serial" one at a time, "batch" in a single
+            ``MetaData.reflect`` call, or "concurrent" across pooled connections.
+            See :func:`gswa_atratus.utils.reflection.reflect_tables`. Defaults to "serial".
+        filters (dict | list | None, optional): WHERE conditions, see above.
+            Defaults to None.
+        order_by (list[list[str]] | None, optional): ``[table, column]`` or
+            ``[table, column, "desc"]`` entries to sort by. Defaults to None.
+        limit (int | None, optional): Maximum number of rows to return. Defaults to None.
+        distinct (bool, optional): Return only distinct rows. Defaults to False.
+        parameters (dict | list | None, optional): Names of the parameters filters may
+            refer to, mapped to a default value or None if a value must be given at
+            execution. A list declares parameters without defaults. Defaults to None.
+        dtypes (str | dict | None, optional): Dtype policy used by
+            :func:`gswa_atratus.select` for this statement, either a policy name or
+            ``{"policy": "compact", "columns": {column: dtype}}``. See
+            :func:`gswa_atratus.utils.dtypes.apply_dtype_policy`. Defaults to None.
+        mnemonics (dict[str, str] | None, optional): Output names of selected columns,
+            keyed by column name or ``"table.column"``. Columns are labelled in the SELECT
+            list, and columns mapped to "drop" are left out of it. Defaults to None.
 
     Returns:
         sqlalchemy.Select: "statement", an SQLAlchemy select statement.
@@ -74,33 +426,42 @@ def statement_builder(
     """
     statement = None
     tables_to_alias = list(alias.keys())
+    planned_joins = parse_joins(joins)
     # retrieve tables
+    try:
+        reflected = reflect_tables(
+            engine,
+            metadata,
+            _configured_tables(selection, planned_joins),
+            mode=reflection,
+            reflection_cache=reflection_cache,
+        )
+    except sqlae.InterfaceError as exc:
+        raise gdt.KnownException(
+            "There are several possible reasons for this error."
+            " One possibility is that the ODBC driver specified"
+            " in the config is not installed on your system."
+        ) from exc
+    except sqlae.NoSuchTableError as exc:
+        raise gdt.KnownException(
+            f"Table [{exc.args[0]}] specified in config, does not exist in engine."
+        ) from exc
+    except sqlae.OperationalError as exc:
+        raise gdt.KnownException(
+            f"Network connection to configured URL [{engine.engine.url}] is not available."
+            " Check network status or VPN."
+        ) from exc
+
     tables_dict: dict[str, Any] = {}
-    for t in list(selection.keys()):
-        try:
-            table_i = sqla.Table(t, metadata, autoload_with=engine)
-            if t in tables_to_alias:
-                tables_dict[alias[t]] = aliased(table_i, name=alias[t])
-            else:
-                tables_dict[t] = table_i
-        except sqlae.InterfaceError as exc:
-            raise gdt.KnownException(
-                "There are several possible reasons for this error."
-                " One possibility is that the ODBC driver specified"
-                " in the config is not installed on your system."
-            ) from exc
-        except sqlae.NoSuchTableError as exc:
-            raise gdt.KnownException(
-                f"Table [{t}] specified in config, does not exist in engine."
-            ) from exc
-        except sqlae.OperationalError as exc:
-            raise gdt.KnownException(
-                f"Network connection to configured URL [{engine.url}] is not available."
-                " Check network status or VPN."
-            ) from exc
+    for t, table_i in reflected.items():
+        if t in tables_to_alias:
+            tables_dict[alias[t]] = aliased(table_i, name=alias[t])
+        else:
+            tables_dict[t] = table_i
 
-    # retrieve columns
-    columns_list: list[sqla.Column] = []
+    # retrieve columns, labelled with their mnemonics
+    mnemonics = mnemonics or {}
+    columns_list: list[sqla.ColumnElement] = []
     for table, column_list in selection.items():
         for col in column_list:
             try:
@@ -109,44 +470,190 @@ def statement_builder(
                 else:
                     t_aliased = tables_dict[table]
                 c = t_aliased.c[col]
-                columns_list.append(c)
             except (KeyError, sqlae.NoSuchColumnError) as exc:
                 raise gdt.KnownException(
                     f"Column [{col}] specified in config, does not exist in table."
                     f" [{table}] contains columns [{t_aliased.c.keys()}].",
                 ) from exc
-    statement = sqla.select(*columns_list)
+            mnemonic = _mnemonic(mnemonics, table, col)
+            if mnemonic == DROP:
+                continue
+            columns_list.append(c if mnemonic is None else c.label(mnemonic))
+    if not columns_list:
+        raise gdt.KnownException("Every selected column is mapped to \"drop\" in mnemonics.")
+    base = next(iter(selection))
+    statement = sqla.select(*columns_list).select_from(tables_dict[alias.get(base, base)])
 
-    # add joins
-    for j in joins:
-        table_str = list(j.keys())[0]
-
-        # extract_all strings
-        mapping_list = j[table_str]
-        left_table_str = mapping_list[0][0]
-        right_table_str = mapping_list[1][0]
-        left_col_str = mapping_list[0][1]
-        right_col_str = mapping_list[1][1]
-
-        t = (
-            tables_dict[alias[table_str]]
-            if table_str in tables_to_alias
-            else tables_dict[table_str]
+    # add joins, deduplicated and ordered by the join planner
+    for j in plan_joins(planned_joins, base, reflected, list(selection)):
+        t = tables_dict[alias.get(j.table, j.table)]
+        condition = sqla.and_(
+            *(
+                _config_column(tables_dict, alias, *left)
+                == _config_column(tables_dict, alias, *right)
+                for left, right in j.on
+            )
         )
-        t_l = (
-            tables_dict[alias[left_table_str]]
-            if left_table_str in tables_to_alias
-            else tables_dict[left_table_str]
+        if j.how == "inner":
+            statement = statement.join(t, condition)
+        else:
+            statement = statement.outerjoin(t, condition)
+
+    # push filtering, ordering and limits to the server
+    if filters:
+        if isinstance(parameters, list):
+            parameters = dict.fromkeys(parameters)
+        statement = statement.where(
+            _filter_clause(filters, tables_dict, alias, parameters)
+        )
+    for entry in order_by or []:
+        if len(entry) not in (2, 3) or entry[2:] not in ([], ["asc"], ["desc"]):
+            raise gdt.KnownException(
+                f"order_by entry {entry} should be [table, column] or"
+                ' [table, column, "asc"|"desc"].'
+            )
+        c = _config_column(tables_dict, alias, entry[0], entry[1])
+        statement = statement.order_by(c.desc() if entry[2:] == ["desc"] else c.asc())
+    if distinct:
+        statement = statement.distinct()
+    if limit is not None:
+        statement = statement.limit(int(limit))
+    if dtypes is not None:
+        statement = statement.execution_options(dtypes=dtypes)
+
+    return statement
+
+
+def _configured_tables(selection: dict, joins: list[Join]) -> list[str]:
+    """Names of every table used by the selection and joins, in config order."""
+    names = list(selection.keys())
+    for j in joins:
+        names.append(j.table)
+        names.extend(sorted(j.depends_on))
+    return list(dict.fromkeys(names))
+
+
+# Comparison operators available to filter conditions, by their name in the config.
+_FILTER_OPS = {
+    "==": lambda c, v: c == v,
+    "!=": lambda c, v: c != v,
+    "<": lambda c, v: c < v,
+    "<=": lambda c, v: c <= v,
+    ">": lambda c, v: c > v,
+    ">=": lambda c, v: c >= v,
+    "in": lambda c, v: c.in_(v),
+    "not_in": lambda c, v: c.not_in(v),
+    "between": lambda c, v: c.between(*v),
+    "like": lambda c, v: c.like(v),
+    "is_null": lambda c, v: c.is_(None),
+    "is_not_null": lambda c, v: c.is_not(None),
+}
+
+
+def _config_column(
+    tables_dict: dict[str, Any], alias: dict, table: str, col: str
+) -> sqla.ColumnElement:
+    """Resolve a ``[table, column]`` reference from the config to a (possibly aliased) column."""
+    key = alias.get(table, table)
+    if key not in tables_dict:
+        raise gdt.KnownException(
+            f"Table [{table}] is referenced in config, but is not in the selection or joins."
         )
-        t_r = (
-            tables_dict[alias[right_table_str]]
-            if right_table_str in tables_to_alias
-            else tables_dict[right_table_str]
+    try:
+        return tables_dict[key].c[col]
+    except KeyError as exc:
+        raise gdt.KnownException(
+            f"Column [{col}] specified in config, does not exist in table."
+            f" [{table}] contains columns [{tables_dict[key].c.keys()}].",
+        ) from exc
+
+
+def _coerce_value(column: sqla.ColumnElement, value: Any) -> Any:
+    """Parse ISO date strings for date/datetime columns, which JSON cannot express."""
+    if isinstance(value, list):
+        return [_coerce_value(column, v) for v in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (datetime.date, datetime.datetime):
+        try:
+            return python_type.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _is_param(value: Any) -> bool:
+    return isinstance(value, dict) and "param" in value
+
+
+def _bind_value(
+    column: sqla.ColumnElement, value: Any, parameters: dict, expanding: bool = False
+) -> Any:
+    """Turn ``{"param": name}`` references into bind parameters, and coerce literals."""
+    if isinstance(value, list):
+        return [_bind_value(column, v, parameters) for v in value]
+    if not _is_param(value):
+        return _coerce_value(column, value)
+    name = value["param"]
+    if name not in parameters:
+        raise gdt.KnownException(
+            f"Filter parameter [{name}] is not declared in the parameters section."
+            f" Declared parameters are {list(parameters)}."
         )
+    default = parameters[name]
+    return sqla.bindparam(
+        name,
+        value=_coerce_value(column, default),
+        type_=column.type,
+        required=default is None,
+        expanding=expanding,
+    )
 
-        left_col = t_l.c[left_col_str]
-        right_col = t_r.c[right_col_str]
 
-        statement = statement.outerjoin(t, left_col == right_col)
+def _filter_clause(
+    filters: dict | list,
+    tables_dict: dict[str, Any],
+    alias: dict,
+    parameters: dict | None = None,
+) -> sqla.ColumnElement[bool]:
+    """Compile the ``filters`` section into a WHERE clause with bound parameters."""
+    parameters = parameters or {}
+    if isinstance(filters, list):
+        return sqla.and_(
+            *(_filter_clause(f, tables_dict, alias, parameters) for f in filters)
+        )
+    if not isinstance(filters, dict):
+        raise gdt.KnownException(f"Filter {filters} should be a condition, list or and/or group.")
+    if "and" in filters or "or" in filters:
+        if len(filters) != 1 or not isinstance(next(iter(filters.values())), list):
+            raise gdt.KnownException(
+                f"Filter group {filters} should contain only one \"and\" or \"or\" list."
+                " Nest groups to combine them."
+            )
+        combine = sqla.and_ if "and" in filters else sqla.or_
+        group = filters["and"] if "and" in filters else filters["or"]
+        return combine(*(_filter_clause(f, tables_dict, alias, parameters) for f in group))
 
-    return statement
+    try:
+        table, col = filters["column"]
+        op = filters["op"]
+    except (KeyError, TypeError, ValueError) as exc:
+        raise gdt.KnownException(
+            f"Filter {filters} should contain a [table, column] \"column\" and an \"op\"."
+        ) from exc
+    if op not in _FILTER_OPS:
+        raise gdt.KnownException(
+            f"Filter operator [{op}] is not supported. Use one of {list(_FILTER_OPS)}."
+        )
+    c = _config_column(tables_dict, alias, table, col)
+    raw = filters.get("value")
+    if op == "between" and (not isinstance(raw, list) or len(raw) != 2):
+        raise gdt.KnownException(f"Filter {filters} needs a [low, high] value for between.")
+    if op in ("in", "not_in") and not (isinstance(raw, list) or _is_param(raw)):
+        raise gdt.KnownException(f"Filter {filters} needs a list value for {op}.")
+    value = _bind_value(c, raw, parameters, expanding=op in ("in", "not_in"))
+    return _FILTER_OPS[op](c, value)
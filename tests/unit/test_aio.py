@@ -0,0 +1,73 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import sqlalchemy as sqla
+
+import gswa_atratus as gdt
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+import gswa_atratus.aio  # noqa: E402
+
+
+@pytest.fixture
+def async_cfg(tmp_path) -> Path:
+    """Config pointing at a file-backed aiosqlite database, with a statement config."""
+    config = {
+        "sqlalchemy": {"sqlalchemy.url": f"sqlite+aiosqlite:///{tmp_path / 'aio.db'}"},
+        "statement_configs": {
+            "selection": {"table_1": ["table_1_col_1", "table_1_col_2"]},
+            "joins": [],
+            "aliases": {},
+        },
+    }
+    cfg_path = tmp_path / "test_config.json"
+    with open(cfg_path, "w") as f:
+        json.dump(config, f)
+    return cfg_path
+
+
+@pytest.fixture
+def table() -> pd.DataFrame:
+    return pd.DataFrame({"table_1_col_1": [1, 2, 3], "table_1_col_2": ["a", "b", "c"]})
+
+
+def test_connect_async(async_cfg):
+    """Test if a valid config returns an AsyncEngine and MetaData."""
+    engine, metadata = asyncio.run(gdt.aio.connect_async(async_cfg))
+    assert isinstance(engine, sqla.ext.asyncio.AsyncEngine)
+    assert isinstance(metadata, sqla.MetaData)
+
+
+def test_connect_async_sync_driver(tmp_path):
+    """Test if a config with a blocking driver raises a KnownException."""
+    cfg_path = tmp_path / "sync_config.json"
+    with open(cfg_path, "w") as f:
+        json.dump({"sqlalchemy": {"sqlalchemy.url": "sqlite+pysqlite:///:memory:"}}, f)
+
+    with pytest.raises(gdt.KnownException):
+        asyncio.run(gdt.aio.connect_async(cfg_path))
+
+
+def test_insert_load_select_async(async_cfg, table):
+    """Test if data round trips through insert_async, load_statement_async and select_async."""
+
+    async def round_trip():
+        engine, metadata = await gdt.aio.connect_async(async_cfg)
+        await gdt.aio.insert_async(engine, "table_1", table)
+        statement = await gdt.aio.load_statement_async(async_cfg, engine, metadata)
+        results = await asyncio.gather(
+            gdt.aio.select_async(engine, statement),
+            gdt.aio.select_async(engine, statement, mnemonics={"table_1_col_1": "ID"}),
+        )
+        await engine.dispose()
+        return results
+
+    plain_df, renamed_df = asyncio.run(round_trip())
+
+    assert plain_df.equals(table)
+    assert list(renamed_df.columns) == ["ID", "table_1_col_2"]
@@ -0,0 +1,503 @@
+import logging
+import threading
+import tracemalloc
+import types
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import sqlalchemy as sqla
+
+import gswa_atratus as gdt
+from gswa_atratus.cygnet import (
+    Process,
+    Step,
+    StreamStep,
+    run_many,
+    summarize_step_metrics,
+    write_step_metrics,
+)
+from gswa_atratus.utils.cache import StepCache
+
+
+class Double(Step):
+    def canhandle(self, input_, global_cfg) -> bool:
+        return True
+
+    def run(self):
+        return self.input_ * 2
+
+
+class ReadNumber(Step):
+    """Parse the number in the file name, or stop the chain for names without one."""
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        if input_.stem == "fail":
+            raise gdt.KnownException("Cannot read this input.")
+        if "engine" in global_cfg:
+            with global_cfg["engine"].connect() as conn:
+                conn.execute(sqla.text("SELECT 1"))
+        return input_.stem.isdigit()
+
+    def run(self):
+        return int(self.input_.stem)
+
+
+def build_process(input_: Path, **global_cfg) -> Process:
+    process = Process("numbers", logging.getLogger("test"), input_=input_, **global_cfg)
+    process.addstep(ReadNumber("read"))
+    process.addstep(Double("double"))
+    return process
+
+
+def build_process_with_db(input_: Path, db_path: Path) -> Process:
+    return build_process(input_, engine=sqla.create_engine(f"sqlite:///{db_path}"))
+
+
+class TestRunMany:
+    @pytest.fixture
+    def inputs(self) -> list[Path]:
+        return [Path(f"{i}.txt") for i in range(20)]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_ordered(self, inputs, executor):
+        """Test if results come back in input order with their step history."""
+        results = list(
+            run_many(build_process, inputs, max_workers=3, executor=executor)
+        )
+        assert [r.input_ for r in results] == inputs
+        assert [r.output for r in results] == [2 * i for i in range(20)]
+        assert all(r.step_history == {"end": True} for r in results)
+
+    def test_unordered(self, inputs):
+        """Test if every input is returned when yielding as completed."""
+        results = run_many(build_process, inputs, max_workers=4, ordered=False)
+        assert sorted(r.output for r in results) == [2 * i for i in range(20)]
+
+    def test_bounded_in_flight(self, inputs):
+        """Test if inputs are consumed lazily, no further ahead than max_in_flight."""
+        consumed = []
+
+        def lazy_inputs():
+            for input_ in inputs:
+                consumed.append(input_)
+                yield input_
+
+        results = run_many(build_process, lazy_inputs(), max_workers=2, max_in_flight=3)
+        next(results)
+        assert len(consumed) <= 4
+
+    def test_failures(self):
+        """Test if stopped chains and exceptions are reported per input."""
+        results = list(run_many(build_process, [Path("a.txt"), Path("fail.txt")]))
+
+        assert results[0].output is None
+        assert results[0].step_history == {"read": False}
+        assert results[0].error is None
+        assert isinstance(results[1].error, gdt.KnownException)
+
+    def test_process_engines(self, tmp_path, inputs):
+        """Test if spawned workers build their own engines from a picklable factory."""
+        factory = partial(build_process_with_db, db_path=tmp_path / "runner.db")
+        results = list(run_many(factory, inputs[:4], max_workers=2, executor="process"))
+        assert [r.error for r in results] == [None] * 4
+        assert [r.output for r in results] == [0, 2, 4, 6]
+
+    @pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks")
+    def test_forked_engines(self, tmp_path, inputs):
+        """Test if forked workers can use engines inherited with the factory."""
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'runner.db'}")
+        with engine.connect() as conn:
+            conn.execute(sqla.text("SELECT 1"))
+
+        factory = partial(build_process, engine=engine)
+        results = run_many(
+            factory, inputs[:4], max_workers=2, executor="process", start_method="fork"
+        )
+        assert [r.output for r in results] == [0, 2, 4, 6]
+
+
+    @pytest.mark.parametrize("forked", [False, True])
+    def test_release_only_forked(self, tmp_path, monkeypatch, forked):
+        """Test if inherited engines are only released in forked workers."""
+        released = []
+        monkeypatch.setattr(
+            gdt.cygnet, "_release_inherited_engines", lambda cfg: released.append(cfg)
+        )
+        factory = partial(build_process_with_db, db_path=tmp_path / "runner.db")
+        monkeypatch.setattr(gdt.cygnet, "_WORKER_FACTORY", None)
+        monkeypatch.setattr(gdt.cygnet, "_WORKER_FORKED", False)
+
+        gdt.cygnet._init_worker(factory, forked)
+        result = gdt.cygnet._run_process_in_worker(Path("3.txt"))
+
+        assert result.output == 6
+        assert len(released) == forked
+
+
+class Counted(Step):
+    """Add ``offset`` to the input, counting the runs of each Step name."""
+
+    runs: dict[str, int] = {}
+    cache_cfg_keys = ("offset",)
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        self.offset = global_cfg.get("offset", 0)
+        return True
+
+    def run(self):
+        Counted.runs[self.name] = Counted.runs.get(self.name, 0) + 1
+        return self.input_ + self.offset
+
+
+def build_counted(input_: Path, cache: StepCache, **global_cfg) -> Process:
+    process = Process(
+        "counted", logging.getLogger("test"), step_cache=cache, input_=input_, **global_cfg
+    )
+    process.addstep(ReadNumber("read"))
+    process.addstep(Counted("add"))
+    process.addstep(Double("double"))
+    return process
+
+
+class TestStepCache:
+    @pytest.fixture(autouse=True)
+    def reset_runs(self):
+        Counted.runs = {}
+
+    @pytest.fixture
+    def input_(self, tmp_path) -> Path:
+        path = tmp_path / "21.txt"
+        path.write_text("")
+        return path
+
+    def test_resume(self, tmp_path, input_):
+        """Test if a rerun resumes from the last cached Step, skipping earlier Steps."""
+        cache = StepCache(tmp_path / "steps")
+        assert build_counted(input_, cache, offset=1).start() == 44
+        assert Counted.runs == {"add": 1}
+
+        process = build_counted(input_, cache, offset=1)
+        assert process.start() == 44
+        assert process.step_history == {"end": True}
+        assert Counted.runs == {"add": 1}
+
+        # A changed config value used by a Step reruns it, and every Step after it.
+        cache.invalidate(build_counted(input_, cache, offset=1).cache_keys()["double"])
+        assert build_counted(input_, cache, offset=2).start() == 46
+        assert Counted.runs == {"add": 2}
+
+    @pytest.mark.parametrize("content", [b"garbage", b"cmissing_module\nThing\n."])
+    def test_unreadable_entry(self, tmp_path, input_, content):
+        """Test if an unreadable cached output resumes from the Step before it."""
+        cache = StepCache(tmp_path / "steps")
+        assert build_counted(input_, cache, offset=1).start() == 44
+        key = build_counted(input_, cache, offset=1).cache_keys()["double"]
+        cache.path(key).write_bytes(content)
+
+        process = build_counted(input_, cache, offset=1)
+        assert process.start() == 44
+        assert Counted.runs == {"add": 1}
+        assert process.step_metrics["add"].cached
+        assert not process.step_metrics["double"].cached
+        assert cache.get(key) == 44
+
+    def test_invalidation(self, tmp_path, input_, monkeypatch):
+        """Test if a new Step version or a modified input misses the cache."""
+        cache = StepCache(tmp_path / "steps")
+        build_counted(input_, cache).start()
+
+        monkeypatch.setattr(Counted, "version", "2")
+        build_counted(input_, cache).start()
+        assert Counted.runs == {"add": 2}
+
+        input_.write_text("changed")
+        build_counted(input_, cache).start()
+        assert Counted.runs == {"add": 3}
+
+    def test_saving_steps_rerun(self, tmp_path, input_):
+        """Test if a Step that saves is never skipped, nor the Steps it depends on."""
+        saved = []
+
+        class Save(Double):
+            def save_method(self):
+                saved.append(self.output)
+
+        def build(input_):
+            process = build_counted(input_, cache)
+            process.addstep(Save("save", save=True))
+            process.addstep(Counted("after"))
+            return process
+
+        cache = StepCache(tmp_path / "steps")
+        assert build(input_).start() == 84
+        assert build(input_).start() == 84
+        assert saved == [84, 84]
+        assert Counted.runs == {"add": 1, "after": 1}
+
+    def test_constructor_params(self, tmp_path, input_):
+        """Test if Step parameters are part of the cache key by default."""
+
+        class Scale(Step):
+            def __init__(self, name, factor):
+                super().__init__(name)
+                self.factor = factor
+
+            def canhandle(self, input_, global_cfg) -> bool:
+                return True
+
+            def run(self):
+                return self.input_ * self.factor
+
+        def build(input_, factor):
+            process = build_counted(input_, cache)
+            process.addstep(Scale("scale", factor))
+            return process
+
+        cache = StepCache(tmp_path / "steps")
+        assert build(input_, 2).start() == 84
+        assert build(input_, 3).start() == 126
+        assert Counted.runs == {"add": 1}
+
+    def test_size_budget(self, tmp_path):
+        """Test if least recently used outputs are evicted over the size budget."""
+        cache = StepCache(tmp_path / "steps", max_bytes=200)
+        for i in range(50):
+            path = tmp_path / f"{i}.txt"
+            path.write_text("")
+            assert build_counted(path, cache).start() == 2 * i
+
+        assert sum(p.stat().st_size for p in cache.entries()) <= 200
+        assert len(cache.entries()) < 150
+
+
+class Chunks(StreamStep):
+    """Yield the numbers up to the one in the file name, in chunks of three."""
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        return input_.stem.isdigit()
+
+    def run(self):
+        numbers = range(int(self.input_.stem))
+        for start in range(0, len(numbers), 3):
+            self.events.append(f"read {start}")
+            yield list(numbers[start : start + 3])
+
+
+class Odd(StreamStep):
+    """Keep the odd numbers of each chunk, dropping chunks without any."""
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        return True
+
+    def run(self):
+        for chunk in self.input_:
+            self.events.append(f"odd {chunk[0]}")
+            yield [n for n in chunk if n % 2] or None
+
+
+class Total(Step):
+    def canhandle(self, input_, global_cfg) -> bool:
+        return True
+
+    def run(self):
+        return sum(sum(chunk) for chunk in self.input_)
+
+
+def build_stream(input_: Path, events: list, total: bool = True, **kwargs) -> Process:
+    process = Process("stream", logging.getLogger("test"), input_=input_, **kwargs)
+    for step in [Chunks("chunks"), Odd("odd")] + ([Total("total")] if total else []):
+        step.events = events
+        process.addstep(step)
+    return process
+
+
+class TestStreamStep:
+    def test_lazy_pipeline(self):
+        """Test if each chunk passes through the whole stream before the next is read."""
+        events = []
+        assert build_stream(Path("7.txt"), events).start() == 1 + 3 + 5
+        assert events == ["read 0", "odd 0", "read 3", "odd 3", "read 6", "odd 6"]
+
+    def test_trailing_stream(self):
+        """Test if a trailing stream is drained, counting chunks that were not dropped."""
+        process = build_stream(Path("7.txt"), [], total=False)
+        # [0, 1, 2] -> [1], [3, 4, 5] -> [3, 5], [6] -> dropped
+        assert process.start() == 2
+        assert process.step_history == {"end": True}
+
+    def test_stopped_stream(self):
+        """Test if a StreamStep that cannot handle the input stops the chain."""
+        process = build_stream(Path("a.txt"), [])
+        assert process.start() is None
+        assert process.step_history == {"chunks": False}
+
+    def test_not_cached(self, tmp_path):
+        """Test if streams are not cached, while Steps consuming them are."""
+        cache = StepCache(tmp_path / "steps")
+        input_ = tmp_path / "7.txt"
+        input_.write_text("")
+        build_stream(input_, [], step_cache=cache).start()
+        assert len(cache.entries()) == 1
+
+        events = []
+        assert build_stream(input_, events, step_cache=cache).start() == 9
+        assert events == []
+
+
+class Branch(Step):
+    """Wait for the other branch at a barrier, then add ``offset`` to the input."""
+
+    def __init__(self, name, offset, barrier=None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.offset = offset
+        self.barrier = barrier
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        return self.offset is not None
+
+    def run(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        return self.input_ + self.offset
+
+
+class Merge(Step):
+    def canhandle(self, input_, global_cfg) -> bool:
+        return True
+
+    def run(self):
+        return self.input_
+
+
+def build_dag(offset_a=10, offset_b=20, barrier=None, **kwargs) -> Process:
+    process = Process("dag", logging.getLogger("test"), input_=Path("4.txt"), **kwargs)
+    process.addstep(ReadNumber("read"))
+    process.addstep(Branch("a", offset_a, barrier, depends_on="read"))
+    process.addstep(Double("a2"))
+    process.addstep(Branch("b", offset_b, barrier, depends_on=["read"]))
+    process.addstep(Merge("merge", depends_on=["a2", "b"]))
+    return process
+
+
+class TestDag:
+    def test_parallel_branches(self):
+        """Test if independent branches run concurrently and merge into a dict."""
+        # Each branch waits for the other, which fails unless both run at once.
+        barrier = threading.Barrier(2, timeout=5)
+        process = build_dag(barrier=barrier)
+        assert process.upstreams() == {
+            "read": [],
+            "a": ["read"],
+            "b": ["read"],
+            "a2": ["a"],
+            "merge": ["a2", "b"],
+        }
+        assert process.start(max_workers=2) == {"a2": 28, "b": 24}
+        assert process.step_history == {"end": True}
+
+    def test_stopped_branch(self):
+        """Test if a None output stops only the Steps downstream of it."""
+        process = build_dag(offset_a=None)
+        process.addstep(Branch("c", 1, depends_on="b"))
+
+        assert process.start() is None
+        assert process.step_history == {"a": False}
+        assert process.step_dict["c"].output == 25
+        assert process.step_dict["merge"].output is None
+
+    def test_invalid_graph(self):
+        """Test if unknown dependencies and cycles are reported."""
+        process = build_dag()
+        process.addstep(Branch("c", 1, depends_on="missing"))
+        with pytest.raises(gdt.KnownException, match="missing"):
+            process.start()
+
+        process = build_dag()
+        process.step_dict["read"].depends_on = ["merge"]
+        with pytest.raises(gdt.KnownException, match="cycle"):
+            process.start()
+
+    def test_cached_branches(self, tmp_path):
+        """Test if a cached DAG skips every Step upstream of the cached outputs."""
+        cache = StepCache(tmp_path / "steps")
+        assert build_dag(step_cache=cache).start() == {"a2": 28, "b": 24}
+
+        process = build_dag(offset_b=30, step_cache=cache)
+        assert process.start() == {"a2": 28, "b": 34}
+        assert process.step_dict["a"].input_ is None
+
+
+class Frame(Step):
+    """Build a DataFrame with as many rows as the input number."""
+
+    def canhandle(self, input_, global_cfg) -> bool:
+        return True
+
+    def run(self):
+        return pd.DataFrame({"n": range(self.input_)})
+
+
+def build_metrics(input_: Path, **kwargs) -> Process:
+    process = Process("metrics", logging.getLogger("test"), input_=input_, **kwargs)
+    process.addstep(ReadNumber("read"))
+    process.addstep(Frame("frame"))
+    return process
+
+
+class TestStepMetrics:
+    def test_metrics(self):
+        """Test if each Step records timings and sizes, leaving step_history as before."""
+        process = build_metrics(Path("1000.txt"))
+        process.start()
+        assert process.step_history == {"end": True}
+        assert list(process.step_metrics) == ["read", "frame"]
+
+        frame = process.step_metrics["frame"]
+        assert frame.output_rows == 1000
+        assert frame.output_bytes >= 1000 * 8
+        assert frame.input_rows is None
+        assert frame.peak_memory_bytes is None
+        assert frame.wall_seconds >= frame.canhandle_seconds + frame.run_seconds > 0
+        assert frame.cpu_seconds > 0
+
+    def test_trace_memory(self):
+        """Test if peak memory is traced only while an opted-in Process runs."""
+        process = build_metrics(Path("100000.txt"), trace_memory=True)
+        process.start()
+        assert not tracemalloc.is_tracing()
+        assert process.step_metrics["frame"].peak_memory_bytes >= 100000 * 8
+
+    def test_cached(self, tmp_path):
+        """Test if Steps served from the cache are marked as cached."""
+        cache = StepCache(tmp_path / "steps")
+        input_ = tmp_path / "3.txt"
+        input_.write_text("")
+        build_metrics(input_, step_cache=cache).start()
+
+        process = build_metrics(input_, step_cache=cache)
+        process.start()
+        assert list(process.step_metrics) == ["frame"]
+        assert process.step_metrics["frame"].cached
+
+    def test_summary(self, tmp_path):
+        """Test if metrics aggregate across runs and are written with runtime metadata."""
+        inputs = [Path(f"{i}.txt") for i in range(5)] + [Path("a.txt")]
+        summary = summarize_step_metrics(run_many(build_metrics, inputs))
+
+        assert set(summary.index) == {"read", "frame"}
+        assert summary.loc["read", "runs"] == 6
+        assert summary.loc["frame", "runs"] == 5
+        assert summary.loc["frame", "output_rows_total"] == sum(range(5))
+        assert summary["wall_share"].sum() == pytest.approx(1)
+
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'out.db'}")
+        cygnet = types.ModuleType("my_cygnet")
+        cygnet.__version__ = "0.1"
+        gdt.write_db_metadata_table(engine, cygnet, "2025-01-01", config="{}")
+        write_step_metrics(engine, cygnet, "2025-01-01", summary, note="test")
+        written = pd.read_sql_table("step_metrics", engine)
+        assert written.loc[0, "frame.runs"] == 5
+        assert written.loc[0, "note"] == "test"
+        assert pd.read_sql_table("runtime_metadata", engine).loc[0, "config"] == "{}"
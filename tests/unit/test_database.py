@@ -1,12 +1,22 @@
 import datetime
 import json
+import logging
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 import pytest
 import sqlalchemy as sqla
+from sqlalchemy.dialects import mssql, postgresql
+from sqlalchemy.engine.default import CACHE_HIT
 
 import gswa_atratus as gdt
+from gswa_atratus.utils.bulk import (
+    _merge_sql,
+    _postgres_copy,
+    choose_chunksize,
+    choose_strategy,
+)
 
 
 @pytest.fixture
@@ -79,6 +89,38 @@ class TestConnect:
         engine, metadata = gdt.connect(cfg_path=valid_cfg[0])
         assert isinstance(engine, sqla.Engine) and isinstance(metadata, sqla.MetaData)
 
+    def test_connect_reuses_engine(self, valid_cfg):
+        """Test if repeated connects share one engine and metadata until disposed."""
+        first = gdt.connect(cfg_path=valid_cfg[0])
+        second = gdt.connect(cfg_path=valid_cfg[0])
+        unregistered = gdt.connect(cfg_path=valid_cfg[0], reuse=False)
+
+        assert first[0] is second[0] and first[1] is second[1]
+        assert unregistered[0] is not first[0]
+
+        gdt.database.dispose_engines()
+        assert gdt.connect(cfg_path=valid_cfg[0])[0] is not first[0]
+
+    def test_connect_pool_options(self, tmp_path):
+        """Test if pool tuning options in the config reach the engine's pool."""
+        config = {
+            "sqlalchemy": {
+                "sqlalchemy.url": f"sqlite:///{tmp_path / 'pooled.db'}",
+                "sqlalchemy.pool_size": "3",
+                "sqlalchemy.pool_recycle": "3600",
+                "sqlalchemy.pool_pre_ping": "false",
+            }
+        }
+        cfg_path = tmp_path / "pool_config.json"
+        with open(cfg_path, "w") as f:
+            json.dump(config, f)
+
+        engine, _ = gdt.connect(cfg_path=cfg_path)
+
+        assert engine.pool.size() == 3
+        assert engine.pool._recycle == 3600
+        assert engine.pool._pre_ping is False
+
     def test_connect_config_missing(self):
         """Test if a missing config file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -150,6 +192,332 @@ class TestSelect:
 
         assert result_df.equals(source_df)
 
+    def test_select_columnar(self, mocked_populated_db):
+        """Test if the columnar fetch path matches the source DataFrame and its dtypes."""
+        engine = mocked_populated_db[0]
+        metadata = mocked_populated_db[1]
+        source_df = mocked_populated_db[2]
+
+        metadata.reflect(engine)
+        statement = sqla.select(metadata.tables["test_select"])
+
+        result_df = gdt.select(engine=engine, statement=statement, columnar=True)
+
+        assert result_df.equals(source_df)
+
+    def test_select_columnar_nulls(self, mocked_connect):
+        """Test if NULLs in typed columns map to nullable dtypes and NaN/NaT."""
+        engine, metadata = mocked_connect
+        table = sqla.Table(
+            "nullable",
+            metadata,
+            sqla.Column("code", sqla.Integer),
+            sqla.Column("value", sqla.Float),
+            sqla.Column("sampled", sqla.DateTime),
+        )
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [
+                    {"code": 1, "value": 0.5, "sampled": datetime.datetime(2020, 1, 1)},
+                    {"code": None, "value": None, "sampled": None},
+                ],
+            )
+
+        result_df = gdt.select(engine, sqla.select(table), columnar=True)
+
+        assert str(result_df["code"].dtype) == "Int64"
+        assert result_df["code"].isna().tolist() == [False, True]
+        assert result_df["value"].dtype == "float64"
+        assert result_df["sampled"].dtype == "datetime64[ns]"
+        assert result_df["sampled"].isna().tolist() == [False, True]
+
+    def test_select_columnar_out_of_range_datetimes(self, mocked_connect):
+        """Test if datetimes beyond the datetime64[ns] range are kept, not overflowed."""
+        engine, metadata = mocked_connect
+        table = sqla.Table("far_future", metadata, sqla.Column("sampled", sqla.DateTime))
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [{"sampled": datetime.datetime(9999, 12, 31)}, {"sampled": None}],
+            )
+
+        result_df = gdt.select(engine, sqla.select(table), columnar=True)
+
+        assert result_df["sampled"].iloc[0] == datetime.datetime(9999, 12, 31)
+        assert result_df["sampled"].isna().tolist() == [False, True]
+        assert result_df.equals(gdt.select(engine, sqla.select(table)))
+
+    def test_select_columnar_nullable_booleans(self, mocked_connect):
+        """Test if NULLs in a boolean column map to the nullable boolean dtype."""
+        engine, metadata = mocked_connect
+        table = sqla.Table("flags", metadata, sqla.Column("flag", sqla.Boolean))
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(), [{"flag": True}, {"flag": None}, {"flag": False}]
+            )
+
+        result_df = gdt.select(engine, sqla.select(table), columnar=True)
+
+        assert str(result_df["flag"].dtype) == "boolean"
+        assert result_df["flag"].isna().tolist() == [False, True, False]
+        assert result_df["flag"].tolist()[::2] == [True, False]
+
+    def test_select_iter(self, mocked_populated_db):
+        """Test if streamed chunks are bounded in size and rebuild the source DataFrame."""
+        engine = mocked_populated_db[0]
+        metadata = mocked_populated_db[1]
+        source_df = mocked_populated_db[2]
+
+        metadata.reflect(engine)
+        statement = sqla.select(metadata.tables["test_select"])
+
+        chunks = list(gdt.select_iter(engine=engine, statement=statement, chunksize=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert pd.concat(chunks, ignore_index=True).equals(source_df)
+
+    def test_select_iter_mnemonics(self, mocked_populated_db):
+        """Test if mnemonics are applied to every streamed chunk."""
+        engine = mocked_populated_db[0]
+        metadata = mocked_populated_db[1]
+
+        metadata.reflect(engine)
+        statement = sqla.select(metadata.tables["test_select"])
+
+        chunks = gdt.select_iter(
+            engine, statement, mnemonics={"col_1": "DEPTH"}, chunksize=3
+        )
+
+        assert all("DEPTH" in chunk.columns for chunk in chunks)
+
+    def test_select_many(self, mocked_connect):
+        """Test if one parameterised statement runs per parameter set, compiled once."""
+        engine, _ = mocked_connect
+        gdt.insert(engine, "holes", pd.DataFrame({"id": [1, 2, 3], "project": list("AAB")}))
+        holes = sqla.Table("holes", sqla.MetaData(), autoload_with=engine)
+        statement = sqla.select(holes.c.id).where(
+            holes.c.project == sqla.bindparam("project")
+        )
+
+        cache_hits = []
+
+        @sqla.event.listens_for(engine, "after_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            cache_hits.append(context.cache_hit)
+
+        frames = list(
+            gdt.select_many(engine, statement, [{"project": "A"}, {"project": "B"}])
+        )
+
+        assert [df["id"].tolist() for df in frames] == [[1, 2], [3]]
+        assert cache_hits[1:] == [CACHE_HIT]
+        assert gdt.select(engine, statement, params={"project": "B"})["id"].tolist() == [3]
+
+    def test_select_compact_dtypes(self, mocked_connect):
+        """Test if the compact policy downcasts numbers and categorises repeated strings."""
+        engine, metadata = mocked_connect
+        table = sqla.Table(
+            "assays",
+            metadata,
+            sqla.Column("code", sqla.Integer),
+            sqla.Column("flag", sqla.Integer),
+            sqla.Column("grade", sqla.Float),
+            sqla.Column("ppm", sqla.Float),
+            sqla.Column("lithology", sqla.String),
+        )
+        metadata.create_all(engine)
+        rows = [
+            {
+                "code": i,
+                "flag": None if i % 2 else 1,
+                "grade": 0.1 * i,
+                "ppm": float(i),
+                "lithology": ["BIF", "GRANITE"][i % 2],
+            }
+            for i in range(100)
+        ]
+        with engine.begin() as conn:
+            conn.execute(table.insert(), rows)
+        statement = sqla.select(table)
+
+        plain = gdt.select(engine, statement)
+        compact = gdt.select(
+            engine, statement, dtypes={"policy": "compact", "columns": {"grade": "float32"}}
+        )
+
+        assert compact.dtypes.astype(str).tolist() == [
+            "int8",
+            "Int8",
+            "float32",
+            "float32",
+            "category",
+        ]
+        assert compact["flag"].isna().sum() == 50
+        assert compact["ppm"].tolist() == plain["ppm"].tolist()
+        assert compact.memory_usage(deep=True).sum() < plain.memory_usage(deep=True).sum() / 3
+
+    def test_select_dtypes_from_config(self, mocked_connect, tmp_path):
+        """Test if a dtypes section in the statement config is applied by select."""
+        engine, metadata = mocked_connect
+        gdt.insert(engine, "codes", pd.DataFrame({"code": [1, 2, 3], "name": list("abc")}))
+        cfg_path = tmp_path / "dtypes.json"
+        with open(cfg_path, "w") as f:
+            json.dump(
+                {
+                    "statement_configs": {
+                        "selection": {"codes": ["code", "name"]},
+                        "joins": [],
+                        "aliases": {},
+                        "dtypes": {"policy": "compact", "columns": {"name": "category"}},
+                    }
+                },
+                f,
+            )
+        statement = gdt.load_statement(cfg_path, engine, metadata)
+
+        df = gdt.select(engine, statement, mnemonics={"name": "NAME"})
+
+        assert df.dtypes.astype(str).tolist() == ["int8", "category"]
+        assert list(df.columns) == ["code", "NAME"]
+        assert gdt.select(engine, statement, dtypes="infer")["code"].dtype == "int64"
+
+
+class TestSelectPartitioned:
+    @pytest.fixture
+    def file_db(self, tmp_path) -> tuple[sqla.Engine, sqla.Select, pd.DataFrame]:
+        """A file-backed database shared by every pooled connection."""
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'partitioned.db'}")
+        source_df = pd.DataFrame(
+            {
+                "hole_id": [-5, -3, -1, 0, 1, 2, 3, None],
+                "depth": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0],
+            }
+        )
+        gdt.insert(engine, "collars", source_df)
+        metadata = sqla.MetaData()
+        metadata.reflect(engine)
+        return engine, sqla.select(metadata.tables["collars"]), source_df
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"key": "hole_id", "partitions": 3},
+            {"key": "depth", "partitions": 4},
+            {"key": "hole_id", "bounds": [3, 100]},
+            {"key": "hole_id", "partitions": 3, "strategy": "modulo"},
+        ],
+    )
+    def test_partitions_cover_all_rows(self, file_db, kwargs):
+        """Test if the partitions together return every row exactly once."""
+        engine, statement, source_df = file_db
+
+        result_df = gdt.select_partitioned(engine, statement, **kwargs)
+
+        assert result_df.sort_values("depth", ignore_index=True).equals(source_df)
+
+    @pytest.mark.filterwarnings("error::FutureWarning")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("dtypes", [None, "compact"])
+    def test_partition_dtypes(self, file_db, columnar, dtypes):
+        """Test if the combined partitions have the dtypes of a single select."""
+        engine, statement, _ = file_db
+        statement = statement.execution_options(dtypes=dtypes)
+
+        result_df = gdt.select_partitioned(
+            engine, statement, "hole_id", partitions=3, columnar=columnar
+        )
+
+        expected = gdt.select(engine, statement, columnar=columnar)
+        assert result_df.sort_values("depth", ignore_index=True).equals(expected)
+
+    def test_partitioned_iter(self, file_db):
+        """Test if yielded partitions recombine into the full result."""
+        engine, statement, source_df = file_db
+
+        frames = list(gdt.select_partitioned_iter(engine, statement, "depth"))
+
+        assert sum(len(df) for df in frames) == len(source_df)
+
+
+class TestQueryCache:
+    @pytest.fixture
+    def statement(self, mocked_populated_db) -> sqla.Select:
+        engine, metadata, _ = mocked_populated_db
+        metadata.reflect(engine)
+        return sqla.select(metadata.tables["test_select"])
+
+    def test_warm_select_reads_cache(self, mocked_populated_db, statement, tmp_path):
+        """Test if a cached result is returned after the source table is gone."""
+        engine, _, source_df = mocked_populated_db
+        cache = gdt.QueryCache(tmp_path / "cache")
+
+        gdt.select(engine, statement, cache=cache)
+        with engine.begin() as conn:
+            conn.execute(sqla.text("DROP TABLE test_select"))
+        result_df = gdt.select(engine, statement, mnemonics={"col_1": "A"}, cache=cache)
+
+        assert result_df.equals(source_df.rename(columns={"col_1": "A"}))
+
+    def test_invalidate(self, mocked_populated_db, statement, tmp_path):
+        """Test if invalidated entries are no longer served."""
+        engine, _, _ = mocked_populated_db
+        cache = gdt.QueryCache(tmp_path / "cache")
+
+        gdt.select(engine, statement, cache=cache)
+        gdt.select(engine, statement, columnar=True, cache=cache)
+        key = cache.key(engine, statement)
+        columnar_key = cache.key(engine, statement, columnar=True)
+        assert key in cache and columnar_key in cache
+
+        cache.invalidate(key)
+        assert key not in cache
+        assert columnar_key in cache
+
+    def test_failed_write(
+        self, mocked_populated_db, statement, tmp_path, monkeypatch, caplog
+    ):
+        """Test if select still returns its result when the cache cannot store it."""
+        engine, _, source_df = mocked_populated_db
+        cache = gdt.QueryCache(tmp_path / "cache")
+
+        def full_disk(key, write):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(cache, "store", full_disk)
+        with caplog.at_level(logging.WARNING):
+            result_df = gdt.select(engine, statement, cache=cache)
+
+        assert result_df.equals(source_df)
+        assert "not cached" in caplog.text
+        assert cache.entries() == []
+
+    def test_ttl_expiry(self, mocked_populated_db, statement, tmp_path):
+        """Test if entries past their time-to-live are treated as missing."""
+        engine, _, _ = mocked_populated_db
+        cache = gdt.QueryCache(tmp_path / "cache", ttl=-1)
+
+        gdt.select(engine, statement, cache=cache)
+
+        assert cache.entries() == []
+
+    def test_size_eviction(self, mocked_populated_db, tmp_path):
+        """Test if the least recently used entry is evicted over the size budget."""
+        engine, metadata, _ = mocked_populated_db
+        metadata.reflect(engine)
+        table = metadata.tables["test_select"]
+        cache = gdt.QueryCache(tmp_path / "cache")
+
+        gdt.select(engine, sqla.select(table.c.col_1), cache=cache)
+        cache.max_bytes = cache.entries()[0].stat().st_size
+        gdt.select(engine, sqla.select(table.c.col_3), cache=cache)
+
+        assert cache.key(engine, sqla.select(table.c.col_1)) not in cache
+        assert cache.key(engine, sqla.select(table.c.col_3)) in cache
+
 
 class TestInsert:
     def test_insert(self, mocked_populated_db):
@@ -175,6 +543,211 @@ class TestInsert:
 
         assert result_of_insert_df.equals(result_of_select_df)
 
+    @pytest.mark.parametrize(
+        "strategy", ["auto", "driver", "multi", "executemany"]
+    )
+    def test_insert_strategies(self, mocked_connect, strategy):
+        """Test if every SQLite-capable strategy round trips values, NULLs and datetimes."""
+        engine, metadata = mocked_connect
+        source_df = pd.DataFrame(
+            {
+                "depth": [1.5, None, 3.0],
+                "lithology": ["shale", None, "granite"],
+                "logged": pd.to_datetime(["2020-01-01", None, "2021-06-30"]),
+            }
+        )
+
+        stats = gdt.insert(engine, "bulk", source_df, strategy=strategy, chunksize=2)
+
+        metadata.reflect(engine)
+        result_df = gdt.select(engine, sqla.select(metadata.tables["bulk"]))
+        assert stats.rows == 3
+        assert stats.strategy == ("driver" if strategy == "auto" else strategy)
+        assert result_df.equals(source_df)
+
+    @pytest.mark.parametrize("unique_key", [False, True])
+    def test_upsert(self, mocked_connect, unique_key):
+        """Test if upsert updates matched keys, inserts new keys and keeps the rest."""
+        engine, metadata = mocked_connect
+        existing = pd.DataFrame({"hole_id": [1, 2, 3], "depth": [10.0, 20.0, 30.0]})
+        gdt.insert(engine, "collars", existing)
+        if unique_key:
+            with engine.begin() as conn:
+                conn.execute(sqla.text("CREATE UNIQUE INDEX ix_hole ON collars (hole_id)"))
+
+        changes = pd.DataFrame({"hole_id": [2, 4, 4], "depth": [25.0, 0.0, 40.0]})
+        stats = gdt.insert(engine, "collars", changes, if_exists="upsert", keys=["hole_id"])
+
+        metadata.reflect(engine)
+        result_df = gdt.select(
+            engine, sqla.select(metadata.tables["collars"]).order_by("hole_id")
+        )
+        assert stats.strategy == (
+            "upsert:on_conflict" if unique_key else "upsert:update_insert"
+        )
+        assert result_df["depth"].tolist() == [10.0, 25.0, 30.0, 40.0]
+        assert sqla.inspect(engine).get_table_names() == ["collars"]
+
+    def test_upsert_requires_keys(self, mocked_connect, dummy_data):
+        """Test if upsert without key columns is rejected."""
+        engine, _ = mocked_connect
+        with pytest.raises(ValueError):
+            gdt.insert(engine, "table", dummy_data[1], if_exists="upsert")
+
+    def test_mssql_merge_sql(self):
+        """Test if the SQL Server upsert renders a single MERGE statement."""
+        metadata = sqla.MetaData()
+        target = sqla.Table("collars", metadata, sqla.Column("hole_id"), sqla.Column("depth"))
+        staging = sqla.Table("_stage", metadata, sqla.Column("hole_id"), sqla.Column("depth"))
+        conn = mock.Mock(dialect=mssql.dialect())
+
+        sql = _merge_sql(conn, target, staging, ["hole_id", "depth"], ["hole_id"])
+
+        assert sql.startswith("MERGE INTO collars WITH (HOLDLOCK) AS target USING _stage")
+        assert "WHEN MATCHED THEN UPDATE SET target.depth = source.depth" in sql
+        assert sql.endswith("VALUES (source.hole_id, source.depth);")
+
+    def test_postgres_copy_keeps_empty_strings(self):
+        """Test if COPY writes NULL and empty strings differently."""
+        table = sqla.Table("collars", sqla.MetaData(), sqla.Column("id"), sqla.Column("name"))
+        written = []
+        cursor = mock.Mock(copy_expert=lambda sql, f: written.append((sql, f.read())))
+        conn = mock.Mock(dialect=postgresql.dialect())
+        conn.connection.dbapi_connection.cursor.return_value = cursor
+
+        rows = [(1, ""), (2, None), (3, 'say "hi"')]
+        n_rows = _postgres_copy(mock.Mock(table=table), conn, ["id", "name"], iter(rows))
+
+        sql, data = written[0]
+        assert n_rows == 3
+        assert sql == "COPY collars (id, name) FROM STDIN WITH CSV"
+        assert data.splitlines() == ['1,""', "2,", '3,"say ""hi"""']
+
+    def test_mssql_strategy(self):
+        """Test if SQL Server loads through pyodbc fast_executemany, with VALUES limits kept."""
+        assert choose_strategy(mssql.dialect()) == "fast_executemany"
+        assert choose_chunksize(mssql.dialect(), "multi", 1) == 1000
+        assert choose_chunksize(mssql.dialect(), "multi", 10) == 209
+
+
+class TestSqliteBulkLoad:
+    @staticmethod
+    def pragma(engine: sqla.Engine, name: str):
+        with engine.connect() as conn:
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_profile_applied_and_restored(self, tmp_path, dummy_data):
+        """Test if bulk pragmas apply inside the block and indexes return afterwards."""
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'local.db'}")
+        gdt.insert(engine, "samples", dummy_data[1])
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX ix_samples_col_1 ON samples (col_1)")
+
+        with gdt.sqlite_bulk_load(engine):
+            assert self.pragma(engine, "journal_mode") == "wal"
+            assert self.pragma(engine, "synchronous") == 0
+            assert sqla.inspect(engine).get_indexes("samples") == []
+            gdt.insert(engine, "samples", dummy_data[1], if_exists="append")
+
+        assert self.pragma(engine, "journal_mode") == "delete"
+        assert self.pragma(engine, "synchronous") == 2
+        indexes = sqla.inspect(engine).get_indexes("samples")
+        assert [index["name"] for index in indexes] == ["ix_samples_col_1"]
+
+    def test_replaced_table(self, tmp_path, dummy_data, caplog):
+        """Test if indexes of a table replaced without their columns are skipped."""
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'local.db'}")
+        gdt.insert(engine, "samples", dummy_data[1])
+        gdt.insert(engine, "holes", dummy_data[1])
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX ix_samples_col_1 ON samples (col_1)")
+            conn.exec_driver_sql("CREATE INDEX ix_holes_col_1 ON holes (col_1)")
+
+        with caplog.at_level(logging.WARNING, logger="gswa_atratus.database"):
+            with gdt.sqlite_bulk_load(engine):
+                gdt.insert(engine, "samples", pd.DataFrame({"other": [1, 2]}))
+                gdt.insert(engine, "holes", dummy_data[1])
+
+        assert sqla.inspect(engine).get_indexes("samples") == []
+        indexes = sqla.inspect(engine).get_indexes("holes")
+        assert [index["name"] for index in indexes] == ["ix_holes_col_1"]
+        assert "Index [ix_samples_col_1] was not recreated" in caplog.text
+        assert self.pragma(engine, "journal_mode") == "delete"
+
+    def test_block_error_not_masked(self, tmp_path, dummy_data):
+        """Test if an error in the block is raised, not a failure to recreate indexes."""
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'local.db'}")
+        gdt.insert(engine, "samples", dummy_data[1])
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX ix_samples_col_1 ON samples (col_1)")
+
+        with pytest.raises(KeyError, match="from the block"):
+            with gdt.sqlite_bulk_load(engine):
+                # An index of the same name makes recreating the deferred one fail.
+                with engine.begin() as conn:
+                    conn.exec_driver_sql("CREATE INDEX ix_samples_col_1 ON samples (col_2)")
+                raise KeyError("from the block")
+
+    def test_rejects_other_dialects(self):
+        """Test if a non-SQLite engine is rejected."""
+        engine = mock.Mock(dialect=mssql.dialect(), url="mssql+pyodbc://dsn")
+        with pytest.raises(ValueError):
+            with gdt.sqlite_bulk_load(engine):
+                pass
+
+
+class TestBulkWriter:
+    @pytest.fixture
+    def file_engine(self, tmp_path) -> sqla.Engine:
+        """A file-backed engine, shared by the writer thread's pooled connections."""
+        return sqla.create_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+
+    def test_writes_all_chunks(self, file_engine, dummy_data):
+        """Test if every chunk written through the queue lands in the table in order."""
+        source_df = dummy_data[1]
+        chunks = [source_df.iloc[i : i + 2] for i in range(0, len(source_df), 2)]
+
+        with gdt.database.BulkWriter(
+            file_engine, "written", max_queue=1, batch_size=2
+        ) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        metadata = sqla.MetaData()
+        metadata.reflect(file_engine)
+        result_df = gdt.select(file_engine, sqla.select(metadata.tables["written"]))
+        assert writer.rows == len(source_df)
+        assert result_df.equals(source_df)
+
+    def test_first_chunk_replaces(self, file_engine, dummy_data):
+        """Test if if_exists applies to the first chunk only."""
+        source_df = dummy_data[1]
+        gdt.insert(file_engine, "written", source_df)
+
+        writer = gdt.database.BulkWriter(file_engine, "written", if_exists="replace")
+        writer.write(source_df)
+        writer.write(source_df)
+        writer.close()
+
+        metadata = sqla.MetaData()
+        metadata.reflect(file_engine)
+        result_df = gdt.select(file_engine, sqla.select(metadata.tables["written"]))
+        assert len(result_df) == 2 * len(source_df)
+
+    def test_error_propagates(self, file_engine, dummy_data):
+        """Test if a failure in the writer thread is raised to the caller."""
+        source_df = dummy_data[1]
+        gdt.insert(file_engine, "written", source_df)
+
+        writer = gdt.database.BulkWriter(file_engine, "written", if_exists="fail")
+        writer.write(source_df)
+        with pytest.raises(ValueError, match="already exists"):
+            writer.flush()
+        with pytest.raises(ValueError):
+            writer.write(source_df)
+        with pytest.raises(ValueError):
+            writer.close()
+
 
 def test_write_db_metadata_table(mocked_connect):
     engine, metadata = mocked_connect
@@ -191,3 +764,150 @@ def test_write_db_metadata_table(mocked_connect):
         test in returned_db
         for test in ["gswa_atratus", "cygnet", "utc_iso_start", "test_meta"]
     )
+
+
+class TestSelectShared:
+    @pytest.fixture
+    def db(self) -> sqla.Engine:
+        engine = sqla.create_engine("sqlite+pysqlite:///:memory:")
+        gdt.insert(engine, "holes", pd.DataFrame({"id": [1, 2, 3], "project": list("AAB")}))
+        gdt.insert(engine, "samples", pd.DataFrame({"id": [1, 1, 3], "depth": [1.0, 2.0, 3.0]}))
+        return engine
+
+    def stmt_cfg(self, selection, **extra) -> dict:
+        return {
+            "selection": selection,
+            "joins": [{"samples": [["samples", "id"], ["holes", "id"]]}],
+            "aliases": {},
+            **extra,
+        }
+
+    def test_shared_scan(self, db):
+        """Test if compatible configs run as one query and split back per config."""
+        cfgs = [
+            self.stmt_cfg({"holes": ["id", "project"]}),
+            self.stmt_cfg({"holes": ["project", "id"], "samples": ["depth"]}),
+            self.stmt_cfg({"holes": ["id", "project"]}),
+            self.stmt_cfg(
+                {"holes": ["id"]},
+                filters={"column": ["holes", "project"], "op": "==", "value": "B"},
+            ),
+        ]
+        executed = []
+        sqla.event.listen(
+            db, "before_cursor_execute", lambda *args: executed.append(args[2])
+        )
+
+        frames = gdt.select_shared(db, sqla.MetaData(), cfgs)
+
+        assert len([sql for sql in executed if "FROM holes" in sql]) == 2
+        for cfg, df in zip(cfgs, frames):
+            expected = gdt.select(
+                db, gdt.utils.statements.build_statement(db, sqla.MetaData(), cfg)
+            )
+            assert df.reset_index(drop=True).equals(expected)
+        assert frames[0] is not frames[2]
+
+    def test_dropped_mnemonics(self, db):
+        """Test if columns dropped by mnemonics are left out of every split result."""
+        mnemonics = {"holes.id": "drop", "project": "PROJECT"}
+        cfgs = [
+            self.stmt_cfg({"holes": ["id", "project"]}, mnemonics=mnemonics),
+            self.stmt_cfg({"holes": ["project"], "samples": ["depth"]}, mnemonics=mnemonics),
+        ]
+
+        frames = gdt.select_shared(db, sqla.MetaData(), cfgs)
+
+        assert [list(df.columns) for df in frames] == [["PROJECT"], ["PROJECT", "depth"]]
+        assert [len(df) for df in frames] == [4, 4]
+
+    @pytest.mark.parametrize("mnemonics", [None, {"samples.id": "SAMPLE_ID"}])
+    def test_same_named_columns(self, db, mnemonics):
+        """Test if same-named columns of different tables keep their standalone names."""
+        cfgs = [
+            self.stmt_cfg({"holes": ["id", "project"]}, mnemonics=mnemonics),
+            self.stmt_cfg(
+                {"holes": ["project"], "samples": ["id", "depth"]}, mnemonics=mnemonics
+            ),
+            self.stmt_cfg({"holes": ["id"], "samples": ["id"]}, mnemonics=mnemonics),
+        ]
+
+        frames = gdt.select_shared(db, sqla.MetaData(), cfgs)
+
+        for cfg, df in zip(cfgs, frames):
+            expected = gdt.select(
+                db, gdt.utils.statements.build_statement(db, sqla.MetaData(), cfg)
+            )
+            assert df.reset_index(drop=True).equals(expected)
+        sample_id = "SAMPLE_ID" if mnemonics else "id"
+        assert list(frames[1].columns) == ["project", sample_id, "depth"]
+
+    def test_distinct_not_merged(self, db):
+        """Test if a distinct config is not merged with a config selecting other columns."""
+        scans = gdt.utils.statements.plan_shared_scans(
+            [
+                self.stmt_cfg({"holes": ["project"]}, distinct=True),
+                self.stmt_cfg({"holes": ["id", "project"]}),
+            ]
+        )
+        assert len(scans) == 2
+
+
+class TestProfileSelect:
+    def test_profile_select(self, mocked_populated_db, tmp_path):
+        """Test if profiling returns the same data with SQL, plan, timings and sizes."""
+        engine, metadata, source_df = mocked_populated_db
+        metadata.reflect(engine)
+        table = metadata.tables["test_select"]
+        statement = sqla.select(table).where(table.c.col_1.in_([1, 2]))
+
+        df, profile = gdt.profile_select(engine, statement)
+
+        assert df.equals(source_df)
+        assert "IN (?, ?)" in profile.sql
+        assert "SCAN test_select" in profile.plan
+        assert profile.rows == 5
+        assert profile.bytes > 0
+        assert profile.total_seconds >= profile.execute_seconds >= 0
+
+        record = json.loads(profile.to_json(tmp_path / "profile.json"))
+        assert record["rows"] == 5
+        assert json.loads((tmp_path / "profile.json").read_text())["sql"] == profile.sql
+
+    def test_profile_parameterised(self, mocked_populated_db):
+        """Test if a statement with config parameters is compiled with their values."""
+        engine, metadata, source_df = mocked_populated_db
+        stmt_cfg = {
+            "selection": {"test_select": ["col_1", "col_2"]},
+            "joins": [],
+            "aliases": {},
+            "parameters": {"ids": None},
+            "filters": {
+                "column": ["test_select", "col_1"],
+                "op": "in",
+                "value": {"param": "ids"},
+            },
+        }
+        statement = gdt.utils.statements.build_statement(engine, metadata, stmt_cfg)
+
+        df, profile = gdt.profile_select(engine, statement, params={"ids": [1, 2]})
+
+        assert df.equals(source_df[["col_1", "col_2"]])
+        assert "IN (?, ?)" in profile.sql
+        assert sorted(profile.params.values()) == [1, 2]
+        assert "SCAN test_select" in profile.plan
+
+    def test_profile_to_metadata_table(self, mocked_populated_db):
+        """Test if a profile can be recorded with write_db_metadata_table."""
+        engine, metadata, _ = mocked_populated_db
+        metadata.reflect(engine)
+        _, profile = gdt.profile_select(
+            engine, sqla.select(metadata.tables["test_select"]), columnar=True
+        )
+
+        cygnet = mock.Mock(__name__="cygnet", __version__="0.0.1")
+        gdt.write_db_metadata_table(engine, cygnet, "2025-01-01", **profile.to_dict())
+
+        recorded = pd.read_sql_table("runtime_metadata", engine)
+        assert recorded["rows"].tolist() == [5]
+        assert "SCAN test_select" in recorded["plan"][0]
@@ -107,7 +107,7 @@ class TestStatement:
         statement_str = str(statement)
         assert (
             statement_str
-            == "SELECT table_1_label.table_1_col_1, table_1_label.table_1_col_2, table_2_label.table_2_col_1, table_2_label.table_2_col_2 \nFROM table_1 AS table_1_label LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1 LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1"
+            == "SELECT table_1_label.table_1_col_1, table_1_label.table_1_col_2, table_2_label.table_2_col_1, table_2_label.table_2_col_2 \nFROM table_1 AS table_1_label LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1"
         )
 
     def test_bad_config(self, mocked_db_valid, invalid_cfg_disk):
@@ -137,7 +137,7 @@ class TestStatement:
         statement_str = str(statement)
         assert (
             statement_str
-            == "SELECT table_1_label.table_1_col_1, table_1_label.table_1_col_2, table_2_label.table_2_col_1, table_2_label.table_2_col_2 \nFROM table_1 AS table_1_label LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1 LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1"
+            == "SELECT table_1_label.table_1_col_1, table_1_label.table_1_col_2, table_2_label.table_2_col_1, table_2_label.table_2_col_2 \nFROM table_1 AS table_1_label LEFT OUTER JOIN table_2 AS table_2_label ON table_2_label.table_2_col_1 = table_1_label.table_1_col_1"
         )
 
     def test_statement_builder_missingtable(
@@ -179,3 +179,541 @@ class TestStatement:
             )
 
         assert "specified in config, does not exist in table" in str(excinfo.value)
+
+
+class TestReflectionCache:
+    @pytest.fixture
+    def file_db(self, tmp_path) -> sqla.Engine:
+        engine = sqla.create_engine(f"sqlite:///{tmp_path / 'reflect.db'}")
+        for t_number in [1, 2]:
+            table = pd.DataFrame(
+                {f"table_{t_number}_col_1": [1, 2, 3], f"table_{t_number}_col_2": [1, 2, 3]}
+            )
+            gdt.insert(engine, f"table_{t_number}", table)
+        return engine
+
+    def build(self, engine, cache):
+        return gdt.utils.statement_builder(
+            engine=engine,
+            metadata=sqla.MetaData(),
+            selection={"table_1": ["table_1_col_1", "table_1_col_2"]},
+            joins=[],
+            alias={"table_1": "table_1_label"},
+            reflection_cache=cache,
+        )
+
+    def test_warm_cache_matches_reflection(self, file_db, tmp_path):
+        """Test if statements built from cold and warm caches match plain reflection."""
+        cache = gdt.utils.ReflectionCache(tmp_path / "cache")
+        expected = str(self.build(file_db, None))
+
+        assert str(self.build(file_db, cache)) == expected
+        assert len(cache.entries()) == 1
+        assert str(self.build(file_db, cache)) == expected
+
+    def test_cache_hit_skips_reflection(self, file_db, tmp_path, monkeypatch):
+        """Test if a warm cache builds the table without reflecting it again."""
+        cache = gdt.utils.ReflectionCache(tmp_path / "cache")
+        self.build(file_db, cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("table was reflected")
+
+        monkeypatch.setattr(sqla.Table, "_autoload", fail)
+        statement = self.build(file_db, cache)
+        assert "table_1_label.table_1_col_2" in str(statement)
+
+    def test_schema_change_invalidates(self, file_db, tmp_path):
+        """Test if altering the table is picked up instead of serving the stale entry."""
+        cache = gdt.utils.ReflectionCache(tmp_path / "cache")
+        self.build(file_db, cache)
+        with file_db.begin() as conn:
+            conn.execute(sqla.text("ALTER TABLE table_1 ADD COLUMN table_1_col_3 INTEGER"))
+
+        table = cache.table(file_db, sqla.MetaData(), "table_1")
+        assert "table_1_col_3" in table.c
+
+    def test_missing_table(self, file_db, tmp_path):
+        """Test if a missing table still raises a KnownException through the cache."""
+        cache = gdt.utils.ReflectionCache(tmp_path / "cache")
+        with pytest.raises(gdt.KnownException) as excinfo:
+            gdt.utils.statement_builder(
+                engine=file_db,
+                metadata=sqla.MetaData(),
+                selection={"missing": ["col"]},
+                joins=[],
+                alias={},
+                reflection_cache=cache,
+            )
+        assert "does not exist in engine" in str(excinfo.value)
+
+
+class TestReflectionModes:
+    @pytest.fixture
+    def pooled_db(self, tmp_path) -> sqla.Engine:
+        engine = sqla.create_engine(
+            f"sqlite:///{tmp_path / 'modes.db'}", poolclass=sqla.pool.QueuePool
+        )
+        for t_number in [1, 2, 3]:
+            table = pd.DataFrame(
+                {f"table_{t_number}_col_1": [1, 2, 3], f"table_{t_number}_col_2": [1, 2, 3]}
+            )
+            gdt.insert(engine, f"table_{t_number}", table)
+        return engine
+
+    @pytest.fixture
+    def cfg(self) -> dict:
+        return {
+            "selection": {"table_1": ["table_1_col_1"], "table_2": ["table_2_col_2"]},
+            # table_3 is only joined, not selected.
+            "joins": [
+                {"table_2": [["table_2", "table_2_col_1"], ["table_1", "table_1_col_1"]]},
+                {"table_3": [["table_3", "table_3_col_1"], ["table_1", "table_1_col_1"]]},
+            ],
+            "aliases": {"table_1": "t1"},
+        }
+
+    def build(self, engine, cfg, mode):
+        return gdt.utils.statement_builder(
+            engine=engine,
+            metadata=sqla.MetaData(),
+            selection=cfg["selection"],
+            joins=cfg["joins"],
+            alias=cfg["aliases"],
+            reflection=mode,
+        )
+
+    @pytest.mark.parametrize("mode", ["batch", "concurrent"])
+    def test_modes_match_serial(self, pooled_db, cfg, mode):
+        """Test if batch and concurrent reflection build the same statement as serial."""
+        expected = str(self.build(pooled_db, cfg, "serial"))
+        assert str(self.build(pooled_db, cfg, mode)) == expected
+
+    def test_concurrent_memory_db(self, mocked_db_valid):
+        """Test if concurrent reflection falls back to one connection for in-memory SQLite."""
+        engine, _ = mocked_db_valid
+        statement = gdt.utils.statement_builder(
+            engine=engine,
+            metadata=sqla.MetaData(),
+            selection={"table_1": ["table_1_col_1"], "table_2": ["table_2_col_1"]},
+            joins=[],
+            alias={},
+            reflection="concurrent",
+        )
+        assert "table_2.table_2_col_1" in str(statement)
+
+    @pytest.mark.parametrize("mode", ["serial", "batch", "concurrent"])
+    def test_missing_table(self, pooled_db, cfg, mode):
+        """Test if every mode names the missing table in the KnownException."""
+        cfg["joins"][1] = {
+            "table_9": [["table_9", "table_9_col_1"], ["table_1", "table_1_col_1"]]
+        }
+        with pytest.raises(gdt.KnownException) as excinfo:
+            self.build(pooled_db, cfg, mode)
+        assert "Table [table_9] specified in config, does not exist in engine." in str(
+            excinfo.value
+        )
+
+    def test_missing_column(self, pooled_db, cfg):
+        """Test if batch reflection keeps the missing column message."""
+        cfg["selection"]["table_1"] = ["no_such_column"]
+        with pytest.raises(gdt.KnownException) as excinfo:
+            self.build(pooled_db, cfg, "batch")
+        assert "specified in config, does not exist in table" in str(excinfo.value)
+
+
+class TestStatementCache:
+    @pytest.fixture
+    def cfg_path(self, tmp_path) -> Path:
+        cfg_path = tmp_path / "cached_config.json"
+        with open(cfg_path, "w") as f:
+            json.dump(
+                {
+                    "statement_configs": {
+                        "selection": {"table_1": ["table_1_col_1"]},
+                        "joins": [],
+                        "aliases": {},
+                    }
+                },
+                f,
+            )
+        return cfg_path
+
+    def test_cached_statement_reused(self, mocked_db_valid, cfg_path):
+        """Test if loading the same config twice returns the same Select object."""
+        engine, metadata = mocked_db_valid
+        cache = gdt.utils.StatementCache()
+        first = gdt.load_statement(cfg_path, engine, metadata, use_cache=cache)
+        second = gdt.load_statement(cfg_path, engine, metadata, use_cache=cache)
+        assert first is second
+        assert len(cache) == 1
+
+    def test_file_change_invalidates(self, mocked_db_valid, cfg_path):
+        """Test if editing the config file builds a new statement."""
+        engine, metadata = mocked_db_valid
+        cache = gdt.utils.StatementCache()
+        first = gdt.load_statement(cfg_path, engine, metadata, use_cache=cache)
+
+        with open(cfg_path) as f:
+            config = json.load(f)
+        config["statement_configs"]["selection"]["table_1"].append("table_1_col_2")
+        with open(cfg_path, "w") as f:
+            json.dump(config, f, indent=2)
+
+        second = gdt.load_statement(cfg_path, engine, metadata, use_cache=cache)
+        assert first is not second
+        assert "table_1_col_2" in str(second)
+
+    def test_lru_bound(self, mocked_db_valid, cfg_path):
+        """Test if the least recently used statement is evicted beyond maxsize."""
+        engine, _ = mocked_db_valid
+        cache = gdt.utils.StatementCache(maxsize=1)
+        for columns in (["table_1_col_1"], ["table_1_col_2"]):
+            stmt_cfg = {"selection": {"table_1": columns}, "joins": [], "aliases": {}}
+            cache.put(cache.key(engine, stmt_cfg), sqla.select(sqla.literal(1)))
+        assert len(cache) == 1
+
+    def test_shared_cache(self, mocked_db_valid, cfg_path):
+        """Test if use_cache=True shares statements until the cache is cleared."""
+        engine, metadata = mocked_db_valid
+        gdt.utils.clear_statement_cache()
+        first = gdt.load_statement(cfg_path, engine, metadata, use_cache=True)
+        assert gdt.load_statement(cfg_path, engine, metadata, use_cache=True) is first
+        gdt.utils.clear_statement_cache()
+        assert gdt.load_statement(cfg_path, engine, metadata, use_cache=True) is not first
+
+
+class TestPushdown:
+    @pytest.fixture
+    def db(self) -> sqla.Engine:
+        engine = sqla.create_engine("sqlite+pysqlite:///:memory:")
+        gdt.insert(
+            engine,
+            "holes",
+            pd.DataFrame(
+                {
+                    "hole_id": [1, 2, 3, 4, 5],
+                    "project": ["A", "A", "B", "B", "C"],
+                    "depth": [10.0, 50.0, None, 150.0, 80.0],
+                }
+            ),
+        )
+        return engine
+
+    def build(self, engine, **kwargs):
+        return gdt.utils.statement_builder(
+            engine=engine,
+            metadata=sqla.MetaData(),
+            selection={"holes": ["hole_id", "project"]},
+            joins=[],
+            alias={"holes": "h"},
+            **kwargs,
+        )
+
+    def test_filters(self, db):
+        """Test if nested and/or conditions are applied as a WHERE clause."""
+        statement = self.build(
+            db,
+            filters={
+                "and": [
+                    {"column": ["holes", "project"], "op": "in", "value": ["A", "B"]},
+                    {
+                        "or": [
+                            {"column": ["holes", "depth"], "op": "between", "value": [0, 20]},
+                            {"column": ["holes", "depth"], "op": "is_null"},
+                        ]
+                    },
+                ]
+            },
+        )
+        df = gdt.select(db, statement)
+        assert df["hole_id"].tolist() == [1, 3]
+
+    def test_bound_parameters(self, db):
+        """Test if filter values are sent as bound parameters, not inlined in the SQL."""
+        statement = self.build(
+            db, filters=[{"column": ["holes", "project"], "op": "==", "value": "A"}]
+        )
+        compiled = statement.compile(db)
+        assert "'A'" not in str(compiled)
+        assert "A" in compiled.params.values()
+
+    def test_order_limit_distinct(self, db):
+        """Test if order_by, limit and distinct are applied on the server."""
+        statement = gdt.utils.statement_builder(
+            engine=db,
+            metadata=sqla.MetaData(),
+            selection={"holes": ["project"]},
+            joins=[],
+            alias={},
+            order_by=[["holes", "project", "desc"]],
+            limit=2,
+            distinct=True,
+        )
+        df = gdt.select(db, statement)
+        assert df["project"].tolist() == ["C", "B"]
+
+    def test_load_statement_sections(self, db, tmp_path):
+        """Test if the optional sections are read from the config file."""
+        cfg_path = tmp_path / "pushdown.json"
+        with open(cfg_path, "w") as f:
+            json.dump(
+                {
+                    "statement_configs": {
+                        "selection": {"holes": ["hole_id"]},
+                        "joins": [],
+                        "aliases": {},
+                        "filters": {"column": ["holes", "depth"], "op": ">", "value": 60},
+                        "order_by": [["holes", "hole_id", "desc"]],
+                        "limit": 1,
+                    }
+                },
+                f,
+            )
+        df = gdt.select(db, gdt.load_statement(cfg_path, db, sqla.MetaData()))
+        assert df["hole_id"].tolist() == [5]
+
+    @pytest.mark.parametrize(
+        "filters, message",
+        [
+            ({"column": ["holes", "project"], "op": "~", "value": 1}, "not supported"),
+            ({"column": ["holes", "nope"], "op": "==", "value": 1}, "does not exist in table"),
+            ({"column": ["other", "project"], "op": "==", "value": 1}, "not in the selection"),
+            ({"column": ["holes", "depth"], "op": "between", "value": 1}, "[low, high]"),
+            ({"and": [], "or": []}, "only one"),
+            ({"or": [], "column": ["holes", "depth"]}, "only one"),
+            ({"and": {"column": ["holes", "depth"], "op": "is_null"}}, "only one"),
+        ],
+    )
+    def test_bad_filters(self, db, filters, message):
+        """Test if malformed filters raise a KnownException."""
+        with pytest.raises(gdt.KnownException) as excinfo:
+            self.build(db, filters=filters)
+        assert message in str(excinfo.value)
+
+
+class TestJoinPlanner:
+    @pytest.fixture
+    def db(self) -> sqla.Engine:
+        engine = sqla.create_engine("sqlite+pysqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(sqla.text("CREATE TABLE holes (hole_id INTEGER PRIMARY KEY, project TEXT)"))
+            conn.execute(sqla.text("CREATE TABLE projects (project TEXT UNIQUE, owner TEXT)"))
+            conn.execute(sqla.text("CREATE TABLE samples (hole_id INTEGER, depth REAL)"))
+            conn.execute(sqla.text("INSERT INTO holes VALUES (1, 'A'), (2, 'B')"))
+            conn.execute(sqla.text("INSERT INTO projects VALUES ('A', 'x')"))
+            conn.execute(sqla.text("INSERT INTO samples VALUES (1, 1.0), (1, 2.0), (2, 3.0)"))
+        return engine
+
+    def build(self, engine, joins, selection=None):
+        return gdt.utils.statement_builder(
+            engine=engine,
+            metadata=sqla.MetaData(),
+            selection=selection or {"holes": ["hole_id"], "projects": ["owner"]},
+            joins=joins,
+            alias={},
+        )
+
+    def test_inner_join_first(self, db, caplog):
+        """Test if inner joins are applied before outer joins, after their dependencies."""
+        joins = [
+            {"samples": [["samples", "hole_id"], ["holes", "hole_id"]]},
+            {"projects": [["projects", "project"], ["holes", "project"]], "type": "inner"},
+        ]
+        selection = {"holes": ["hole_id"], "projects": ["owner"], "samples": ["depth"]}
+        statement = str(self.build(db, joins, selection))
+        assert statement.index("JOIN projects") < statement.index("LEFT OUTER JOIN samples")
+        assert "holes JOIN projects" in statement
+        df = gdt.select(db, self.build(db, joins, selection))
+        assert df["depth"].tolist() == [1.0, 2.0]
+
+    def test_fan_out_warning(self, db, caplog):
+        """Test if only joins not on a primary or unique key warn about fan out."""
+        self.build(db, [{"projects": [["projects", "project"], ["holes", "project"]]}])
+        assert "multiply the result size" not in caplog.text
+
+        self.build(
+            db,
+            [{"samples": [["samples", "hole_id"], ["holes", "hole_id"]]}],
+            {"holes": ["hole_id"], "samples": ["depth"]},
+        )
+        assert "Join of [samples] on ['hole_id']" in caplog.text
+
+    def test_duplicate_join(self, db, caplog):
+        """Test if a join repeated with a swapped condition is applied once."""
+        joins = [
+            {"projects": [["projects", "project"], ["holes", "project"]]},
+            {"projects": [["holes", "project"], ["projects", "project"]]},
+        ]
+        statement = str(self.build(db, joins))
+        assert statement.count("JOIN projects") == 1
+        assert "Duplicate join of [projects]" in caplog.text
+
+    def test_dependency_order(self, db):
+        """Test if a join listed before the table it depends on is moved after it."""
+        joins = [
+            {"projects": [["projects", "project"], ["samples", "depth"]]},
+            {"samples": [["samples", "hole_id"], ["holes", "hole_id"]]},
+        ]
+        selection = {"holes": ["hole_id"], "projects": ["owner"], "samples": ["depth"]}
+        statement = str(self.build(db, joins, selection))
+        assert statement.index("JOIN samples") < statement.index("JOIN projects")
+
+    @pytest.mark.parametrize(
+        "joins, message",
+        [
+            ([{"projects": [["holes", "project"], ["samples", "hole_id"]]}], "not connected"),
+            ([{"projects": [["projects", "owner"], ["samples", "hole_id"]]}], "not connected"),
+            ([{"projects": [["projects", "project"], ["holes", "project"]], "type": "cross"}], "type"),
+            ([{"holes": [["holes", "project"], ["projects", "project"]]}], "cannot also be joined"),
+            ([{"projects": [["projects", "nope"], ["holes", "project"]]}], "does not exist in table"),
+        ],
+    )
+    def test_bad_joins(self, db, joins, message):
+        """Test if disconnected or malformed joins raise a KnownException."""
+        with pytest.raises(gdt.KnownException) as excinfo:
+            self.build(db, joins)
+        assert message in str(excinfo.value)
+
+
+class TestParameters:
+    @pytest.fixture
+    def cfg_path(self, tmp_path) -> Path:
+        cfg_path = tmp_path / "params.json"
+        with open(cfg_path, "w") as f:
+            json.dump(
+                {
+                    "statement_configs": {
+                        "selection": {"holes": ["hole_id"]},
+                        "joins": [],
+                        "aliases": {},
+                        "parameters": {"projects": None, "max_depth": 100},
+                        "filters": [
+                            {
+                                "column": ["holes", "project"],
+                                "op": "in",
+                                "value": {"param": "projects"},
+                            },
+                            {
+                                "column": ["holes", "depth"],
+                                "op": "<",
+                                "value": {"param": "max_depth"},
+                            },
+                        ],
+                    }
+                },
+                f,
+            )
+        return cfg_path
+
+    @pytest.fixture
+    def db(self) -> sqla.Engine:
+        engine = sqla.create_engine("sqlite+pysqlite:///:memory:")
+        gdt.insert(
+            engine,
+            "holes",
+            pd.DataFrame(
+                {
+                    "hole_id": [1, 2, 3, 4],
+                    "project": ["A", "A", "B", "C"],
+                    "depth": [10.0, 500.0, 20.0, 30.0],
+                }
+            ),
+        )
+        return engine
+
+    def test_params_at_execution(self, db, cfg_path):
+        """Test if declared parameters are bound when the statement is executed."""
+        statement = gdt.load_statement(cfg_path, db, sqla.MetaData())
+
+        df = gdt.select(db, statement, params={"projects": ["A", "B"]})
+        assert df["hole_id"].tolist() == [1, 3]
+
+        df = gdt.select(db, statement, params={"projects": ["A"], "max_depth": 1000})
+        assert df["hole_id"].tolist() == [1, 2]
+
+    def test_required_param(self, db, cfg_path):
+        """Test if a parameter without a default must be given."""
+        statement = gdt.load_statement(cfg_path, db, sqla.MetaData())
+        with pytest.raises(sqla.exc.StatementError):
+            gdt.select(db, statement)
+
+    def test_undeclared_param(self, db):
+        """Test if referring to an undeclared parameter raises a KnownException."""
+        with pytest.raises(gdt.KnownException) as excinfo:
+            gdt.utils.statement_builder(
+                engine=db,
+                metadata=sqla.MetaData(),
+                selection={"holes": ["hole_id"]},
+                joins=[],
+                alias={},
+                filters={"column": ["holes", "project"], "op": "==", "value": {"param": "p"}},
+            )
+        assert "not declared" in str(excinfo.value)
+
+
+class TestMnemonics:
+    def test_labels_and_drop(self, mocked_db_valid, tmp_path):
+        """Test if mnemonics label columns in SQL and leave dropped columns out."""
+        engine, metadata = mocked_db_valid
+        cfg_path = tmp_path / "mnemonics.json"
+        with open(cfg_path, "w") as f:
+            json.dump(
+                {
+                    "statement_configs": {
+                        "selection": {
+                            "table_1": ["table_1_col_1", "table_1_col_2"],
+                            "table_2": ["table_2_col_1", "table_2_col_2"],
+                        },
+                        "joins": [
+                            {
+                                "table_2": [
+                                    ["table_2", "table_2_col_1"],
+                                    ["table_1", "table_1_col_1"],
+                                ]
+                            }
+                        ],
+                        "aliases": {},
+                        "mnemonics": {"table_1_col_1": "HOLE_ID"},
+                    }
+                },
+                f,
+            )
+
+        statement = gdt.load_statement(
+            cfg_path,
+            engine,
+            metadata,
+            mnemonics={"table_2.table_2_col_1": "drop", "table_2_col_2": "DEPTH"},
+        )
+        statement_str = str(statement)
+
+        assert "table_1.table_1_col_1 AS \"HOLE_ID\"" in statement_str
+        assert "table_2.table_2_col_2 AS \"DEPTH\"" in statement_str
+        assert "table_2.table_2_col_1 =" in statement_str
+        assert "table_2.table_2_col_1," not in statement_str
+        df = gdt.select(engine, statement)
+        assert list(df.columns) == ["HOLE_ID", "table_1_col_2", "DEPTH"]
+
+    def test_base_columns_dropped(self, mocked_db_valid):
+        """Test if the joins still start from the first table when its columns are dropped."""
+        engine, metadata = mocked_db_valid
+        statement = gdt.utils.statement_builder(
+            engine=engine,
+            metadata=metadata,
+            selection={"table_1": ["table_1_col_1"], "table_2": ["table_2_col_2"]},
+            joins=[{"table_2": [["table_2", "table_2_col_1"], ["table_1", "table_1_col_1"]]}],
+            alias={},
+            mnemonics={"table_1_col_1": "drop"},
+        )
+        assert "FROM table_1 LEFT OUTER JOIN table_2" in str(statement)
+        assert gdt.select(engine, statement).columns.tolist() == ["table_2_col_2"]
+
+    def test_select_drop(self, mocked_db_valid):
+        """Test if select also drops columns mapped to "drop" after fetching."""
+        engine, _ = mocked_db_valid
+        statement = sqla.text("SELECT * FROM table_1")
+        df = gdt.select(
+            engine, statement, mnemonics={"table_1_col_1": "drop", "table_1_col_2": "B"}
+        )
+        assert list(df.columns) == ["B"]